@@ -0,0 +1,220 @@
+import time
+from typing import List, Optional, Tuple
+
+from boardState import BoardState
+from evaluation import WIN_SCORE, IncrementalEvaluator, goal_distances, is_winning_move
+from moveGenerator import generate_moves
+from transpositionTable import EXACT, LOWER_BOUND, UPPER_BOUND, TranspositionTable
+
+Move = Tuple[int, int]
+
+# Default wall clock budget of a single computer move, in seconds
+DEFAULT_TIME_BUDGET = 0.2
+
+
+class SearchTimeout(Exception):
+    """
+    Raised inside the search when the time budget of the move is used up.
+    """
+
+
+class AlphaBetaSearch:
+    """
+    Alpha-beta search with iterative deepening, move ordering and a hard time budget per move.
+
+    With more than two players the search is paranoid: every other player is assumed to play against the
+    searching player. Positions are cached in a transposition table keyed by the board's Zobrist key.
+    """
+
+    def __init__(self, time_budget: float = DEFAULT_TIME_BUDGET, max_depth: int = 8,
+                 table: Optional[TranspositionTable] = None) -> None:
+        """
+        Initializes an AlphaBetaSearch object.
+
+        Args:
+            time_budget (float): Wall clock seconds a move may take.
+            max_depth (int): The deepest iteration of the iterative deepening, in plies.
+            table (Optional[TranspositionTable]): The transposition table to use, a new one if not given.
+        """
+        self.time_budget = time_budget
+        self.max_depth = max_depth
+        self.table = table if table is not None else TranspositionTable()
+        self.nodes = 0
+        self.completed_depth = 0
+        self.__deadline = 0.0
+        self.__root_player = 0
+        self.__evaluator = None
+
+    def choose_move(self, state: BoardState, player_index: int) -> Optional[Move]:
+        """
+        Find the best move of a player within the time budget.
+
+        Args:
+            state (BoardState): The board state; it is left unchanged.
+            player_index (int): The index of the player to move.
+
+        Returns:
+            Optional[Move]: The (from, to) cell ids of the best move found, or None if the player cannot move.
+        """
+        self.__deadline = time.perf_counter() + self.time_budget
+        self.__root_player = player_index
+        self.nodes = 0
+        self.completed_depth = 0
+        self.table.new_search()
+        self.__evaluator = IncrementalEvaluator(state)
+
+        moves = self.__ordered_moves(state, player_index, None)
+        if not moves:
+            return None
+        best_move = moves[0]
+        for depth in range(1, self.max_depth + 1):
+            iteration_best = None
+            try:
+                iteration_best, score = self.__search_root(state, moves, depth)
+            except SearchTimeout as timeout:
+                # Moves are searched best first, so a move that beat the previous best is still an improvement
+                iteration_best = timeout.args[0] if timeout.args else None
+                if iteration_best is not None:
+                    best_move = iteration_best
+                break
+            best_move = iteration_best
+            self.completed_depth = depth
+            if score >= WIN_SCORE - depth:
+                break
+            # Search the best move first in the next iteration
+            moves.remove(best_move)
+            moves.insert(0, best_move)
+        return best_move
+
+    def __search_root(self, state: BoardState, moves: List[Move], depth: int) -> Tuple[Move, float]:
+        """
+        Search all the moves of the root position to a given depth.
+
+        Args:
+            state (BoardState): The board state.
+            moves (List[Move]): The moves of the root player, best first.
+            depth (int): The depth to search to, in plies.
+
+        Returns:
+            Tuple[Move, float]: The best move and its score.
+        """
+        alpha = -float("inf")
+        beta = float("inf")
+        best_move = None
+        next_player = (self.__root_player + 1) % state.get_num_players()
+        for source, destination in moves:
+            state.move_cells(source, destination)
+            self.__evaluator.move(source, destination, self.__root_player)
+            try:
+                if is_winning_move(state, destination, self.__root_player):
+                    score = WIN_SCORE - 1
+                else:
+                    score = self.__search(state, depth - 1, alpha, beta, next_player, 1)
+            except SearchTimeout:
+                raise SearchTimeout(best_move)
+            finally:
+                state.move_cells(destination, source)
+                self.__evaluator.move(destination, source, self.__root_player)
+            if score > alpha:
+                alpha = score
+                best_move = (source, destination)
+        self.table.store(state.key ^ state.get_zobrist_keys().turn_keys[self.__root_player], depth, alpha, EXACT,
+                         best_move)
+        return best_move, alpha
+
+    def __search(self, state: BoardState, depth: int, alpha: float, beta: float, player_index: int,
+                 ply: int) -> float:
+        """
+        Alpha-beta search of a position, scored from the point of view of the root player.
+
+        Args:
+            state (BoardState): The board state.
+            depth (int): The remaining depth, in plies.
+            alpha (float): The score the root player is already sure of.
+            beta (float): The score the other players can already hold the root player to.
+            player_index (int): The index of the player to move.
+            ply (int): The distance from the root, in plies.
+
+        Returns:
+            float: The score of the position.
+        """
+        self.nodes += 1
+        if time.perf_counter() > self.__deadline:
+            raise SearchTimeout()
+        if depth == 0:
+            return self.__evaluator.evaluate(self.__root_player)
+
+        key = state.key ^ state.get_zobrist_keys().turn_keys[player_index]
+        entry = self.table.probe(key)
+        table_move = None
+        if entry is not None:
+            table_move = entry.best_move
+            if entry.depth >= depth:
+                if entry.flag == EXACT:
+                    return entry.score
+                if entry.flag == LOWER_BOUND:
+                    alpha = max(alpha, entry.score)
+                elif entry.flag == UPPER_BOUND:
+                    beta = min(beta, entry.score)
+                if alpha >= beta:
+                    return entry.score
+
+        moves = self.__ordered_moves(state, player_index, table_move)
+        if not moves:
+            # A player that cannot move passes the turn
+            return self.__search(state, depth - 1, alpha, beta, (player_index + 1) % state.get_num_players(),
+                                 ply + 1)
+
+        maximizing = player_index == self.__root_player
+        original_alpha, original_beta = alpha, beta
+        best_score = -float("inf") if maximizing else float("inf")
+        best_move = None
+        next_player = (player_index + 1) % state.get_num_players()
+        for source, destination in moves:
+            state.move_cells(source, destination)
+            self.__evaluator.move(source, destination, player_index)
+            try:
+                if is_winning_move(state, destination, player_index):
+                    score = WIN_SCORE - ply - 1 if maximizing else -WIN_SCORE + ply + 1
+                else:
+                    score = self.__search(state, depth - 1, alpha, beta, next_player, ply + 1)
+            finally:
+                state.move_cells(destination, source)
+                self.__evaluator.move(destination, source, player_index)
+            if maximizing and score > best_score:
+                best_score, best_move = score, (source, destination)
+                alpha = max(alpha, score)
+            elif not maximizing and score < best_score:
+                best_score, best_move = score, (source, destination)
+                beta = min(beta, score)
+            if alpha >= beta:
+                break
+
+        if best_score <= original_alpha:
+            flag = UPPER_BOUND
+        elif best_score >= original_beta:
+            flag = LOWER_BOUND
+        else:
+            flag = EXACT
+        self.table.store(key, depth, best_score, flag, best_move)
+        return best_score
+
+    def __ordered_moves(self, state: BoardState, player_index: int, first_move: Optional[Move]) -> List[Move]:
+        """
+        Get the moves of a player, the ones that get closest to the player's goal first.
+
+        Args:
+            state (BoardState): The board state.
+            player_index (int): The index of the player to move.
+            first_move (Optional[Move]): A move to put first, usually the best move from the transposition table.
+
+        Returns:
+            List[Move]: The ordered moves.
+        """
+        distances = goal_distances(state.get_num_players(), player_index)
+        moves = sorted(generate_moves(state, player_index),
+                       key=lambda move: distances[move[1]] - distances[move[0]])
+        if first_move is not None and first_move in moves:
+            moves.remove(first_move)
+            moves.insert(0, first_move)
+        return moves
@@ -0,0 +1,50 @@
+import time
+import unittest
+from alphaBeta import AlphaBetaSearch
+from boardState import BoardState
+from evaluation import evaluate, is_winning_move
+
+
+class TestAlphaBetaSearch(unittest.TestCase):
+    def setUp(self):
+        self.state = BoardState(2)
+
+    def test_returns_a_legal_move(self):
+        search = AlphaBetaSearch(time_budget=0.2)
+        source, destination = search.choose_move(self.state, 1)
+        row, col = self.state.get_cells()[source]
+        self.assertIn(self.state.get_cells()[destination], self.state.possible_moves(row, col))
+        self.assertGreaterEqual(search.completed_depth, 1)
+
+    def test_state_is_left_unchanged(self):
+        owners = bytes(self.state.owners)
+        key = self.state.key
+        AlphaBetaSearch(time_budget=0.1).choose_move(self.state, 0)
+        self.assertEqual(bytes(self.state.owners), owners)
+        self.assertEqual(self.state.key, key)
+
+    def test_respects_the_time_budget(self):
+        search = AlphaBetaSearch(time_budget=0.1, max_depth=20)
+        start = time.perf_counter()
+        search.choose_move(self.state, 1)
+        self.assertLess(time.perf_counter() - start, 0.5)
+
+    def test_takes_a_winning_move(self):
+        # A yellow piece right next to an empty cell of blue's home
+        self.state.move((3, 13), (5, 13))
+        self.state.move((13, 9), (4, 14))
+        source, destination = AlphaBetaSearch(time_budget=0.2).choose_move(self.state, 1)
+        self.assertTrue(is_winning_move(self.state, destination, 1))
+
+    def test_no_move_when_stuck(self):
+        for cell, owner in enumerate(self.state.owners):
+            if owner == 0:
+                self.state.owners[cell] = 2
+        self.assertIsNone(AlphaBetaSearch(time_budget=0.1).choose_move(self.state, 0))
+
+    def test_evaluation_is_symmetric_at_the_start(self):
+        self.assertEqual(evaluate(self.state, 0), evaluate(self.state, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+from typing import List, Sequence
+
+from boardState import BoardState
+from evaluation import CLOSEST_PIECE_WEIGHT, goal_distances
+
+# NumPy is optional: without it the batches are scored one position at a time in pure Python
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+HAS_NUMPY = numpy is not None
+
+
+def stack_positions(states: Sequence[BoardState]):
+    """
+    Stack the occupancy of several positions into a single (N, cells) array.
+
+    Args:
+        states (Sequence[BoardState]): Board states with the same layout.
+
+    Returns:
+        A NumPy uint8 array of shape (N, cells) when NumPy is installed, otherwise a list of bytes objects.
+    """
+    if HAS_NUMPY:
+        if not states:
+            return numpy.empty((0, 0), dtype=numpy.uint8)
+        return numpy.array([numpy.frombuffer(bytes(state.owners), dtype=numpy.uint8) for state in states])
+    return [bytes(state.owners) for state in states]
+
+
+def evaluate_batch(occupancy, num_of_players: int, player_index: int, use_numpy: bool = HAS_NUMPY) -> List[float]:
+    """
+    Score many positions at once from the point of view of a player; higher is better.
+
+    Every score is the same value evaluation.evaluate() gives for the position. With NumPy the goal distance
+    tables are used as weight vectors and the whole batch is scored in one vectorized pass.
+
+    Args:
+        occupancy: An (N, cells) array of cell owners, as returned by stack_positions, or any sequence of
+            N rows of cell owners.
+        num_of_players (int): The number of players in the game.
+        player_index (int): The index of the player the scores are for.
+        use_numpy (bool): Whether to use the NumPy backend; it is only available when NumPy is installed.
+
+    Returns:
+        List[float]: The score of every position, in the order of the rows.
+    """
+    if use_numpy and not HAS_NUMPY:
+        raise ValueError("The NumPy backend was requested but NumPy is not installed")
+    if use_numpy:
+        return _evaluate_batch_numpy(occupancy, num_of_players, player_index)
+    return [_evaluate_row(row, num_of_players, player_index) for row in occupancy]
+
+
+def _evaluate_batch_numpy(occupancy, num_of_players: int, player_index: int) -> List[float]:
+    """
+    Score a batch of positions with NumPy.
+
+    Args:
+        occupancy: An (N, cells) array of cell owners, or any sequence of N rows of cell owners.
+        num_of_players (int): The number of players in the game.
+        player_index (int): The index of the player the scores are for.
+
+    Returns:
+        List[float]: The score of every position.
+    """
+    if not isinstance(occupancy, numpy.ndarray):
+        # Rows of bytes, as stack_positions returns without NumPy, must be read as bytes and not parsed as numbers;
+        # any other row, e.g. a list or an array of another dtype, holds the owners as numbers
+        rows = [numpy.frombuffer(row, dtype=numpy.uint8) if isinstance(row, (bytes, bytearray, memoryview))
+                else numpy.asarray(row, dtype=numpy.uint8) for row in occupancy]
+        if not rows:
+            return []
+        occupancy = numpy.stack(rows)
+    occupancy = numpy.asarray(occupancy, dtype=numpy.uint8)
+    if occupancy.size == 0:
+        return []
+    progress = []
+    for player in range(num_of_players):
+        distances = numpy.asarray(goal_distances(num_of_players, player), dtype=numpy.int64)
+        pieces = occupancy == player + 1
+        sums = pieces @ distances
+        closest = numpy.where(pieces, distances, numpy.iinfo(numpy.int64).max).min(axis=1)
+        closest = numpy.where(pieces.any(axis=1), closest, 0)
+        progress.append(sums + CLOSEST_PIECE_WEIGHT * closest)
+    others = sum(progress[other] for other in range(num_of_players) if other != player_index)
+    scores = others / (num_of_players - 1) - progress[player_index]
+    return scores.astype(float).tolist()
+
+
+def _evaluate_row(row: Sequence[int], num_of_players: int, player_index: int) -> float:
+    """
+    Score a single position in pure Python.
+
+    Args:
+        row (Sequence[int]): The owner of every cell.
+        num_of_players (int): The number of players in the game.
+        player_index (int): The index of the player the score is for.
+
+    Returns:
+        float: The score of the position.
+    """
+    tables = [goal_distances(num_of_players, player) for player in range(num_of_players)]
+    sums = [0] * num_of_players
+    closest = [None] * num_of_players
+    for cell, owner in enumerate(row):
+        if owner:
+            distance = tables[owner - 1][cell]
+            sums[owner - 1] += distance
+            if closest[owner - 1] is None or distance < closest[owner - 1]:
+                closest[owner - 1] = distance
+    progress = [sums[player] + CLOSEST_PIECE_WEIGHT * (closest[player] or 0) for player in range(num_of_players)]
+    others = [progress[other] for other in range(num_of_players) if other != player_index]
+    return sum(others) / len(others) - progress[player_index]
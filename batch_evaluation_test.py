@@ -0,0 +1,61 @@
+import random
+import unittest
+from batchEvaluation import HAS_NUMPY, evaluate_batch, stack_positions
+from boardState import BoardState
+from evaluation import evaluate
+from moveGenerator import generate_moves
+
+
+class TestBatchEvaluation(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(5)
+        self.states = []
+        state = BoardState(3)
+        for turn in range(30):
+            source, destination = rng.choice(list(generate_moves(state, turn % 3)))
+            state.move_cells(source, destination)
+            self.states.append(state.copy())
+
+    def test_pure_python_matches_evaluate(self):
+        occupancy = [bytes(state.owners) for state in self.states]
+        scores = evaluate_batch(occupancy, 3, 1, use_numpy=False)
+        self.assertEqual(scores, [evaluate(state, 1) for state in self.states])
+
+    @unittest.skipUnless(HAS_NUMPY, "NumPy is not installed")
+    def test_numpy_matches_evaluate(self):
+        scores = evaluate_batch(stack_positions(self.states), 3, 2, use_numpy=True)
+        for score, state in zip(scores, self.states):
+            self.assertAlmostEqual(score, evaluate(state, 2))
+
+    @unittest.skipUnless(HAS_NUMPY, "NumPy is not installed")
+    def test_numpy_accepts_rows_of_bytes(self):
+        occupancy = [bytes(state.owners) for state in self.states]
+        scores = evaluate_batch(occupancy, 3, 2, use_numpy=True)
+        for score, state in zip(scores, self.states):
+            self.assertAlmostEqual(score, evaluate(state, 2))
+        self.assertEqual(evaluate_batch([], 3, 2, use_numpy=True), [])
+
+    @unittest.skipUnless(HAS_NUMPY, "NumPy is not installed")
+    def test_numpy_accepts_rows_of_numbers(self):
+        import numpy
+        occupancy = [numpy.array(list(state.owners), dtype=numpy.int64) for state in self.states[:3]]
+        occupancy.append(list(self.states[3].owners))
+        self.assertEqual(evaluate_batch(occupancy, 3, 1, use_numpy=True),
+                         evaluate_batch(occupancy, 3, 1, use_numpy=False))
+
+    def test_empty_batch(self):
+        self.assertEqual(evaluate_batch(stack_positions([]), 3, 0), [])
+        self.assertEqual(evaluate_batch([], 3, 0, use_numpy=False), [])
+
+    def test_default_backend(self):
+        scores = evaluate_batch(stack_positions(self.states), 3, 0)
+        self.assertEqual(len(scores), len(self.states))
+
+    @unittest.skipIf(HAS_NUMPY, "NumPy is installed")
+    def test_numpy_backend_without_numpy(self):
+        with self.assertRaises(ValueError):
+            evaluate_batch(stack_positions(self.states), 3, 0, use_numpy=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,338 @@
+"""
+Benchmarks of the game engine.
+
+Measures, on fixed seeded positions (an opening, a crowded six player mid-game and a two player endgame), the
+throughput of the move generation behind calculate_possible_moves, the latency of the computer's move at every
+level, the time to build a board, the cost of the winner check and the speed of replaying a game, from a text game
+log and from a replay file. The results are printed as JSON and can be compared with a saved baseline to flag
+regressions.
+
+Usage:
+    python benchmarks.py --output baseline.json
+    python benchmarks.py --baseline baseline.json --tolerance 0.2
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from boardState import BoardState
+from computerPlayer import LEVELS, ComputerPlayer
+from evaluation import goal_distances, is_winning_move
+from gameLog import LOG_HEADER, format_move_line, read_game_log
+from moveGenerator import generate_moves
+from replayFormat import ReplayReader, convert_text_log
+
+# Seed of the benchmark positions and of the computer players
+BENCHMARK_SEED = 2024
+
+# Minimal wall clock seconds of every throughput measurement
+DEFAULT_MIN_TIME = 0.2
+
+# Relative slowdown of a metric, compared with the baseline, that counts as a regression
+DEFAULT_TOLERANCE = 0.2
+
+# Metric name suffixes where a higher value is better; for all the others lower is better
+HIGHER_IS_BETTER = ("ops_per_sec", "moves_per_sec")
+
+
+def advance(state: BoardState, plies: int, rng: random.Random, player_index: int = 0) -> int:
+    """
+    Play random forward moves that stay at least two steps away from the goal, to reach a position deeper in
+    the game that is not decided yet.
+
+    Args:
+        state (BoardState): The board state; it is changed by the moves.
+        plies (int): The number of turns to play.
+        rng (random.Random): The random number generator of the moves.
+        player_index (int): The index of the player to move first.
+
+    Returns:
+        int: The index of the player to move after the last turn.
+    """
+    num_of_players = state.get_num_players()
+    for _ in range(plies):
+        distances = goal_distances(num_of_players, player_index)
+        moves = [(source, destination) for source, destination in generate_moves(state, player_index)
+                 if distances[source] > distances[destination] >= 2]
+        if moves:
+            state.move_cells(*rng.choice(moves))
+        player_index = (player_index + 1) % num_of_players
+    return player_index
+
+
+def has_winning_move(state: BoardState, player_index: int) -> bool:
+    """
+    Check if a player can win the game with a single move.
+
+    Args:
+        state (BoardState): The board state.
+        player_index (int): The index of the player.
+
+    Returns:
+        bool: True if one of the player's moves enters the home of another player.
+    """
+    return any(is_winning_move(state, destination, player_index)
+               for _, destination in generate_moves(state, player_index))
+
+
+def benchmark_positions(seed: int = BENCHMARK_SEED) -> Dict[str, Tuple[BoardState, int]]:
+    """
+    Build the positions the benchmarks run on.
+
+    The player to move never has a winning move, so the computer levels have to search every position.
+
+    Args:
+        seed (int): The seed of the moves leading to the positions.
+
+    Returns:
+        Dict[str, Tuple[BoardState, int]]: The board state of every position and the index of the player to move.
+    """
+    rng = random.Random(seed)
+    positions = {"opening": (BoardState(2), 0)}
+    for name, num_of_players, plies in (("midgame", 6, 36), ("endgame", 2, 120)):
+        state = BoardState(num_of_players)
+        player_index = advance(state, plies, rng)
+        while has_winning_move(state, player_index):
+            player_index = advance(state, 1, rng, player_index)
+        positions[name] = (state, player_index)
+    return positions
+
+
+def calls_per_second(function: Callable[[], object], min_time: float) -> float:
+    """
+    Measure how many times per second a function can be called.
+
+    Args:
+        function (Callable[[], object]): The function to call.
+        min_time (float): The minimal wall clock seconds to measure for.
+
+    Returns:
+        float: The number of calls per second.
+    """
+    calls = 0
+    batch = 1
+    start = time.perf_counter()
+    while True:
+        for _ in range(batch):
+            function()
+        calls += batch
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return calls / elapsed
+        batch *= 2
+
+
+def bench_possible_moves(state: BoardState, min_time: float) -> float:
+    """
+    Measure the move generation of calculate_possible_moves.
+
+    Args:
+        state (BoardState): The position.
+        min_time (float): The minimal wall clock seconds to measure for.
+
+    Returns:
+        float: The number of pieces whose moves are generated per second.
+    """
+    pieces = [coord for player in range(state.get_num_players()) for coord in state.get_player_locations(player)]
+
+    def all_pieces():
+        for row, col in pieces:
+            state.possible_moves(row, col)
+
+    return calls_per_second(all_pieces, min_time) * len(pieces)
+
+
+def bench_computer_move(state: BoardState, player_index: int, level: int, repeats: int) -> float:
+    """
+    Measure the latency of a computer move.
+
+    Args:
+        state (BoardState): The position.
+        player_index (int): The index of the player to move.
+        level (int): The level of the computer.
+        repeats (int): The number of moves to average over.
+
+    Returns:
+        float: The mean milliseconds of a move.
+    """
+    computer = ComputerPlayer(level, seed=BENCHMARK_SEED)
+    try:
+        start = time.perf_counter()
+        for _ in range(repeats):
+            computer.choose_move(state, player_index)
+        return (time.perf_counter() - start) / repeats * 1000
+    finally:
+        computer.close()
+
+
+def write_benchmark_log(file_name: str, moves: int, seed: int = BENCHMARK_SEED) -> None:
+    """
+    Write the game log of a seeded six player game, in the format of Game.log_move.
+
+    Args:
+        file_name (str): The path of the log.
+        moves (int): The number of moves to log.
+        seed (int): The seed of the moves.
+    """
+    rng = random.Random(seed)
+    state = BoardState(6)
+    cells = state.get_cells()
+    timestamp = datetime(2024, 1, 1).strftime("%Y-%m-%d %H:%M:%S")
+    with open(file_name, "w") as log_file:
+        log_file.write(f"{LOG_HEADER}\n6\n")
+        player_index = 0
+        written = 0
+        while written < moves:
+            move_list = [move for move in generate_moves(state, player_index)
+                         if not is_winning_move(state, move[1], player_index)]
+            if move_list:
+                source, destination = rng.choice(move_list)
+                state.move_cells(source, destination)
+                log_file.write(format_move_line(f"Player {player_index + 1}", state.color_at(*cells[destination]),
+                                                cells[source], cells[destination], timestamp))
+                written += 1
+            player_index = (player_index + 1) % 6
+
+
+def bench_replay(moves: int, min_time: float) -> Dict[str, float]:
+    """
+    Measure how fast a game is read and replayed onto a board, from a text game log and from a replay file.
+
+    Args:
+        moves (int): The number of moves of the game.
+        min_time (float): The minimal wall clock seconds to measure for.
+
+    Returns:
+        Dict[str, float]: The number of replayed moves per second of each format, by metric name.
+    """
+    handle, log_file_name = tempfile.mkstemp(suffix=".txt")
+    os.close(handle)
+    replay_file_name = log_file_name[:-len(".txt")] + ".ccr"
+    try:
+        write_benchmark_log(log_file_name, moves)
+        convert_text_log(log_file_name, replay_file_name)
+
+        def replay_text_log():
+            num_of_players, logged_moves = read_game_log(log_file_name)
+            state = BoardState(num_of_players)
+            for move in logged_moves:
+                state.move(move.source, move.destination)
+
+        def replay_file():
+            with ReplayReader(replay_file_name) as reader:
+                state = BoardState(reader.header.num_of_players)
+                for source, destination in reader:
+                    state.move_cells(source, destination)
+
+        return {"replay/moves_per_sec": calls_per_second(replay_text_log, min_time) * moves,
+                "replay/binary/moves_per_sec": calls_per_second(replay_file, min_time) * moves}
+    finally:
+        os.remove(log_file_name)
+        if os.path.exists(replay_file_name):
+            os.remove(replay_file_name)
+
+
+def run_benchmarks(levels: Sequence[int] = LEVELS, min_time: float = DEFAULT_MIN_TIME, ai_repeats: int = 3,
+                   replay_moves: int = 500) -> Dict[str, float]:
+    """
+    Run all the benchmarks.
+
+    Args:
+        levels (Sequence[int]): The computer levels to measure the move latency of.
+        min_time (float): The minimal wall clock seconds of every throughput measurement.
+        ai_repeats (int): The number of computer moves to average the latency over.
+        replay_moves (int): The number of moves of the replayed game log.
+
+    Returns:
+        Dict[str, float]: The value of every metric, by name. Names end with the unit: ops_per_sec and
+        moves_per_sec are better when higher, ms and us when lower.
+    """
+    metrics = {}
+    positions = benchmark_positions()
+    for name, (state, _) in positions.items():
+        metrics[f"possible_moves/{name}/ops_per_sec"] = bench_possible_moves(state, min_time)
+    for level in levels:
+        for name, (state, player_index) in positions.items():
+            metrics[f"computer_move/level_{level}/{name}/ms"] = bench_computer_move(state, player_index, level,
+                                                                                      ai_repeats)
+    for num_of_players in range(2, 7):
+        metrics[f"board_build/{num_of_players}_players/ms"] = \
+            1000 / calls_per_second(lambda: BoardState(num_of_players), min_time)
+    for name, (state, _) in positions.items():
+        metrics[f"is_winner/{name}/us"] = 1000000 / calls_per_second(state.is_winner, min_time)
+    metrics.update(bench_replay(replay_moves, min_time))
+    return metrics
+
+
+def compare(metrics: Dict[str, float], baseline: Dict[str, float],
+            tolerance: float = DEFAULT_TOLERANCE) -> List[Dict]:
+    """
+    Compare benchmark results with a baseline.
+
+    Args:
+        metrics (Dict[str, float]): The current value of every metric.
+        baseline (Dict[str, float]): The baseline value of every metric.
+        tolerance (float): The relative slowdown that counts as a regression, e.g. 0.2 for 20%.
+
+    Returns:
+        List[Dict]: The metrics in both results with their baseline value, current value, relative change (positive
+        is an improvement) and whether it is a regression.
+    """
+    comparison = []
+    for name in sorted(metrics.keys() & baseline.keys()):
+        old, new = baseline[name], metrics[name]
+        if not old:
+            continue
+        change = (new - old) / old
+        if not name.endswith(HIGHER_IS_BETTER):
+            change = -change
+        comparison.append({"metric": name, "baseline": old, "current": new, "change": change,
+                           "regression": change < -tolerance})
+    return comparison
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Run the benchmarks from the command line and print the results as JSON.
+
+    Args:
+        argv (Optional[Sequence[str]]): The command line arguments, sys.argv if not given.
+
+    Returns:
+        int: The exit status, 1 if a regression was found compared with the baseline, otherwise 0.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the game engine.")
+    parser.add_argument("--levels", type=int, nargs="*", default=LEVELS, choices=LEVELS,
+                        help="computer levels to measure the move latency of")
+    parser.add_argument("--min-time", type=float, default=DEFAULT_MIN_TIME,
+                        help="minimal seconds of every throughput measurement")
+    parser.add_argument("--ai-repeats", type=int, default=3, help="computer moves to average the latency over")
+    parser.add_argument("--output", help="file to save the results to, for use as a baseline")
+    parser.add_argument("--baseline", help="results of an earlier run to compare with")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="relative slowdown that counts as a regression")
+    args = parser.parse_args(argv)
+
+    metrics = run_benchmarks(args.levels, args.min_time, args.ai_repeats)
+    report = {"metrics": metrics}
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+        report["comparison"] = compare(metrics, baseline.get("metrics", baseline), args.tolerance)
+        report["regressions"] = [entry["metric"] for entry in report["comparison"] if entry["regression"]]
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump({"metrics": metrics}, output_file, indent=2)
+    print(json.dumps(report, indent=2))
+    return 1 if report.get("regressions") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
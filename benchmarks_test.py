@@ -0,0 +1,32 @@
+import unittest
+from benchmarks import benchmark_positions, compare, has_winning_move, run_benchmarks
+
+
+class TestBenchmarks(unittest.TestCase):
+    def test_positions_are_reproducible(self):
+        first = {name: bytes(state.owners) for name, (state, _) in benchmark_positions().items()}
+        second = {name: bytes(state.owners) for name, (state, _) in benchmark_positions().items()}
+        self.assertEqual(first, second)
+
+    def test_positions_are_not_decided(self):
+        for state, player_index in benchmark_positions().values():
+            self.assertFalse(state.is_winner())
+            self.assertFalse(has_winning_move(state, player_index))
+
+    def test_run_benchmarks(self):
+        metrics = run_benchmarks(levels=[1, 2], min_time=0.001, ai_repeats=1, replay_moves=20)
+        self.assertIn("possible_moves/midgame/ops_per_sec", metrics)
+        self.assertIn("computer_move/level_2/endgame/ms", metrics)
+        self.assertIn("board_build/6_players/ms", metrics)
+        self.assertIn("is_winner/opening/us", metrics)
+        self.assertGreater(metrics["replay/moves_per_sec"], 0)
+
+    def test_compare_flags_regressions(self):
+        baseline = {"replay/moves_per_sec": 1000.0, "is_winner/opening/us": 1.0, "board_build/2_players/ms": 1.0}
+        metrics = {"replay/moves_per_sec": 700.0, "is_winner/opening/us": 0.5, "board_build/2_players/ms": 1.1}
+        regressions = [entry["metric"] for entry in compare(metrics, baseline, tolerance=0.2) if entry["regression"]]
+        self.assertEqual(regressions, ["replay/moves_per_sec"])
+
+
+if __name__ == '__main__':
+    unittest.main()
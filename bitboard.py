@@ -0,0 +1,200 @@
+from typing import Dict, List, Tuple
+
+from boardLayout import NUM_COLUMNS, build_cells
+from boardState import BoardState, EMPTY
+from boardTopology import DIRECTIONS
+
+Coordinates = Tuple[int, int]
+
+# Bits per board row; the extra padding column keeps diagonal shifts from wrapping onto the next row
+ROW_STRIDE = NUM_COLUMNS + 1
+
+# Bit shift of every direction, in the order of DIRECTIONS
+SHIFTS = [d_row * ROW_STRIDE + d_col for d_row, d_col in DIRECTIONS]
+
+
+def coord_to_bit(coord: Coordinates) -> int:
+    """
+    Get the bit index of a board coordinate.
+
+    Args:
+        coord (Coordinates): The coordinate on the board.
+
+    Returns:
+        int: The index of the bit representing the coordinate.
+    """
+    return coord[0] * ROW_STRIDE + coord[1]
+
+
+def bit_to_coord(bit: int) -> Coordinates:
+    """
+    Get the board coordinate of a bit index.
+
+    Args:
+        bit (int): The index of the bit.
+
+    Returns:
+        Coordinates: The coordinate represented by the bit.
+    """
+    return divmod(bit, ROW_STRIDE)
+
+
+def iterate_bits(mask: int):
+    """
+    Iterate over the indices of the set bits of a mask, lowest first.
+
+    Args:
+        mask (int): The bitmask.
+
+    Yields:
+        int: The index of each set bit.
+    """
+    while mask:
+        lowest = mask & -mask
+        yield lowest.bit_length() - 1
+        mask ^= lowest
+
+
+def shift(mask: int, direction: int) -> int:
+    """
+    Move every bit of a mask one cell in a direction.
+
+    Args:
+        mask (int): The bitmask to shift.
+        direction (int): The index of the direction in DIRECTIONS.
+
+    Returns:
+        int: The shifted bitmask.
+    """
+    amount = SHIFTS[direction]
+    if amount > 0:
+        return mask << amount
+    return mask >> -amount
+
+
+class BitboardMoveGenerator:
+    """
+    Move generator that keeps the occupancy of every player in a single Python int.
+
+    Bit coord_to_bit(cell) of a player's mask is set when that player has a piece on the cell, and the empty
+    mask has a bit set for every free cell, so whole sides are moved around with shifts and masks.
+    """
+
+    def __init__(self, num_of_players: int) -> None:
+        """
+        Initializes a BitboardMoveGenerator object with every player's pieces in their home triangle.
+
+        Args:
+            num_of_players (int): The number of players in the game.
+        """
+        cells, starting_owners = build_cells(num_of_players)
+        self.board_mask = 0
+        for coord in cells:
+            self.board_mask |= 1 << coord_to_bit(coord)
+
+        # Cells that have a neighbour on the board in each direction: the board shifted back the opposite way
+        self.direction_masks = [self.board_mask & shift(self.board_mask, opposite)
+                                for opposite in (3, 2, 1, 0)]
+
+        self.pieces = [0] * num_of_players
+        for coord, owner in zip(cells, starting_owners):
+            if owner >= 0:
+                self.pieces[owner] |= 1 << coord_to_bit(coord)
+        self.empty = self.board_mask ^ self.__occupied()
+
+    def __occupied(self) -> int:
+        """
+        Get the mask of all the occupied cells.
+
+        Returns:
+            int: The bitmask of the cells with a piece on them.
+        """
+        occupied = 0
+        for mask in self.pieces:
+            occupied |= mask
+        return occupied
+
+    def load(self, state: BoardState) -> None:
+        """
+        Copy the occupancy of a board state into the bitmasks.
+
+        Args:
+            state (BoardState): The board state to load.
+        """
+        self.pieces = [0] * state.get_num_players()
+        self.empty = 0
+        for coord, owner in zip(state.get_cells(), state.owners):
+            if owner == EMPTY:
+                self.empty |= 1 << coord_to_bit(coord)
+            else:
+                self.pieces[owner - 1] |= 1 << coord_to_bit(coord)
+
+    def move(self, current_coord: Coordinates, new_coord: Coordinates) -> None:
+        """
+        Move the piece on one cell to another cell.
+
+        Args:
+            current_coord (Coordinates): The coordinate the piece moves from.
+            new_coord (Coordinates): The coordinate the piece moves to.
+        """
+        source = 1 << coord_to_bit(current_coord)
+        destination = 1 << coord_to_bit(new_coord)
+        for player_index, mask in enumerate(self.pieces):
+            if mask & source:
+                self.pieces[player_index] = mask ^ source ^ destination
+                break
+        self.empty = self.empty ^ source ^ destination
+
+    def __jump_destinations(self, piece: int, occupied: int) -> int:
+        """
+        Get the cells a single piece can reach with a chain of jumps.
+
+        The search is breadth first over whole frontiers: every round jumps all the newly reached cells at once
+        in the four directions with two shifts each.
+
+        Args:
+            piece (int): The mask with only the bit of the moving piece set.
+            occupied (int): The mask of the occupied cells.
+
+        Returns:
+            int: The mask of the cells the piece can jump to.
+        """
+        # The piece leaves its cell, so it can neither be jumped over nor block a landing
+        occupied &= ~piece
+        empty = self.empty | piece
+        reached = piece
+        frontier = piece
+        while frontier:
+            landings = 0
+            for direction, direction_mask in enumerate(self.direction_masks):
+                over = shift(frontier & direction_mask, direction) & occupied
+                landings |= shift(over & direction_mask, direction) & empty
+            frontier = landings & ~reached
+            reached |= frontier
+        return reached ^ piece
+
+    def side_moves(self, player_index: int) -> Dict[Coordinates, List[Coordinates]]:
+        """
+        Calculates the possible moves of every piece of a player at once.
+
+        Args:
+            player_index (int): The index of the player.
+
+        Returns:
+            Dict[Coordinates, List[Coordinates]]: For every piece of the player, the same coordinates
+            Game.calculate_possible_moves returns for it.
+        """
+        own = self.pieces[player_index]
+        steps = {bit: 0 for bit in iterate_bits(own)}
+        for direction, direction_mask in enumerate(self.direction_masks):
+            targets = shift(own & direction_mask, direction) & self.empty
+            for bit in iterate_bits(targets):
+                steps[bit - SHIFTS[direction]] |= 1 << bit
+
+        occupied = self.board_mask & ~self.empty
+        moves = {}
+        for bit, step_mask in steps.items():
+            jump_mask = self.__jump_destinations(1 << bit, occupied) & ~step_mask
+            moves[bit_to_coord(bit)] = [bit_to_coord(target) for target in iterate_bits(step_mask)] + \
+                                       [bit_to_coord(target) for target in iterate_bits(jump_mask)]
+        return moves
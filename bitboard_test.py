@@ -0,0 +1,44 @@
+import random
+import unittest
+from bitboard import BitboardMoveGenerator, coord_to_bit, bit_to_coord
+from boardState import BoardState
+
+
+class TestBitboardMoveGenerator(unittest.TestCase):
+    def test_bit_coordinates(self):
+        for coord in BoardState(6).get_cells():
+            self.assertEqual(bit_to_coord(coord_to_bit(coord)), coord)
+
+    def test_starting_position(self):
+        generator = BitboardMoveGenerator(2)
+        moves = generator.side_moves(0)
+        self.assertEqual(len(moves), 10)
+        self.assertEqual(sorted(moves[(3, 13)]), [(4, 12), (4, 14)])
+        self.assertEqual(moves[(0, 12)], [])
+
+    def test_move(self):
+        generator = BitboardMoveGenerator(2)
+        generator.move((3, 13), (4, 14))
+        moves = generator.side_moves(0)
+        self.assertIn((4, 14), moves)
+        self.assertNotIn((3, 13), moves)
+
+    def test_matches_board_state(self):
+        rng = random.Random(7)
+        for num_players in range(2, 7):
+            for _ in range(20):
+                state = BoardState(num_players)
+                owners = list(state.owners)
+                rng.shuffle(owners)
+                state.load_owners(bytes(owners))
+                generator = BitboardMoveGenerator(num_players)
+                generator.load(state)
+                for player_index in range(num_players):
+                    moves = generator.side_moves(player_index)
+                    self.assertEqual(sorted(moves), sorted(state.get_player_locations(player_index)))
+                    for (row, col), destinations in moves.items():
+                        self.assertEqual(sorted(destinations), sorted(state.possible_moves(row, col)))
+
+
+if __name__ == '__main__':
+    unittest.main()
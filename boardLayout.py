@@ -0,0 +1,98 @@
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Mapping, NamedTuple, Tuple
+
+Coordinates = Tuple[int, int]
+
+NUM_ROWS = 17
+NUM_COLUMNS = 25
+
+# Player colors, in the order players are seated
+COLORS = ["blue", "yellow", "red", "green", "purple", "orange"]
+
+# Home triangle of each color, in the same order as COLORS
+TRIANGLES: List[List[Coordinates]] = [
+    [(0, 12), (1, 11), (1, 13), (2, 10), (2, 12), (2, 14), (3, 9), (3, 11), (3, 13), (3, 15)],
+    [(16, 12), (15, 11), (15, 13), (14, 10), (14, 14), (14, 12), (13, 9), (13, 11), (13, 13), (13, 15)],
+    [(9, 3), (10, 2), (10, 4), (11, 1), (11, 3), (11, 5), (12, 0), (12, 2), (12, 4), (12, 6)],
+    [(7, 3), (6, 2), (6, 4), (5, 1), (5, 3), (5, 5), (4, 0), (4, 2), (4, 4), (4, 6)],
+    [(9, 21), (10, 20), (10, 22), (11, 19), (11, 21), (11, 23), (12, 18), (12, 20), (12, 22), (12, 24)],
+    [(7, 21), (6, 20), (6, 22), (5, 19), (5, 21), (5, 23), (4, 18), (4, 20), (4, 22), (4, 24)]
+]
+
+
+def is_in_center(row: int, col: int) -> bool:
+    """
+    Check if a coordinate lies in the central hexagon of the board.
+
+    Args:
+        row (int): The row index of the coordinate.
+        col (int): The column index of the coordinate.
+
+    Returns:
+        bool: True if the coordinate is a center cell, False otherwise.
+    """
+    if (row + col) % 2 != 0:
+        return False
+    for i in range(4):
+        if row == 4 + i and 7 - i < col < 17 + i:
+            return True
+    for i in range(5):
+        if row == 8 + i and 3 + i < col < 22 - i:
+            return True
+    return False
+
+
+# Cells of the central hexagon, shared by every number of players, row by row
+CENTER_CELLS: List[Coordinates] = [(row, col) for row in range(NUM_ROWS) for col in range(NUM_COLUMNS)
+                                   if is_in_center(row, col)]
+
+
+class BoardLayout(NamedTuple):
+    """
+    The static layout of the board for a number of players. Layouts are shared, so their tables are read-only.
+    """
+    cells: Tuple[Coordinates, ...]
+    starting_owners: Tuple[int, ...]
+    cell_ids: Mapping[Coordinates, int]
+
+
+@lru_cache(maxsize=None)
+def get_layout(num_of_players: int) -> BoardLayout:
+    """
+    Get the layout of the board for a number of players, built only once per number of players.
+
+    The cells of the players' triangles come first, in seating order, followed by the center cells.
+
+    Args:
+        num_of_players (int): The number of players in the game.
+
+    Returns:
+        BoardLayout: The shared layout.
+    """
+    if not 1 <= num_of_players <= len(COLORS):
+        raise ValueError(f"Number of players must be between 1 and {len(COLORS)}, got {num_of_players}")
+
+    cells = [coord for player_index in range(num_of_players) for coord in TRIANGLES[player_index]]
+    starting_owners = [player_index for player_index in range(num_of_players) for _ in TRIANGLES[player_index]]
+    cells += CENTER_CELLS
+    starting_owners += [-1] * len(CENTER_CELLS)
+    cell_ids = {coord: cell_id for cell_id, coord in enumerate(cells)}
+    return BoardLayout(tuple(cells), tuple(starting_owners), MappingProxyType(cell_ids))
+
+
+def build_cells(num_of_players: int) -> Tuple[List[Coordinates], List[int]]:
+    """
+    Build the list of board cells for the given number of players.
+
+    The cells of the players' triangles come first, in seating order, followed by the center cells.
+
+    Args:
+        num_of_players (int): The number of players in the game.
+
+    Returns:
+        Tuple[List[Coordinates], List[int]]: The cell coordinates and, for each cell, the index of the player
+        whose piece stands on it at the start of the game (-1 for an empty cell).
+    """
+    layout = get_layout(num_of_players)
+    return list(layout.cells), list(layout.starting_owners)
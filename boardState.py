@@ -0,0 +1,388 @@
+from typing import Dict, List, Sequence, Tuple, Optional
+
+from boardLayout import COLORS, get_layout
+from boardTopology import BoardTopology, get_topology
+from zobrist import ZobristKeys, get_zobrist_keys
+
+Coordinates = Tuple[int, int]
+
+# Owner value of a cell with no piece on it; a piece of player i is stored as i + 1
+EMPTY = 0
+
+
+class BoardState:
+    """
+    Headless state of a Chinese Checkers board.
+
+    The board is kept as a flat bytearray indexed by cell id, holding one byte per cell for the owner of the
+    piece on it. All the rules of the game are checked against this array, so no Tk root is needed.
+    The Zobrist key of the position is kept up to date on every move, and so are the counts of pieces inside the
+    home triangles of other players, which make the winner check O(1).
+    """
+
+    def __init__(self, num_of_players: int) -> None:
+        """
+        Initializes a BoardState object with every player's pieces in their home triangle.
+
+        Args:
+            num_of_players (int): The number of players in the game.
+        """
+        # The layout tables are built once per number of players and shared by all the states
+        layout = get_layout(num_of_players)
+        self.__num_players = num_of_players
+        self.__cells = layout.cells
+        self.__cell_ids = layout.cell_ids
+        self.__topology = get_topology(num_of_players)
+        self.__zobrist = get_zobrist_keys(len(layout.cells), num_of_players)
+        self.owners = bytearray(owner + 1 for owner in layout.starting_owners)
+        # Every piece starts in its own home, so the starting owners are also the owners of the home triangles
+        self.__homes = bytes(self.owners)
+        self.key = self.__zobrist.position_key(self.owners)
+        self.__count_invasions()
+
+    def copy(self) -> "BoardState":
+        """
+        Create an independent copy of the board state.
+
+        Returns:
+            BoardState: A board state with the same layout and the same pieces.
+        """
+        clone = BoardState.__new__(BoardState)
+        clone.__num_players = self.__num_players
+        clone.__cells = self.__cells
+        clone.__cell_ids = self.__cell_ids
+        clone.__topology = self.__topology
+        clone.__zobrist = self.__zobrist
+        clone.__homes = self.__homes
+        clone.owners = bytearray(self.owners)
+        clone.key = self.key
+        clone.__pieces_in_target = list(self.__pieces_in_target)
+        clone.__foreign_pieces_in_home = list(self.__foreign_pieces_in_home)
+        clone.__invasions = self.__invasions
+        return clone
+
+    def __count_invasions(self) -> None:
+        """
+        Count from scratch the pieces of every player inside the home triangles of other players.
+        """
+        self.__pieces_in_target = [0] * self.__num_players
+        self.__foreign_pieces_in_home = [0] * self.__num_players
+        self.__invasions = 0
+        for owner, home in zip(self.owners, self.__homes):
+            if owner != EMPTY and home != EMPTY and owner != home:
+                self.__pieces_in_target[owner - 1] += 1
+                self.__foreign_pieces_in_home[home - 1] += 1
+                self.__invasions += 1
+
+    def get_num_players(self) -> int:
+        """
+        Get the number of players on the board.
+
+        Returns:
+            int: The number of players.
+        """
+        return self.__num_players
+
+    def get_cells(self) -> Sequence[Coordinates]:
+        """
+        Get the coordinates of all the cells, indexed by cell id.
+
+        Returns:
+            Sequence[Coordinates]: The read-only coordinates of the board cells, shared by all the states.
+        """
+        return self.__cells
+
+    def get_topology(self) -> BoardTopology:
+        """
+        Get the neighbour tables of the board layout.
+
+        Returns:
+            BoardTopology: The topology shared by all the states with the same layout.
+        """
+        return self.__topology
+
+    def get_zobrist_keys(self) -> ZobristKeys:
+        """
+        Get the Zobrist keys of the board layout.
+
+        Returns:
+            ZobristKeys: The keys shared by all the states with the same layout.
+        """
+        return self.__zobrist
+
+    def load_owners(self, owners: bytes) -> None:
+        """
+        Replace the owners of all the cells at once.
+
+        Args:
+            owners (bytes): The owner of every cell, indexed by cell id.
+        """
+        if len(owners) != len(self.__cells):
+            raise ValueError(f"Expected {len(self.__cells)} cells, got {len(owners)}")
+        self.owners[:] = owners
+        self.key = self.__zobrist.position_key(self.owners)
+        self.__count_invasions()
+
+    def cell_id(self, row: int, col: int) -> Optional[int]:
+        """
+        Get the id of the cell at a specific location.
+
+        Args:
+            row (int): The row index of the cell.
+            col (int): The column index of the cell.
+
+        Returns:
+            Optional[int]: The id of the cell, or None if there is no cell at that location.
+        """
+        return self.__cell_ids.get((row, col))
+
+    def owner_at(self, row: int, col: int) -> Optional[int]:
+        """
+        Get the owner of the piece at a specific location.
+
+        Args:
+            row (int): The row index of the cell.
+            col (int): The column index of the cell.
+
+        Returns:
+            Optional[int]: EMPTY, the player index + 1 of the piece on the cell, or None if there is no cell there.
+        """
+        cell = self.__cell_ids.get((row, col))
+        if cell is None:
+            return None
+        return self.owners[cell]
+
+    def color_at(self, row: int, col: int) -> str:
+        """
+        Get the color a cell should be painted with.
+
+        Args:
+            row (int): The row index of the cell.
+            col (int): The column index of the cell.
+
+        Returns:
+            str: The color of the piece on the cell, "white" for an empty cell or "" if there is no cell there.
+        """
+        owner = self.owner_at(row, col)
+        if owner is None:
+            return ""
+        if owner == EMPTY:
+            return "white"
+        return COLORS[owner - 1]
+
+    def cell_color(self, cell: int) -> str:
+        """
+        Get the color a cell should be painted with, by cell id.
+
+        Args:
+            cell (int): The id of the cell.
+
+        Returns:
+            str: The color of the piece on the cell, or "white" for an empty cell.
+        """
+        owner = self.owners[cell]
+        return COLORS[owner - 1] if owner != EMPTY else "white"
+
+    def get_player_locations(self, player_index: int) -> List[Coordinates]:
+        """
+        Get the current locations of all the pieces of a player.
+
+        Args:
+            player_index (int): The index of the player.
+
+        Returns:
+            List[Coordinates]: The coordinates of the player's pieces.
+        """
+        owner = player_index + 1
+        return [self.__cells[cell] for cell, cell_owner in enumerate(self.owners) if cell_owner == owner]
+
+    def move(self, current_coord: Coordinates, new_coord: Coordinates) -> None:
+        """
+        Move the piece on one cell to another cell.
+
+        Args:
+            current_coord (Coordinates): The coordinate the piece moves from.
+            new_coord (Coordinates): The coordinate the piece moves to.
+        """
+        self.move_cells(self.__cell_ids[current_coord], self.__cell_ids[new_coord])
+
+    def move_cells(self, source: int, destination: int) -> None:
+        """
+        Move the piece on one cell to another cell, by cell ids.
+
+        Args:
+            source (int): The id of the cell the piece moves from.
+            destination (int): The id of the cell the piece moves to.
+        """
+        owner = self.owners[source]
+        self.owners[destination] = owner
+        self.owners[source] = EMPTY
+        self.key ^= self.__zobrist.move_delta(source, destination, owner)
+        home = self.__homes[source]
+        if home != EMPTY and home != owner:
+            self.__pieces_in_target[owner - 1] -= 1
+            self.__foreign_pieces_in_home[home - 1] -= 1
+            self.__invasions -= 1
+        home = self.__homes[destination]
+        if home != EMPTY and home != owner:
+            self.__pieces_in_target[owner - 1] += 1
+            self.__foreign_pieces_in_home[home - 1] += 1
+            self.__invasions += 1
+
+    def adjacent_empty_cells(self, row: int, col: int) -> List[Coordinates]:
+        """
+        Get the empty cells next to a coordinate in the four diagonal directions.
+
+        Args:
+            row (int): The row index of the coordinate.
+            col (int): The column index of the coordinate.
+
+        Returns:
+            List[Coordinates]: The empty neighbouring cells.
+        """
+        cell = self.__cell_ids.get((row, col))
+        if cell is None:
+            return []
+        owners = self.owners
+        return [self.__cells[neighbor] for neighbor in self.__topology.steps[cell] if owners[neighbor] == EMPTY]
+
+    def __search_jumps(self, cell: int, parents: Optional[Dict[int, int]] = None) -> List[int]:
+        """
+        Breadth first search over the jump chains of the piece on a cell.
+
+        Each hop jumps over an adjacent piece onto the empty cell right behind it, in any direction, and every
+        landing cell is visited once, so the work is bounded by the number of cells rather than the number of paths.
+
+        Args:
+            cell (int): The id of the cell the piece jumps from.
+            parents (Optional[Dict[int, int]]): If given, filled with the cell each landing cell was reached from.
+
+        Returns:
+            List[int]: The ids of the landing cells, in the order they were reached.
+        """
+        owners = self.owners
+        jump_pairs = self.__topology.jump_pairs
+        # The piece leaves its cell, so it can neither be jumped over nor block a landing
+        mover = owners[cell]
+        owners[cell] = EMPTY
+        visited = {cell}
+        queue = [cell]
+        try:
+            for current in queue:
+                for over, landing in jump_pairs[current]:
+                    if owners[over] != EMPTY and owners[landing] == EMPTY and landing not in visited:
+                        visited.add(landing)
+                        queue.append(landing)
+                        if parents is not None:
+                            parents[landing] = current
+        finally:
+            owners[cell] = mover
+        return queue[1:]
+
+    def destination_cells(self, cell: int) -> List[int]:
+        """
+        Get the ids of all the cells the piece on a cell can move to.
+
+        Args:
+            cell (int): The id of the cell of the piece.
+
+        Returns:
+            List[int]: The ids of the adjacent empty cells followed by the other jump destinations, without repeats.
+        """
+        owners = self.owners
+        steps = [neighbor for neighbor in self.__topology.steps[cell] if owners[neighbor] == EMPTY]
+        return steps + [landing for landing in self.__search_jumps(cell) if landing not in steps]
+
+    def possible_moves(self, row: int, col: int) -> List[Coordinates]:
+        """
+        Calculates all possible moves of the piece at the given coordinate.
+
+        A piece either steps to an adjacent empty cell or makes a chain of jumps, each over an adjacent piece of
+        any color onto the empty cell right behind it, changing direction between hops as it likes.
+
+        Args:
+            row (int): The row of the piece.
+            col (int): The column of the piece.
+
+        Returns:
+            List[Coordinates]: The adjacent empty cells followed by the other jump destinations, without repeats.
+        """
+        cell = self.__cell_ids.get((row, col))
+        if cell is None:
+            return []
+        cells = self.__cells
+        return [cells[destination] for destination in self.destination_cells(cell)]
+
+    def jump_paths(self, row: int, col: int) -> Dict[Coordinates, List[Coordinates]]:
+        """
+        Get the hop path to every jump destination of the piece at the given coordinate.
+
+        Args:
+            row (int): The row of the piece.
+            col (int): The column of the piece.
+
+        Returns:
+            Dict[Coordinates, List[Coordinates]]: For every jump destination, the cells of a shortest chain of
+            hops to it, starting at the piece and ending at the destination.
+        """
+        cell = self.__cell_ids.get((row, col))
+        if cell is None:
+            return {}
+        cells = self.__cells
+        parents = {}
+        paths = {}
+        for landing in self.__search_jumps(cell, parents):
+            path = [landing]
+            while path[-1] != cell:
+                path.append(parents[path[-1]])
+            paths[cells[landing]] = [cells[hop] for hop in reversed(path)]
+        return paths
+
+    def is_winner(self) -> bool:
+        """
+        Check if there is a winner in the game.
+
+        The game ends as soon as a piece enters the home triangle of another player.
+
+        Returns:
+            bool: True if there is a winner, False otherwise.
+        """
+        return self.__invasions > 0
+
+    def winner(self) -> Optional[int]:
+        """
+        Get the player that won the game, the one with a piece in the home triangle of another player.
+
+        Returns:
+            Optional[int]: The index of the winning player, or None if there is no winner yet.
+        """
+        if not self.__invasions:
+            return None
+        for player_index, pieces in enumerate(self.__pieces_in_target):
+            if pieces:
+                return player_index
+        return None
+
+    def pieces_in_target(self, player_index: int) -> int:
+        """
+        Get the number of a player's pieces inside the home triangles of other players.
+
+        Args:
+            player_index (int): The index of the player.
+
+        Returns:
+            int: The number of pieces.
+        """
+        return self.__pieces_in_target[player_index]
+
+    def foreign_pieces_in_home(self, player_index: int) -> int:
+        """
+        Get the number of other players' pieces inside the home triangle of a player.
+
+        Args:
+            player_index (int): The index of the player.
+
+        Returns:
+            int: The number of pieces.
+        """
+        return self.__foreign_pieces_in_home[player_index]
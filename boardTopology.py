@@ -0,0 +1,69 @@
+from functools import lru_cache
+from typing import List, Tuple
+
+from boardLayout import build_cells
+
+Coordinates = Tuple[int, int]
+
+# Sentinel cell id for a neighbour that falls off the board
+OFF_BOARD = -1
+
+# The four diagonal directions a piece can move in, indexed by direction id
+DIRECTIONS = [(1, -1), (1, 1), (-1, -1), (-1, 1)]
+
+
+class BoardTopology:
+    """
+    Static neighbour tables of a board layout.
+
+    For every cell id and every direction the tables hold the adjacent cell and the landing cell of a jump over
+    that adjacent cell, so walking the board only takes integer lookups.
+    """
+
+    def __init__(self, cells: List[Coordinates]) -> None:
+        """
+        Initializes a BoardTopology object.
+
+        Args:
+            cells (List[Coordinates]): The coordinates of the board cells, indexed by cell id.
+        """
+        cell_ids = {coord: cell_id for cell_id, coord in enumerate(cells)}
+        self.neighbors: List[Tuple[int, ...]] = []
+        self.landings: List[Tuple[int, ...]] = []
+        self.steps: List[Tuple[int, ...]] = []
+        self.jump_pairs: List[Tuple[Tuple[int, int], ...]] = []
+
+        for row, col in cells:
+            neighbors = tuple(cell_ids.get((row + d_row, col + d_col), OFF_BOARD) for d_row, d_col in DIRECTIONS)
+            landings = tuple(cell_ids.get((row + 2 * d_row, col + 2 * d_col), OFF_BOARD)
+                             if neighbor != OFF_BOARD else OFF_BOARD
+                             for neighbor, (d_row, d_col) in zip(neighbors, DIRECTIONS))
+            self.neighbors.append(neighbors)
+            self.landings.append(landings)
+            self.steps.append(tuple(neighbor for neighbor in neighbors if neighbor != OFF_BOARD))
+            self.jump_pairs.append(tuple((neighbor, landing) for neighbor, landing in zip(neighbors, landings)
+                                         if landing != OFF_BOARD))
+
+    def get_num_cells(self) -> int:
+        """
+        Get the number of cells in the layout.
+
+        Returns:
+            int: The number of cells.
+        """
+        return len(self.neighbors)
+
+
+@lru_cache(maxsize=None)
+def get_topology(num_of_players: int) -> BoardTopology:
+    """
+    Get the topology of the board for the given number of players, building it only once per layout.
+
+    Args:
+        num_of_players (int): The number of players in the game.
+
+    Returns:
+        BoardTopology: The neighbour tables of the board.
+    """
+    cells, _ = build_cells(num_of_players)
+    return BoardTopology(cells)
@@ -0,0 +1,99 @@
+import unittest
+from boardState import BoardState, EMPTY
+from boardLayout import CENTER_CELLS, TRIANGLES, build_cells, get_layout
+
+
+class TestBoardState(unittest.TestCase):
+    def setUp(self):
+        # A two players board: blue at the top, yellow at the bottom
+        self.state = BoardState(2)
+
+    def test_initialization(self):
+        self.assertEqual(len(self.state.get_cells()), 81)
+        self.assertEqual(len(BoardState(6).get_cells()), 121)
+        self.assertEqual(self.state.color_at(0, 12), "blue")
+        self.assertEqual(self.state.color_at(16, 12), "yellow")
+        self.assertEqual(self.state.color_at(8, 12), "white")
+        self.assertEqual(self.state.color_at(9, 3), "")
+        self.assertEqual(sorted(self.state.get_player_locations(0)), sorted(TRIANGLES[0]))
+
+    def test_layout_is_built_once(self):
+        layout = get_layout(2)
+        self.assertIs(get_layout(2), layout)
+        self.assertIs(BoardState(2).get_cells(), layout.cells)
+        self.assertEqual(list(layout.cells), TRIANGLES[0] + TRIANGLES[1] + CENTER_CELLS)
+        self.assertEqual(layout.cell_ids[(8, 12)], layout.cells.index((8, 12)))
+        cells, _ = build_cells(2)
+        cells.append((0, 0))
+        self.assertEqual(len(layout.cells), 81)
+        with self.assertRaises(TypeError):
+            layout.cell_ids[(0, 0)] = 0
+
+    def test_invalid_number_of_players(self):
+        with self.assertRaises(ValueError):
+            BoardState(0)
+        with self.assertRaises(ValueError):
+            BoardState(7)
+
+    def test_move(self):
+        self.state.move((3, 13), (4, 14))
+        self.assertEqual(self.state.owner_at(3, 13), EMPTY)
+        self.assertEqual(self.state.color_at(4, 14), "blue")
+        self.assertIn((4, 14), self.state.get_player_locations(0))
+
+    def test_possible_moves_from_the_start(self):
+        self.assertEqual(self.state.possible_moves(3, 13), [(4, 12), (4, 14)])
+        self.assertEqual(sorted(self.state.possible_moves(2, 12)), [(4, 10), (4, 14)])
+        self.assertEqual(self.state.possible_moves(0, 12), [])
+
+    def test_jump_chain_changes_direction(self):
+        self.state.move((13, 9), (4, 14))
+        self.state.move((13, 11), (6, 14))
+        moves = self.state.possible_moves(3, 13)
+        self.assertIn((5, 15), moves)
+        self.assertIn((7, 13), moves)
+        self.assertEqual(len(moves), len(set(moves)))
+        self.assertEqual(self.state.jump_paths(3, 13)[(7, 13)], [(3, 13), (5, 15), (7, 13)])
+
+    def test_jump_does_not_pass_over_the_moving_piece(self):
+        # From (4, 10) the only further hop would land back on the cell the piece came from
+        paths = self.state.jump_paths(2, 12)
+        self.assertEqual(paths[(4, 10)], [(2, 12), (4, 10)])
+        self.assertNotIn((2, 12), paths)
+
+    def test_copy_is_independent(self):
+        clone = self.state.copy()
+        clone.move((3, 13), (4, 14))
+        self.assertEqual(self.state.color_at(3, 13), "blue")
+        self.assertEqual(clone.color_at(3, 13), "white")
+
+    def test_is_winner(self):
+        self.assertFalse(self.state.is_winner())
+        self.state.move((0, 12), (8, 12))
+        self.state.move((16, 12), (0, 12))
+        self.assertTrue(self.state.is_winner())
+
+    def test_winner(self):
+        self.assertIsNone(self.state.winner())
+        self.state.move((16, 12), (8, 12))
+        self.state.move((0, 12), (7, 11))
+        self.state.move((8, 12), (0, 12))
+        self.assertEqual(self.state.winner(), 1)
+        self.assertEqual(self.state.pieces_in_target(1), 1)
+        self.assertEqual(self.state.foreign_pieces_in_home(0), 1)
+        self.state.move((0, 12), (8, 12))
+        self.assertIsNone(self.state.winner())
+
+    def test_invasion_counts_follow_load_and_copy(self):
+        self.state.move((0, 12), (7, 11))
+        self.state.move((16, 12), (0, 12))
+        clone = self.state.copy()
+        clone.move((0, 12), (8, 12))
+        self.assertEqual(self.state.winner(), 1)
+        self.assertFalse(clone.is_winner())
+        clone.load_owners(bytes(self.state.owners))
+        self.assertEqual(clone.winner(), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,35 @@
+import unittest
+from boardTopology import BoardTopology, OFF_BOARD, DIRECTIONS, get_topology
+from boardLayout import build_cells
+
+
+class TestBoardTopology(unittest.TestCase):
+    def setUp(self):
+        self.cells, _ = build_cells(2)
+        self.topology = BoardTopology(self.cells)
+
+    def test_neighbors_match_coordinates(self):
+        cell_ids = {coord: cell_id for cell_id, coord in enumerate(self.cells)}
+        for cell, (row, col) in enumerate(self.cells):
+            for direction, (d_row, d_col) in enumerate(DIRECTIONS):
+                expected = cell_ids.get((row + d_row, col + d_col), OFF_BOARD)
+                self.assertEqual(self.topology.neighbors[cell][direction], expected)
+
+    def test_apex_has_two_neighbors(self):
+        apex = self.cells.index((0, 12))
+        self.assertEqual(len(self.topology.steps[apex]), 2)
+        self.assertEqual(self.topology.neighbors[apex][2], OFF_BOARD)
+
+    def test_jump_pairs(self):
+        cell = self.cells.index((3, 13))
+        over = self.cells.index((4, 14))
+        landing = self.cells.index((5, 15))
+        self.assertIn((over, landing), self.topology.jump_pairs[cell])
+
+    def test_topology_is_built_once_per_layout(self):
+        self.assertIs(get_topology(3), get_topology(3))
+        self.assertEqual(get_topology(6).get_num_cells(), 121)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,295 @@
+"""
+Canvas renderer of the board.
+
+The whole board is drawn on a single tk.Canvas, one oval item per cell, instead of one tk.Button per cell. Clicks
+are hit-tested against a table of the cell coordinates, so building, highlighting and repainting the board only
+touches canvas items, and several boards fit in one window.
+"""
+
+import tkinter as tk
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from boardLayout import NUM_COLUMNS, NUM_ROWS
+
+Coordinates = Tuple[int, int]
+
+# Width of a column of the board grid; the cells of a row are two columns apart
+DEFAULT_COLUMN_WIDTH = 16
+
+# Height of a row of the board grid
+DEFAULT_ROW_HEIGHT = 28
+
+# Pixels left between neighbouring cells
+CELL_GAP = 4
+
+# Color of the canvas behind the cells
+BACKGROUND = "lightblue"
+
+
+class BoardGeometry:
+    """
+    Where the cells of a board are drawn on a canvas, and which cell is at a point of it.
+    """
+
+    def __init__(self, cells: Sequence[Coordinates], column_width: int = DEFAULT_COLUMN_WIDTH,
+                 row_height: int = DEFAULT_ROW_HEIGHT) -> None:
+        """
+        Initializes a BoardGeometry object.
+
+        Args:
+            cells (Sequence[Coordinates]): The (row, column) of every cell, indexed by cell id.
+            column_width (int): The width of a column of the board grid, in pixels.
+            row_height (int): The height of a row of the board grid, in pixels.
+        """
+        self.column_width = column_width
+        self.row_height = row_height
+        self.radius = (min(2 * column_width, row_height) - CELL_GAP) / 2
+        # Coordinate -> cell id table, for hit-testing without searching the cells
+        self.__cell_ids: List[List[Optional[int]]] = [[None] * NUM_COLUMNS for _ in range(NUM_ROWS)]
+        for cell, (row, col) in enumerate(cells):
+            self.__cell_ids[row][col] = cell
+
+    def size(self) -> Tuple[int, int]:
+        """
+        Get the size of the canvas that holds the board.
+
+        Returns:
+            Tuple[int, int]: The width and the height, in pixels.
+        """
+        return (NUM_COLUMNS + 1) * self.column_width, NUM_ROWS * self.row_height
+
+    def center(self, row: int, col: int) -> Tuple[float, float]:
+        """
+        Get the center of the cell at a location of the board grid.
+
+        Args:
+            row (int): The row index of the cell.
+            col (int): The column index of the cell.
+
+        Returns:
+            Tuple[float, float]: The x and y of the center, in pixels.
+        """
+        return (col + 1) * self.column_width, (row + 0.5) * self.row_height
+
+    def bounds(self, row: int, col: int) -> Tuple[float, float, float, float]:
+        """
+        Get the bounding box of the oval of a cell.
+
+        Args:
+            row (int): The row index of the cell.
+            col (int): The column index of the cell.
+
+        Returns:
+            Tuple[float, float, float, float]: The left, top, right and bottom of the oval, in pixels.
+        """
+        x, y = self.center(row, col)
+        return x - self.radius, y - self.radius, x + self.radius, y + self.radius
+
+    def cell_id(self, row: int, col: int) -> Optional[int]:
+        """
+        Get the id of the cell at a location of the board grid.
+
+        Args:
+            row (int): The row index of the cell.
+            col (int): The column index of the cell.
+
+        Returns:
+            Optional[int]: The id of the cell, or None if there is no cell at that location.
+        """
+        if 0 <= row < NUM_ROWS and 0 <= col < NUM_COLUMNS:
+            return self.__cell_ids[row][col]
+        return None
+
+    def cell_at(self, x: float, y: float) -> Optional[int]:
+        """
+        Find the cell drawn at a point of the canvas.
+
+        Args:
+            x (float): The x of the point, in pixels.
+            y (float): The y of the point, in pixels.
+
+        Returns:
+            Optional[int]: The id of the cell whose oval contains the point, or None if the point is between cells.
+        """
+        row = int(y // self.row_height)
+        nearest_col = round(x / self.column_width) - 1
+        for col in (nearest_col, nearest_col - 1, nearest_col + 1):
+            cell = self.cell_id(row, col)
+            if cell is not None:
+                center_x, center_y = self.center(row, col)
+                if (x - center_x) ** 2 + (y - center_y) ** 2 <= self.radius ** 2:
+                    return cell
+        return None
+
+
+class CanvasCell:
+    """
+    A cell of a CanvasBoard, with the part of the tk.Button interface the game uses: the "bg" option is the fill of
+    the cell's oval, and binding "<Button-1>" handles the clicks on it.
+    """
+
+    def __init__(self, board: "CanvasBoard", cell_id: int) -> None:
+        """
+        Initializes a CanvasCell object.
+
+        Args:
+            board (CanvasBoard): The board the cell is drawn on.
+            cell_id (int): The id of the cell.
+        """
+        self.board = board
+        self.cell_id = cell_id
+
+    def configure(self, **options) -> None:
+        """
+        Change the options of the cell; only "bg" is supported.
+
+        Args:
+            **options: The options to change.
+        """
+        if "bg" in options:
+            self.board.set_color(self.cell_id, options["bg"])
+
+    config = configure
+
+    def cget(self, option: str) -> str:
+        """
+        Get an option of the cell; only "bg" is supported.
+
+        Args:
+            option (str): The name of the option.
+
+        Returns:
+            str: The value of the option.
+        """
+        if option != "bg":
+            raise ValueError(f"Unknown option of a canvas cell: {option}")
+        return self.board.get_color(self.cell_id)
+
+    __getitem__ = cget
+
+    def bind(self, sequence: str, handler: Callable[[tk.Event], None]) -> None:
+        """
+        Handle the clicks on the cell; only "<Button-1>" is supported.
+
+        Args:
+            sequence (str): The event sequence.
+            handler (Callable[[tk.Event], None]): The function called with the click event.
+        """
+        if sequence != "<Button-1>":
+            raise ValueError(f"Unsupported event of a canvas cell: {sequence}")
+        self.board.bind_cell(self.cell_id, handler)
+
+
+class CanvasBoard:
+    """
+    A board drawn on a single canvas, one oval per cell.
+    """
+
+    def __init__(self, master: tk.Misc, cells: Sequence[Coordinates], colors: Sequence[str],
+                 column_width: int = DEFAULT_COLUMN_WIDTH, row_height: int = DEFAULT_ROW_HEIGHT) -> None:
+        """
+        Initializes a CanvasBoard object and draws the cells. The canvas still has to be packed or gridded.
+
+        Args:
+            master (tk.Misc): The window or frame that holds the canvas.
+            cells (Sequence[Coordinates]): The (row, column) of every cell, indexed by cell id.
+            colors (Sequence[str]): The color every cell is drawn with, indexed by cell id.
+            column_width (int): The width of a column of the board grid, in pixels.
+            row_height (int): The height of a row of the board grid, in pixels.
+        """
+        self.geometry = BoardGeometry(cells, column_width, row_height)
+        width, height = self.geometry.size()
+        self.canvas = tk.Canvas(master, width=width, height=height, bg=BACKGROUND, highlightthickness=0)
+        self.__fills = list(colors)
+        self.__handlers: List[Optional[Callable[[tk.Event], None]]] = [None] * len(cells)
+        self.__cells = [CanvasCell(self, cell) for cell in range(len(cells))]
+        self.__items = [self.canvas.create_oval(*self.geometry.bounds(row, col), fill=color, outline="gray")
+                        for (row, col), color in zip(cells, colors)]
+        self.canvas.bind("<Button-1>", self.__handle_click)
+
+    def pack(self, **options) -> None:
+        """
+        Pack the canvas into its master.
+
+        Args:
+            **options: The options of tk.Canvas.pack.
+        """
+        self.canvas.pack(**options)
+
+    def grid(self, **options) -> None:
+        """
+        Grid the canvas into its master.
+
+        Args:
+            **options: The options of tk.Canvas.grid.
+        """
+        self.canvas.grid(**options)
+
+    def cell(self, row: int, col: int) -> Optional[CanvasCell]:
+        """
+        Get the cell at a location of the board grid.
+
+        Args:
+            row (int): The row index of the cell.
+            col (int): The column index of the cell.
+
+        Returns:
+            Optional[CanvasCell]: The cell, or None if there is no cell at that location.
+        """
+        cell = self.geometry.cell_id(row, col)
+        return self.__cells[cell] if cell is not None else None
+
+    def get_color(self, cell: int) -> str:
+        """
+        Get the color a cell is drawn with, without asking Tk.
+
+        Args:
+            cell (int): The id of the cell.
+
+        Returns:
+            str: The fill color of the cell.
+        """
+        return self.__fills[cell]
+
+    def set_color(self, cell: int, color: str) -> None:
+        """
+        Change the color a cell is drawn with. Nothing is sent to Tk if the color does not change.
+
+        Args:
+            cell (int): The id of the cell.
+            color (str): The new fill color.
+        """
+        if self.__fills[cell] != color:
+            self.__fills[cell] = color
+            self.canvas.itemconfigure(self.__items[cell], fill=color)
+
+    def repaint(self, colors: Sequence[str]) -> None:
+        """
+        Change the colors of all the cells.
+
+        Args:
+            colors (Sequence[str]): The color of every cell, indexed by cell id.
+        """
+        for cell, color in enumerate(colors):
+            self.set_color(cell, color)
+
+    def bind_cell(self, cell: int, handler: Callable[[tk.Event], None]) -> None:
+        """
+        Handle the clicks on a cell, replacing its previous handler.
+
+        Args:
+            cell (int): The id of the cell.
+            handler (Callable[[tk.Event], None]): The function called with the click event.
+        """
+        self.__handlers[cell] = handler
+
+    def __handle_click(self, event: tk.Event) -> None:
+        """
+        Pass a click on the canvas to the handler of the cell under it.
+
+        Args:
+            event (tk.Event): The click event.
+        """
+        cell = self.geometry.cell_at(event.x, event.y)
+        if cell is not None and self.__handlers[cell] is not None:
+            self.__handlers[cell](event)
@@ -0,0 +1,65 @@
+import tkinter as tk
+import unittest
+from boardState import BoardState
+from canvasBoard import BoardGeometry, CanvasBoard
+
+
+class TestBoardGeometry(unittest.TestCase):
+    def setUp(self):
+        self.state = BoardState(6)
+        self.geometry = BoardGeometry(self.state.get_cells())
+
+    def test_every_cell_is_hit_at_its_center(self):
+        for cell, (row, col) in enumerate(self.state.get_cells()):
+            self.assertEqual(self.geometry.cell_at(*self.geometry.center(row, col)), cell)
+
+    def test_hit_near_the_edge_of_a_cell(self):
+        x, y = self.geometry.center(8, 12)
+        radius = self.geometry.radius
+        self.assertEqual(self.geometry.cell_at(x - radius + 1, y), self.state.cell_id(8, 12))
+        self.assertEqual(self.geometry.cell_at(x + radius - 1, y), self.state.cell_id(8, 12))
+
+    def test_points_between_cells_miss(self):
+        x, y = self.geometry.center(8, 12)
+        self.assertIsNone(self.geometry.cell_at(x + self.geometry.column_width, y))
+        self.assertIsNone(self.geometry.cell_at(1, 1))
+        self.assertIsNone(self.geometry.cell_at(-5, 10000))
+
+    def test_cells_fit_on_the_canvas(self):
+        width, height = self.geometry.size()
+        for row, col in self.state.get_cells():
+            left, top, right, bottom = self.geometry.bounds(row, col)
+            self.assertTrue(0 <= left and right <= width and 0 <= top and bottom <= height)
+
+
+class TestCanvasBoard(unittest.TestCase):
+    def setUp(self):
+        try:
+            self.root = tk.Tk()
+        except tk.TclError:
+            self.skipTest("No display to create a Tk window")
+        self.state = BoardState(2)
+        cells = self.state.get_cells()
+        self.board = CanvasBoard(self.root, cells, [self.state.color_at(row, col) for row, col in cells])
+
+    def tearDown(self):
+        self.root.destroy()
+
+    def test_cell_stands_in_for_a_button(self):
+        cell = self.board.cell(0, 12)
+        self.assertEqual(cell["bg"], "blue")
+        cell.configure(bg="magenta")
+        self.assertEqual(cell["bg"], "magenta")
+        self.assertEqual(self.board.canvas.itemcget(self.board.canvas.find_all()[cell.cell_id], "fill"), "magenta")
+        self.assertIsNone(self.board.cell(0, 0))
+
+    def test_click_reaches_the_cell_handler(self):
+        clicked = []
+        self.board.cell(8, 12).bind("<Button-1>", lambda event: clicked.append((8, 12)))
+        x, y = self.board.geometry.center(8, 12)
+        self.board._CanvasBoard__handle_click(type("Event", (), {"x": x, "y": y})())
+        self.assertEqual(clicked, [(8, 12)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+"""
+Dirty-cell rendering of a board.
+
+Changes to the board only mark cells as dirty. The dirty cells are repainted together once the Tk event loop is
+idle, so many moves in a row, e.g. a fast computer player or a replay at high speed, cost one repaint per frame.
+Each cell remembers the color it was last painted with, and a cell whose color did not change is not touched.
+"""
+
+import tkinter as tk
+from typing import Callable, Iterable, List, Optional, Sequence, Set
+
+# Color of the cells a selected piece can move to
+HIGHLIGHT_COLOR = "magenta"
+
+
+class CellRenderer:
+    """
+    Keeps the widgets of the cells of a board painted with the colors of a model.
+    """
+
+    def __init__(self, root: tk.Misc, widgets: Sequence, cell_color: Callable[[int], str],
+                 painted: Optional[Sequence[str]] = None) -> None:
+        """
+        Initializes a CellRenderer object.
+
+        Args:
+            root (tk.Misc): The widget whose event loop schedules the repaints.
+            widgets (Sequence): The widget of every cell, indexed by cell id; anything with configure(bg=...).
+            cell_color (Callable[[int], str]): Gives the color of a cell in the model, by cell id.
+            painted (Optional[Sequence[str]]): The colors the widgets are painted with now; if not given, every
+                cell is repainted on the first flush.
+        """
+        self.root = root
+        self.widgets = widgets
+        self.cell_color = cell_color
+        self.writes = 0
+        self.__painted: List[Optional[str]] = list(painted) if painted is not None else [None] * len(widgets)
+        self.__dirty: Set[int] = set() if painted is not None else set(range(len(widgets)))
+        self.__highlighted: Set[int] = set()
+        self.__after_id = None
+
+    def mark(self, *cells: int) -> None:
+        """
+        Mark cells whose color in the model may have changed, to be repainted when the event loop is idle.
+
+        Args:
+            *cells (int): The ids of the cells.
+        """
+        self.__dirty.update(cells)
+        self.__schedule()
+
+    def mark_all(self) -> None:
+        """
+        Mark every cell to be checked on the next repaint.
+        """
+        self.mark(*range(len(self.widgets)))
+
+    def highlight(self, cells: Iterable[int]) -> None:
+        """
+        Paint cells with the highlight color until the highlights are cleared.
+
+        Args:
+            cells (Iterable[int]): The ids of the cells.
+        """
+        cells = set(cells)
+        self.__highlighted |= cells
+        self.mark(*cells)
+
+    def clear_highlights(self) -> None:
+        """
+        Paint the highlighted cells back with their colors in the model.
+        """
+        cells = self.__highlighted
+        self.__highlighted = set()
+        self.mark(*cells)
+
+    def color_of(self, cell: int) -> str:
+        """
+        Get the color a cell should be painted with.
+
+        Args:
+            cell (int): The id of the cell.
+
+        Returns:
+            str: The highlight color for a highlighted cell, otherwise its color in the model.
+        """
+        return HIGHLIGHT_COLOR if cell in self.__highlighted else self.cell_color(cell)
+
+    def painted_color(self, cell: int) -> Optional[str]:
+        """
+        Get the color a cell was last painted with, without asking Tk.
+
+        Args:
+            cell (int): The id of the cell.
+
+        Returns:
+            Optional[str]: The color, or None if the cell was never painted by this renderer.
+        """
+        return self.__painted[cell]
+
+    def flush(self) -> int:
+        """
+        Repaint the dirty cells whose color changed now, instead of waiting for the event loop.
+
+        Returns:
+            int: The number of widgets that were configured.
+        """
+        if self.__after_id is not None:
+            self.root.after_cancel(self.__after_id)
+            self.__after_id = None
+        return self.__paint()
+
+    def __schedule(self) -> None:
+        """
+        Make sure the dirty cells are repainted once the event loop is idle.
+        """
+        if self.__after_id is None and self.__dirty:
+            self.__after_id = self.root.after_idle(self.__paint)
+
+    def __paint(self) -> int:
+        """
+        Repaint the dirty cells, skipping those already painted with the right color.
+
+        Returns:
+            int: The number of widgets that were configured.
+        """
+        self.__after_id = None
+        dirty, self.__dirty = self.__dirty, set()
+        writes = 0
+        for cell in dirty:
+            color = self.color_of(cell)
+            if self.__painted[cell] != color:
+                self.widgets[cell].configure(bg=color)
+                self.__painted[cell] = color
+                writes += 1
+        self.writes += writes
+        return writes
@@ -0,0 +1,77 @@
+import unittest
+from boardState import BoardState
+from cellRenderer import HIGHLIGHT_COLOR, CellRenderer
+
+
+class FakeRoot:
+    def __init__(self):
+        self.idle = []
+
+    def after_idle(self, callback):
+        self.idle.append(callback)
+        return len(self.idle)
+
+    def after_cancel(self, after_id):
+        self.idle[after_id - 1] = None
+
+    def run_idle(self):
+        callbacks, self.idle = self.idle, []
+        for callback in callbacks:
+            if callback is not None:
+                callback()
+
+
+class FakeWidget:
+    def __init__(self, color):
+        self.color = color
+        self.writes = 0
+
+    def configure(self, bg):
+        self.color = bg
+        self.writes += 1
+
+
+class TestCellRenderer(unittest.TestCase):
+    def setUp(self):
+        self.state = BoardState(2)
+        colors = [self.state.cell_color(cell) for cell in range(len(self.state.owners))]
+        self.root = FakeRoot()
+        self.widgets = [FakeWidget(color) for color in colors]
+        self.renderer = CellRenderer(self.root, self.widgets, self.state.cell_color, colors)
+
+    def test_repaint_waits_for_idle_and_is_coalesced(self):
+        source, destination = self.state.cell_id(3, 13), self.state.cell_id(4, 14)
+        self.state.move_cells(source, destination)
+        self.renderer.mark(source, destination)
+        self.renderer.mark(destination)
+        self.assertEqual(self.widgets[destination].color, "white")
+        self.assertEqual(len(self.root.idle), 1)
+        self.root.run_idle()
+        self.assertEqual((self.widgets[source].color, self.widgets[destination].color), ("white", "blue"))
+        self.assertEqual(self.renderer.writes, 2)
+
+    def test_unchanged_cells_are_not_written(self):
+        self.renderer.mark_all()
+        self.root.run_idle()
+        self.assertEqual(self.renderer.writes, 0)
+
+    def test_highlights(self):
+        cells = [self.state.cell_id(4, 12), self.state.cell_id(4, 14)]
+        self.renderer.highlight(cells)
+        self.assertEqual(self.renderer.flush(), 2)
+        self.assertEqual(self.widgets[cells[0]].color, HIGHLIGHT_COLOR)
+        self.renderer.clear_highlights()
+        self.root.run_idle()
+        self.assertEqual([self.widgets[cell].color for cell in cells], ["white", "white"])
+        self.assertEqual(self.renderer.painted_color(cells[1]), "white")
+
+    def test_without_painted_colors_every_cell_is_painted(self):
+        widgets = [FakeWidget("") for _ in self.widgets]
+        renderer = CellRenderer(self.root, widgets, self.state.cell_color)
+        renderer.flush()
+        self.assertEqual(widgets[0].color, "blue")
+        self.assertTrue(all(widget.writes == 1 for widget in widgets))
+
+
+if __name__ == '__main__':
+    unittest.main()
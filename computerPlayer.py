@@ -0,0 +1,134 @@
+import random
+from collections import defaultdict
+from typing import Optional, Tuple
+
+from alphaBeta import AlphaBetaSearch, DEFAULT_TIME_BUDGET
+from boardLayout import TRIANGLES
+from boardState import BoardState, EMPTY
+from evaluation import goal_distances, hop_distances
+from monteCarlo import MonteCarloSearch
+from moveGenerator import generate_moves
+
+Move = Tuple[int, int]
+
+# The computer levels, as selected on the opening screen
+LEVELS = [1, 2, 3, 4]
+
+
+class ComputerPlayer:
+    """
+    A computer opponent of a given level, playing on a headless board state.
+
+    Level 1 plays a random move that gets closer to the goal, level 2 moves the piece closest to an enemy home
+    towards it, level 3 runs an alpha-beta search and level 4 a Monte Carlo tree search.
+    """
+
+    def __init__(self, level: int, seed: Optional[int] = None, time_budget: Optional[float] = None,
+                 workers: Optional[int] = None, playouts: int = 2000) -> None:
+        """
+        Initializes a ComputerPlayer object.
+
+        Args:
+            level (int): The level of the computer, one of LEVELS.
+            seed (Optional[int]): Seed of the random choices, for reproducible games.
+            time_budget (Optional[float]): Wall clock seconds a move of level 3 or 4 may take; the engine's
+                default if not given.
+            workers (Optional[int]): The number of worker processes of level 4, the number of CPUs if not given.
+            playouts (int): The number of playouts of a level 4 move.
+        """
+        if level not in LEVELS:
+            raise ValueError(f"Unknown computer level {level}, expected one of {LEVELS}")
+        self.level = level
+        self.__rng = random.Random(seed)
+        self.__search = None
+        if level == 3:
+            self.__search = AlphaBetaSearch(time_budget if time_budget is not None else DEFAULT_TIME_BUDGET)
+        elif level == 4:
+            # Only override the engine's time budget when one is given, a move must never run unbounded
+            options = {"time_budget": time_budget} if time_budget is not None else {}
+            self.__search = MonteCarloSearch(playouts=playouts, workers=workers, seed=seed, **options)
+
+    @property
+    def time_budget(self) -> Optional[float]:
+        """
+        Get the wall clock seconds a move may take.
+
+        Returns:
+            Optional[float]: The time budget of the search engine, or None for the levels without a search.
+        """
+        return self.__search.time_budget if self.__search is not None else None
+
+    def choose_move(self, state: BoardState, player_index: int) -> Optional[Move]:
+        """
+        Choose the move of a player.
+
+        Args:
+            state (BoardState): The board state; it is left unchanged.
+            player_index (int): The index of the player to move.
+
+        Returns:
+            Optional[Move]: The (from, to) cell ids of the chosen move, or None if the player cannot move.
+        """
+        if self.__search is not None:
+            return self.__search.choose_move(state, player_index)
+        if self.level == 2:
+            return self.__greedy_move(state, player_index)
+        return self.__random_move(state, player_index)
+
+    def close(self) -> None:
+        """
+        Release the worker processes of the engine, if any.
+        """
+        if isinstance(self.__search, MonteCarloSearch):
+            self.__search.close()
+
+    def __random_move(self, state: BoardState, player_index: int) -> Optional[Move]:
+        """
+        Choose a random move among the ones that get closer to the goal, or among all of them if there are none.
+
+        Args:
+            state (BoardState): The board state.
+            player_index (int): The index of the player to move.
+
+        Returns:
+            Optional[Move]: The chosen move, or None if the player cannot move.
+        """
+        moves = list(generate_moves(state, player_index))
+        if not moves:
+            return None
+        distances = goal_distances(state.get_num_players(), player_index)
+        forward_moves = [move for move in moves if distances[move[1]] < distances[move[0]]]
+        return self.__rng.choice(forward_moves or moves)
+
+    def __greedy_move(self, state: BoardState, player_index: int) -> Optional[Move]:
+        """
+        Move the piece closest to an enemy home as close to it as possible without going backwards.
+
+        The target is a free cell of an enemy home triangle if there is one, otherwise the whole triangles.
+
+        Args:
+            state (BoardState): The board state.
+            player_index (int): The index of the player to move.
+
+        Returns:
+            Optional[Move]: The chosen move, or None if the player cannot move.
+        """
+        moves_per_piece = defaultdict(list)
+        for source, destination in generate_moves(state, player_index):
+            moves_per_piece[source].append(destination)
+        if not moves_per_piece:
+            return None
+
+        num_of_players = state.get_num_players()
+        enemy_homes = [coord for other in range(num_of_players) if other != player_index for coord in TRIANGLES[other]]
+        free_cells = [coord for coord in enemy_homes if state.owner_at(coord[0], coord[1]) == EMPTY]
+        targets = tuple(free_cells[-1:] or enemy_homes)
+        distances = hop_distances(num_of_players, targets)
+
+        pieces = sorted(moves_per_piece, key=lambda cell: distances[cell])
+        for source in pieces:
+            destination = min(moves_per_piece[source], key=lambda cell: distances[cell])
+            if distances[destination] <= distances[source]:
+                return source, destination
+        source = pieces[0]
+        return source, min(moves_per_piece[source], key=lambda cell: distances[cell])
@@ -0,0 +1,49 @@
+import unittest
+from boardState import BoardState
+from computerPlayer import ComputerPlayer
+from evaluation import goal_distances, is_winning_move
+
+
+class TestComputerPlayer(unittest.TestCase):
+    def setUp(self):
+        self.state = BoardState(2)
+
+    def test_unknown_level(self):
+        with self.assertRaises(ValueError):
+            ComputerPlayer(5)
+
+    def test_random_move_goes_forward(self):
+        distances = goal_distances(2, 1)
+        computer = ComputerPlayer(1, seed=3)
+        for _ in range(10):
+            source, destination = computer.choose_move(self.state, 1)
+            self.assertLess(distances[destination], distances[source])
+
+    def test_random_moves_are_reproducible(self):
+        first = [ComputerPlayer(1, seed=8).choose_move(self.state, 0) for _ in range(3)]
+        second = [ComputerPlayer(1, seed=8).choose_move(self.state, 0) for _ in range(3)]
+        self.assertEqual(first, second)
+
+    def test_greedy_takes_a_winning_move(self):
+        self.state.move((3, 13), (5, 13))
+        self.state.move((13, 9), (4, 14))
+        source, destination = ComputerPlayer(2).choose_move(self.state, 1)
+        self.assertTrue(is_winning_move(self.state, destination, 1))
+
+    def test_state_is_left_unchanged(self):
+        owners = bytes(self.state.owners)
+        for level in (1, 2, 3):
+            ComputerPlayer(level, time_budget=0.02).choose_move(self.state, 0)
+            self.assertEqual(bytes(self.state.owners), owners)
+
+    def test_searches_have_a_finite_time_budget(self):
+        for level in (3, 4):
+            computer = ComputerPlayer(level)
+            self.assertIsNotNone(computer.time_budget)
+            self.assertGreater(computer.time_budget, 0)
+            computer.close()
+        self.assertEqual(ComputerPlayer(4, time_budget=0.5).time_budget, 0.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,204 @@
+from functools import lru_cache
+from typing import List, Tuple
+
+from boardLayout import TRIANGLES, build_cells
+from boardState import BoardState
+from boardTopology import get_topology
+from moveGenerator import piece_cells
+
+Coordinates = Tuple[int, int]
+
+# Score of a won position, well above any distance based score
+WIN_SCORE = 10000.0
+
+# How much more the piece closest to a goal counts than the others; a single piece entering a home wins the game
+CLOSEST_PIECE_WEIGHT = 4
+
+
+@lru_cache(maxsize=None)
+def home_owners(num_of_players: int) -> Tuple[int, ...]:
+    """
+    Get, for every cell id, the index of the player whose home triangle contains it.
+
+    Args:
+        num_of_players (int): The number of players in the game.
+
+    Returns:
+        Tuple[int, ...]: The index of the player owning the home of each cell, or -1 for the center cells.
+    """
+    _, starting_owners = build_cells(num_of_players)
+    return tuple(starting_owners)
+
+
+@lru_cache(maxsize=None)
+def hop_distances(num_of_players: int, targets: Tuple[Coordinates, ...]) -> Tuple[int, ...]:
+    """
+    Get the number of single steps from every cell to the nearest of some target cells.
+
+    The distances are found with a breadth first search over the board's neighbour tables, so they follow the
+    shape of the board, and are calculated only once per set of targets.
+
+    Args:
+        num_of_players (int): The number of players in the game.
+        targets (Tuple[Coordinates, ...]): The coordinates of the target cells.
+
+    Returns:
+        Tuple[int, ...]: The distance of each cell id to the nearest target, or the number of cells for a cell
+        that cannot reach any target.
+    """
+    cells, _ = build_cells(num_of_players)
+    steps = get_topology(num_of_players).steps
+    cell_ids = {coord: cell_id for cell_id, coord in enumerate(cells)}
+    distances = [len(cells)] * len(cells)
+    queue = [cell_ids[coord] for coord in targets if coord in cell_ids]
+    for cell in queue:
+        distances[cell] = 0
+    for cell in queue:
+        for neighbor in steps[cell]:
+            if distances[neighbor] > distances[cell] + 1:
+                distances[neighbor] = distances[cell] + 1
+                queue.append(neighbor)
+    return tuple(distances)
+
+
+@lru_cache(maxsize=None)
+def goal_distances(num_of_players: int, player_index: int) -> Tuple[int, ...]:
+    """
+    Get the number of single steps from every cell to the nearest home triangle of another player.
+
+    Args:
+        num_of_players (int): The number of players in the game.
+        player_index (int): The index of the player the distances are for.
+
+    Returns:
+        Tuple[int, ...]: The distance of each cell id to the player's goal.
+    """
+    return hop_distances(num_of_players, tuple(coord for other in range(num_of_players) if other != player_index
+                                               for coord in TRIANGLES[other]))
+
+
+def is_winning_move(state: BoardState, destination: int, player_index: int) -> bool:
+    """
+    Check if a piece of a player that lands on a cell wins the game.
+
+    Args:
+        state (BoardState): The board state.
+        destination (int): The id of the cell the piece lands on.
+        player_index (int): The index of the player that moved.
+
+    Returns:
+        bool: True if the cell is in the home triangle of another player.
+    """
+    owner = home_owners(state.get_num_players())[destination]
+    return owner != -1 and owner != player_index
+
+
+def progress(state: BoardState, player_index: int) -> int:
+    """
+    Measure how far a player still is from winning; lower is better.
+
+    Args:
+        state (BoardState): The board state.
+        player_index (int): The index of the player.
+
+    Returns:
+        int: The sum of the goal distances of the player's pieces, with the closest piece weighted extra.
+    """
+    distances = goal_distances(state.get_num_players(), player_index)
+    total = 0
+    closest = None
+    for cell in piece_cells(state, player_index):
+        distance = distances[cell]
+        total += distance
+        if closest is None or distance < closest:
+            closest = distance
+    return total + CLOSEST_PIECE_WEIGHT * (closest or 0)
+
+
+def evaluate(state: BoardState, player_index: int) -> float:
+    """
+    Score a position from the point of view of a player; higher is better.
+
+    Args:
+        state (BoardState): The board state.
+        player_index (int): The index of the player.
+
+    Returns:
+        float: The average progress of the other players minus the player's own progress.
+    """
+    others: List[int] = [progress(state, other) for other in range(state.get_num_players()) if other != player_index]
+    return sum(others) / len(others) - progress(state, player_index)
+
+
+class IncrementalEvaluator:
+    """
+    Evaluation of a position that is updated by the change of a single piece on every move.
+
+    For every player it keeps the sum of the goal distances of their pieces and how many pieces are at each
+    distance, so the progress of a player never has to be recalculated from the whole board.
+    """
+
+    def __init__(self, state: BoardState) -> None:
+        """
+        Initializes an IncrementalEvaluator object from a position.
+
+        Args:
+            state (BoardState): The board state to evaluate.
+        """
+        num_of_players = state.get_num_players()
+        self.__distances = [goal_distances(num_of_players, player) for player in range(num_of_players)]
+        longest = max(max(distances) for distances in self.__distances)
+        self.sums = [0] * num_of_players
+        self.pieces_at_distance = [[0] * (longest + 1) for _ in range(num_of_players)]
+        for cell, owner in enumerate(state.owners):
+            if owner:
+                distance = self.__distances[owner - 1][cell]
+                self.sums[owner - 1] += distance
+                self.pieces_at_distance[owner - 1][distance] += 1
+
+    def move(self, source: int, destination: int, player_index: int) -> None:
+        """
+        Update the evaluation after a piece of a player moved.
+
+        Args:
+            source (int): The id of the cell the piece moved from.
+            destination (int): The id of the cell the piece moved to.
+            player_index (int): The index of the player the piece belongs to.
+        """
+        distances = self.__distances[player_index]
+        old_distance = distances[source]
+        new_distance = distances[destination]
+        self.sums[player_index] += new_distance - old_distance
+        counts = self.pieces_at_distance[player_index]
+        counts[old_distance] -= 1
+        counts[new_distance] += 1
+
+    def progress(self, player_index: int) -> int:
+        """
+        Measure how far a player still is from winning; lower is better.
+
+        Args:
+            player_index (int): The index of the player.
+
+        Returns:
+            int: The same value as progress() for the current position.
+        """
+        closest = 0
+        for distance, count in enumerate(self.pieces_at_distance[player_index]):
+            if count:
+                closest = distance
+                break
+        return self.sums[player_index] + CLOSEST_PIECE_WEIGHT * closest
+
+    def evaluate(self, player_index: int) -> float:
+        """
+        Score the current position from the point of view of a player; higher is better.
+
+        Args:
+            player_index (int): The index of the player.
+
+        Returns:
+            float: The same value as evaluate() for the current position.
+        """
+        others = [self.progress(other) for other in range(len(self.sums)) if other != player_index]
+        return sum(others) / len(others) - self.progress(player_index)
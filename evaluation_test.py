@@ -0,0 +1,39 @@
+import random
+import unittest
+from boardState import BoardState
+from evaluation import IncrementalEvaluator, evaluate, goal_distances, hop_distances, progress
+from moveGenerator import generate_moves
+
+
+class TestEvaluation(unittest.TestCase):
+    def setUp(self):
+        self.state = BoardState(2)
+
+    def test_hop_distances(self):
+        distances = hop_distances(2, ((0, 12),))
+        cells = self.state.get_cells()
+        self.assertEqual(distances[cells.index((0, 12))], 0)
+        self.assertEqual(distances[cells.index((2, 12))], 2)
+        self.assertEqual(distances[cells.index((16, 12))], 16)
+
+    def test_goal_distances_are_zero_in_the_goal(self):
+        distances = goal_distances(2, 1)
+        for cell, coord in enumerate(self.state.get_cells()):
+            if coord in self.state.get_player_locations(0):
+                self.assertEqual(distances[cell], 0)
+
+    def test_incremental_evaluation_matches_full_evaluation(self):
+        rng = random.Random(11)
+        evaluator = IncrementalEvaluator(self.state)
+        for turn in range(40):
+            player_index = turn % 2
+            source, destination = rng.choice(list(generate_moves(self.state, player_index)))
+            self.state.move_cells(source, destination)
+            evaluator.move(source, destination, player_index)
+            for player in range(2):
+                self.assertEqual(evaluator.progress(player), progress(self.state, player))
+                self.assertEqual(evaluator.evaluate(player), evaluate(self.state, player))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,10 +9,8 @@ Libraries required:
 - tkinter.ttk (for themed widgets)
 - tkinter.messagebox (for message boxes)
 - tkinter.toplevel (for creating additional windows)
-- pyttsx3 (for text-to-speech functionality)
-- winsound (for playing sound effects)
-- random (for generating random moves)
-- math (for mathematical calculations)
+- pyttsx3 (for text-to-speech functionality; optional, the game plays silently without it)
+- winsound (for playing sound effects on Windows; on Linux the beep program or the terminal bell is used)
 - collections.defaultdict (for creating a default dictionary)
 -copy (for deep copying lists): Python's built-in library used for creating deep copies of objects.
 -unittest: This is the standard library for writing and running tests in Python. It comes bundled with Python, so there's no need to install it separately.
@@ -20,31 +18,44 @@ Libraries required:
 """
 
 # Import necessary libraries
-import math
 import sys
 from collections import defaultdict
-import random
-import pyttsx3
 from typing import List, Tuple, Optional
 import tkinter as tk
 from playerNamesScreen import PlayerNamesScreen
 from gameOpeningScreen import GameOpeningScreen
 from tkinter import messagebox, ttk
 from player import Player
+from boardState import BoardState
+from computerPlayer import ComputerPlayer
+from gameLog import LOG_HEADER, WINNER_LINE_PREFIX, GameLogger
+from gameSnapshot import (DEFAULT_SNAPSHOT_INTERVAL, GameSnapshot, PlayerSnapshot, restore_game,
+                          snapshot_file_name, write_snapshot)
+from replayFormat import is_replay_file, load_game
+from replayViewer import watch_replay
+from speechWorker import SpeechWorker
+from soundEffects import WIN_EFFECT, WRONG_EFFECT, SoundEffects
+from boardLayout import COLORS, TRIANGLES
+from canvasBoard import CanvasBoard
+from cellRenderer import CellRenderer
 from tkinter import Toplevel, Button, Label
-import winsound
 import os
 from datetime import datetime
 Coordinates=Tuple[int,int]
 NUM_ROWS = 17
 NUM_COLUMNS = 25
+# Ways to draw the board: a tk.Button per cell, or an oval per cell on a single canvas
+BOARD_RENDERERS = ["buttons", "canvas"]
 
 
 class Game:
-    def __init__(self) -> None:
+    def __init__(self, board_renderer: str = "buttons") -> None:
         """
         Initialize the game.
 
+        Parameters:
+            board_renderer (str): How the board is drawn, one of BOARD_RENDERERS.
+
         Attributes:
             __players (list): List to store player objects.
             current_player_index (int): Index of the current player.
@@ -52,11 +63,14 @@ class Game:
             __num_players (int): Number of players in the game.
             __board_of_buttons (list): List to store buttons representing the game board.
             __board_coord (list): List to store coordinates of buttons on the game board.
+            __button_index (list): NUM_ROWS x NUM_COLUMNS table mapping each board coordinate to its button.
             __current_colors_coord (defaultdict): Dictionary to store coordinates for each color.
             __root (tk.Tk): Root window of the game.
             colors (list): List of color options for players.
             __current_turn (int): Current turn count.
-            engine (pyttsx3.engine.Engine): Text-to-speech engine.
+            speech (SpeechWorker): Speaks the announcements with pyttsx3 on a worker thread, so the board never
+                waits for them.
+            sounds (SoundEffects): Plays the sound effects on a worker thread, with the backend of this machine.
             __during_turn (bool): Flag indicating whether it's during a player's turn.
             current_turn_possible_moves (list): List to store possible moves during a turn.
             __current_coord_to_move (tuple): Coordinates of the current piece to move.
@@ -69,19 +83,30 @@ class Game:
             current_datetime (str): Current date and time formatted as "YYYY-MM-DD_HH-MM-SS".
             file_name (str): File name for storing the game log.
             log_file_path (str): File path for storing the game log.
-            __hard_level (bool): Flag indicating whether the game is set to hard level when playing against the computer.
+            __logger (GameLogger): Buffered writer of the game log, holding a single handle to the log file.
+            __computer (ComputerPlayer): The computer opponent when playing against it, of the level chosen on the
+                opening screen: 1 random, 2 greedy, 3 alpha-beta search, 4 Monte Carlo tree search.
+            __state (BoardState): Headless state of the board that the buttons are rendered from.
+            snapshot_interval (int): Number of moves between two snapshots of the game, 0 to only take one on exit.
+            __moves_since_snapshot (int): Number of moves logged since the last snapshot.
+            board_renderer (str): How the board is drawn: "buttons" or "canvas", see CanvasBoard.
+            __renderer (CellRenderer): Repaints the changed cells of the board once the event loop is idle.
         """
+        if board_renderer not in BOARD_RENDERERS:
+            raise ValueError(f"Unknown board renderer {board_renderer}, expected one of {BOARD_RENDERERS}")
         self.__players=[]
         self.current_player_index = 0
         self.log = []
         self.__num_players =0
         self.__board_of_buttons = []
         self.__board_coord = []
+        self.__button_index = [[None] * NUM_COLUMNS for _ in range(NUM_ROWS)]
         self.__current_colors_coord = defaultdict(list)
         self.__root=None
-        self.colors=["blue", "yellow", "red", "green", "purple", "orange"]
+        self.colors=list(COLORS)
         self.__current_turn=0
-        self.engine = pyttsx3.init()
+        self.speech = SpeechWorker()
+        self.sounds = SoundEffects()
         self.__during_turn=False
         self.current_turn_possible_moves=[]
         self.__current_coord_to_move=()
@@ -94,7 +119,13 @@ class Game:
         self.current_datetime = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
         self.file_name=f"game_log_{self.current_datetime}.txt"
         self.log_file_path = os.path.join(os.path.dirname(__file__), f"game_log_{self.current_datetime}.txt")
-        self.__hard_level = False
+        self.__logger = GameLogger(self.file_name)
+        self.__computer = None
+        self.__state = None
+        self.snapshot_interval = DEFAULT_SNAPSHOT_INTERVAL
+        self.__moves_since_snapshot = 0
+        self.board_renderer = board_renderer
+        self.__renderer = None
 
     def show_rules(self) -> None:
         """
@@ -137,93 +168,85 @@ class Game:
                 return
         messagebox.showinfo("Have fun!")
 
-    def create_board(self, num_of_players: int) -> None:
+    def create_board(self, num_of_players: int, state: Optional[BoardState] = None) -> None:
         """
         Create the Chinese Checkers board layout with buttons.
+
+        The buttons are created in a single pass over the cells of the board layout, which is computed once per
+        number of players and shared with the board state, rematches and replays. Every button is created with the
+        color of its cell in the board state, so a resumed game is painted once.
+
+        Parameters:
+            num_of_players (int): The number of players in the game.
+            state (Optional[BoardState]): The board state to show, e.g. of a resumed game; the starting position
+                if not given.
         """
         try:
             self.__root = tk.Tk()
+            self.__root.protocol("WM_DELETE_WINDOW", self.on_close)
         except Exception as e:
             messagebox.showerror("Error", f"An error occurred while creating the game board: {str(e)}")
             return
-
-        # Define colors for different player zones
-        colors = self.colors
-        # Define positions for each player
-        positions = [
-            [(0, 12), (1, 11), (1, 13), (2, 10), (2, 12), (2, 14), (3, 9), (3, 11), (3, 13), (3, 15)],
-            [(16, 12), (15, 11), (15, 13), (14, 10), (14, 14), (14, 12), (13, 9), (13, 11), (13, 13), (13, 15)],
-            [(9, 3), (10, 2), (10, 4), (11, 1), (11, 3), (11, 5), (12, 0), (12, 2), (12, 4), (12, 6)],
-            [(7, 3), (6, 2), (6, 4), (5, 1), (5, 3), (5, 5), (4, 0), (4, 2), (4, 4), (4, 6)],
-            [(9, 21), (10, 20), (10, 22), (11, 19), (11, 21), (11, 23), (12, 18), (12, 20), (12, 22), (12, 24)],
-            [(7, 21), (6, 20), (6, 22), (5, 19), (5, 21), (5, 23), (4, 18), (4, 20), (4, 22), (4, 24)]
-        ]
-
-        # Determine the number of colorful triangles based on the number of players
-        num_colorful_triangles = min(num_of_players, len(colors))
+        self.__state = state if state is not None else BoardState(num_of_players)
+        # Coordinate -> button table, filled as the buttons are created
+        self.__button_index = [[None] * NUM_COLUMNS for _ in range(NUM_ROWS)]
+        # Home coordinates of every color in the game
+        for i in range(min(num_of_players, len(self.colors))):
+            self.__current_colors_coord[self.colors[i]].extend(TRIANGLES[i])
+        if self.board_renderer == "canvas":
+            self.create_canvas_board(num_of_players)
+            self.create_renderer()
+            return
 
         try:
-            # Create buttons for each player's positions
-            for i in range(num_colorful_triangles):
-                for p in positions[i]:
-                    if p not in self.__board_coord:  # Check if the position is not already occupied by a button
-                        try:
-                            button = tk.Button(self.__root, text="", width=2, bg=colors[i])
-                            button.grid(row=p[0], column=p[1])
-                            button.bind("<Button-1>",
-                                        lambda event, row=p[0], col=p[1]: self.handle_button_click(row,
-                                                                                                   col))  # Bind the button click event
-                            self.__board_of_buttons.append(button)
-                            self.__board_coord.append(p)
-                            self.__current_colors_coord[colors[i]].append(p)
-                        except Exception as e:
-                            messagebox.showerror("Error", f"An error occurred while creating a button: {str(e)}")
-                            return
-
-            # Create additional buttons for special conditions
-            for color in [0, 3]:
-                for coord in positions[color]:
-                    for i in range(11):
-                        # Check if the position is not occupied by any player and is in the base area
-                        if (coord[0] + i, coord[1] + i) not in sum(positions, []):
-                            if self.is_button_in_base(coord[0] + i, coord[1] + i):
-                                if (coord[0] + i, coord[
-                                                      1] + i) not in self.__board_coord:  # Check if the position is not already occupied by a button
-                                    try:
-                                        button = tk.Button(self.__root, text="", width=2, bg="white")
-                                        button.grid(row=coord[0] + i, column=coord[1] + i)
-                                        button.bind("<Button-1>",
-                                                    lambda event, row=coord[0] + i,
-                                                           col=coord[1] + i: self.handle_button_click(
-                                                        row, col))  # Bind the button click event
-                                        self.__board_of_buttons.append(button)
-                                        self.__board_coord.append((coord[0] + i, coord[1] + i))
-                                    except Exception as e:
-                                        messagebox.showerror("Error",
-                                                             f"An error occurred while creating a button: {str(e)}")
-                                        return
-
-            # Create additional buttons for the center area
-            for i in range(9):
-                row_val = 4 + i
-                col_val = 8 + i
-                if (
-                        row_val,
-                        col_val) not in self.__board_coord:  # Check if the position is not already occupied by a button
-                    try:
-                        button = tk.Button(self.__root, text="", width=2, bg="white")
-                        button.grid(row=row_val, column=col_val)
-                        button.bind("<Button-1>",
-                                    lambda event, row=row_val, col=col_val: self.handle_button_click(row,
-                                                                                                     col))  # Bind the button click event
-                        self.__board_coord.append((row_val, col_val))
-                        self.__board_of_buttons.append(button)
-                    except Exception as e:
-                        messagebox.showerror("Error", f"An error occurred while creating a button: {str(e)}")
-                        return
+            # A single pass over the cells of the board layout, which is computed once per number of players
+            for cell, (row, col) in enumerate(self.__state.get_cells()):
+                button = tk.Button(self.__root, text="", width=2, bg=self.__state.cell_color(cell))
+                button.grid(row=row, column=col)
+                button.bind("<Button-1>",
+                            lambda event, row=row, col=col: self.handle_button_click(row, col))  # Bind the button click event
+                self.__board_of_buttons.append(button)
+                self.__board_coord.append((row, col))
+                self.__button_index[row][col] = button
         except Exception as e:
             messagebox.showerror("Error", f"An error occurred while creating the game board: {str(e)}")
             return
+        self.create_renderer()
+
+    def create_renderer(self) -> None:
+        """
+        Create the renderer that keeps the buttons painted with the board state.
+
+        The buttons were just created with the colors of the board state, so nothing is repainted until a cell
+        changes.
+        """
+        cells = self.__state.get_cells()
+        self.__renderer = CellRenderer(self.__root, [self.__button_index[row][col] for row, col in cells],
+                                       self.__state.cell_color,
+                                       [self.__state.cell_color(cell) for cell in range(len(cells))])
+
+    def create_canvas_board(self, num_of_players: int) -> None:
+        """
+        Create the board as one oval per cell on a single canvas.
+
+        The cells of the canvas stand in for the buttons: they are stored in the same tables and get and set their
+        color through the same "bg" option, so the rest of the game does not depend on the renderer.
+
+        Parameters:
+            num_of_players (int): The number of players in the game.
+        """
+        try:
+            cells = self.__state.get_cells()
+            board = CanvasBoard(self.__root, cells, [self.__state.cell_color(cell) for cell in range(len(cells))])
+            board.pack(padx=10, pady=10)
+            for row, col in cells:
+                cell = board.cell(row, col)
+                cell.bind("<Button-1>", lambda event, row=row, col=col: self.handle_button_click(row, col))
+                self.__board_of_buttons.append(cell)
+                self.__board_coord.append((row, col))
+                self.__button_index[row][col] = cell
+        except Exception as e:
+            messagebox.showerror("Error", f"An error occurred while creating the game board: {str(e)}")
 
     def get_button_at_location(self, row: int, col: int) -> Optional[tk.Button]:
         """
@@ -237,12 +260,10 @@ class Game:
             Optional[tk.Button]: The button at the specified location, or None if no button is found at that location.
         """
         try:
-            # Iterate over all buttons and check their positions
-            for button, (button_row, button_col) in zip(self.__board_of_buttons, self.__board_coord):
-                # Check if the button's row and column match the given row and column
-                if button_row == row and button_col == col:
-                    return button
-            # If no button matches the given row and column, return None
+            # Look the button up in the coordinate table built by create_board
+            if 0 <= row < NUM_ROWS and 0 <= col < NUM_COLUMNS:
+                return self.__button_index[row][col]
+            # Coordinates outside the table have no button
             return None
         except Exception as e:
             messagebox.showerror("Error",
@@ -281,31 +302,66 @@ class Game:
         except Exception as e:
             messagebox.showerror("Error", f"An error occurred while setting the color of the button: {str(e)}")
 
-    def is_button_in_base(self, row: int, col: int) -> bool:
+    def get_board_state(self) -> BoardState:
+        """
+        Get the headless state of the board.
+
+        Returns:
+            BoardState: The board state the buttons are rendered from.
+        """
+        return self.__state
+
+    def render_cell(self, row: int, col: int) -> None:
         """
-        Check if a button is in the base area of any player.
+        Mark the button at a specific location to be painted with the color of the board state.
+
+        The button is repainted with the other changed buttons once the event loop is idle, and only if its color
+        changed.
 
         Parameters:
             row (int): The row index of the button.
             col (int): The column index of the button.
+        """
+        cell = self.__state.cell_id(row, col)
+        if cell is not None and self.__renderer is not None:
+            self.__renderer.mark(cell)
 
-        Returns:
-            bool: True if the button is in the base area of any player, False otherwise.
+    def render_board(self) -> None:
+        """
+        Mark all the buttons on the board to be painted with the colors of the board state.
+        """
+        if self.__renderer is not None:
+            self.__renderer.mark_all()
+
+    def highlight_moves(self, coords: List[Coordinates]) -> None:
+        """
+        Highlight the cells a selected piece can move to.
+
+        Parameters:
+            coords (List[Coordinates]): The coordinates of the cells.
+        """
+        self.__renderer.highlight(self.__state.cell_id(row, col) for row, col in coords)
+
+    def clear_highlights(self) -> None:
+        """
+        Paint the highlighted cells back with the colors of the board state.
+        """
+        self.__renderer.clear_highlights()
+
+    def move_piece(self, current_coord: Coordinates, dest_coord: Coordinates) -> None:
+        """
+        Move a piece on the board state and repaint the two buttons involved.
+
+        Parameters:
+            current_coord (Coordinates): The coordinate the piece moves from.
+            dest_coord (Coordinates): The coordinate the piece moves to.
         """
         try:
-            # Check for base area boundaries for each player
-            for i in range(4):
-                if row == 4 + i and 7 - i < col < 17 + i:
-                    return True
-            for i in range(5):
-                if row == 8 + i and 3 + i < col < 22 - i:
-                    return True
-            return False
+            self.__state.move(current_coord, dest_coord)
+            self.render_cell(current_coord[0], current_coord[1])
+            self.render_cell(dest_coord[0], dest_coord[1])
         except Exception as e:
-            messagebox.showerror("Error",
-                                 f"An error occurred while checking if the button is in the base area: {str(e)}")
-            return False
-
+            messagebox.showerror("Error", f"An error occurred while moving a piece: {str(e)}")
 
     def calculate_possible_moves(self, current_row: int, current_col: int) -> List[Coordinates]:
         """
@@ -318,66 +374,11 @@ class Game:
         Returns:
             List[Coordinates]: A list of coordinates representing possible moves.
         """
-        possible_moves = []
-        visited = defaultdict(bool)  # Dictionary to track visited buttons
-
-        # Define a recursive function to explore diagonal jumps
-        def explore_diagonals(row: int, col: int, direction: Tuple[int, int], prev_color: str) -> None:
-            """
-            Recursive function to explore diagonal jumps.
-
-            Args:
-                row (int): The current row.
-                col (int): The current column.
-                direction (Tuple[int, int]): The direction to explore.
-                prev_color (str): The color of the previously visited button.
-            """
-            try:
-                # Calculate the next button coordinates in the given direction
-                next_row = row + direction[0]
-                next_col = col + direction[1]
-
-                # Get the button at the next coordinates
-                next_button = self.get_button_at_location(next_row, next_col)
-                if next_button is not None:  # Ensure the button exists
-                    # Get the color of the next button
-                    next_color = self.get_button_color(next_button)
-                    # Check if the next button is empty or the same color as the previous one
-                    if next_color == "white" or next_color == prev_color:
-                        # Explore further in the same direction
-                        explore_diagonals(next_row, next_col, direction, prev_color)
-                    elif next_color != prev_color:
-                        # If the next button is a different color and the button beyond it is white, it's a possible move
-                        btn_after_next = self.get_button_at_location(next_row + direction[0], next_col + direction[1])
-                        if btn_after_next is not None:
-                            if self.get_button_color(btn_after_next) == "white":
-                                possible_moves.append((next_row + direction[0], next_col + direction[1]))
-                                # Explore further for double jumps
-                                explore_diagonals(next_row + direction[0], next_col + direction[1], direction,
-                                                  prev_color)
-                    # Mark the current button as visited
-                    visited[(row, col)] = True
-            except Exception as e:
-                print(f"An error occurred: {str(e)}")
-
-        # Define the directions for diagonal jumps
-        directions = [(1, -1), (1, 1), (-1, -1), (-1, 1)]
-
-        # Explore diagonal jumps in all directions
-        for direction in directions:
-            try:
-                # Get the current button
-                current_button = self.get_button_at_location(current_row, current_col)
-                if current_button is not None:  # Ensure the button exists
-                    # Get the color of the current button
-                    current_color = self.get_button_color(current_button)
-                    explore_diagonals(current_row, current_col, direction, current_color)
-            except Exception as e:
-                print(f"An error occurred: {str(e)}")
-
-        # Return the list of possible moves
-        four_direct=self.four_diag_white(current_row,current_col)
-        return four_direct+possible_moves
+        try:
+            return self.__state.possible_moves(current_row, current_col)
+        except Exception as e:
+            print(f"An error occurred: {str(e)}")
+            return []
 
     def four_diag_white(self, row: int, col: int) -> List[Tuple[int, int]]:
         """
@@ -391,32 +392,7 @@ class Game:
             List[Tuple[int, int]]: A list of coordinates of white buttons in the four diagonal directions.
         """
         try:
-            # Check upper left diagonal
-            four_direc = []
-            btn = self.get_button_at_location(row - 1, col - 1)
-            if btn is not None:
-                if self.get_button_color(btn) == "white":
-                    four_direc.append((row - 1, col - 1))
-
-            # Check upper right diagonal
-            btn = self.get_button_at_location(row - 1, col + 1)
-            if btn is not None:
-                if self.get_button_color(btn) == "white":
-                    four_direc.append((row - 1, col + 1))
-
-            # Check lower left diagonal
-            btn = self.get_button_at_location(row + 1, col - 1)
-            if btn is not None:
-                if self.get_button_color(btn) == "white":
-                    four_direc.append((row + 1, col - 1))
-
-            # Check lower right diagonal
-            btn = self.get_button_at_location(row + 1, col + 1)
-            if btn is not None:
-                if self.get_button_color(btn) == "white":
-                    four_direc.append((row + 1, col + 1))
-
-            return four_direc
+            return self.__state.adjacent_empty_cells(row, col)
         except Exception as e:
             messagebox.showerror("Error", f"An error occurred while checking diagonals: {str(e)}")
             return []
@@ -438,147 +414,32 @@ class Game:
         except Exception as e:
             messagebox.showerror("Error", f"An error occurred while displaying custom message: {str(e)}")
 
-    def filter_coordinates(self, coordinates_list: List[Tuple[int, int]], reference_coord: Tuple[int, int]) -> List[
-        Tuple[int, int]]:
-        """
-        This function takes a list of coordinates and an additional coordinate and returns a list with all coordinates smaller than the given coordinate.
-
-        Parameters:
-            coordinates_list (List[Tuple[int, int]]): The list of coordinates.
-            reference_coord (Tuple[int, int]): The coordinate to compare to.
-
-        Returns:
-            List[Tuple[int, int]]: The list of coordinates smaller than the given coordinate.
-        """
-        try:
-            filtered_coords = [coord for coord in coordinates_list if
-                               coord[0] < reference_coord[0] and coord[1] < reference_coord[1]]
-            return filtered_coords
-        except Exception as e:
-            messagebox.showerror("Error", f"An error occurred while filtering coordinates: {str(e)}")
-            return []
-
-    def distance(self, coord1: Tuple[int, int], coord2: Tuple[int, int]) -> float:
-        """
-        Calculates the distance between two points.
-
-        Parameters:
-            coord1 (Tuple[int, int]): The coordinates of the first point.
-            coord2 (Tuple[int, int]): The coordinates of the second point.
-
-        Returns:
-            float: The distance between the two points.
-        """
-        try:
-            return math.sqrt((coord1[0] - coord2[0]) ** 2 + (coord1[1] - coord2[1]) ** 2)
-        except Exception as e:
-            messagebox.showerror("Error", f"An error occurred while calculating distance: {str(e)}")
-            return 0.0
-
-    def closest_and_farthest_enemy_locations(self, enemy_coords: List[Tuple[int, int]],
-                                             player_coords: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
-        """
-        Returns a list of the closest and farthest locations from the enemy.
-
-        Parameters:
-            enemy_coords (List[Tuple[int, int]]): A list of enemy coordinates.
-            player_coords (List[Tuple[int, int]]): A list of player coordinates.
-
-        Returns:
-            List[Tuple[int, int]]: A list containing the closest and farthest locations from the enemy.
-        """
-        try:
-            min_distance = float('inf')
-            max_distance = float('-inf')
-            closest_locations = []
-            farthest_locations = []
-
-            # Calculate distances from each player coordinate to enemy coordinates
-            distances = []
-            for player_coord in player_coords:
-                min_dist = float('inf')
-                for enemy_coord in enemy_coords:
-                    dist = self.distance(player_coord, enemy_coord)
-                    if dist < min_dist:
-                        min_dist = dist
-                distances.append((player_coord, min_dist))
-
-            # Sort the list by distance from smallest to largest
-            distances.sort(key=lambda x: x[1])
-
-            # Group of the closest locations
-            closest_locations = [coord for coord, _ in distances]
-
-            # Group of the farthest locations
-            farthest_locations = [coord for coord, _ in reversed(distances)]
-
-            return closest_locations + farthest_locations
-        except Exception as e:
-            messagebox.showerror("Error",
-                                 f"An error occurred while calculating closest and farthest enemy locations: {str(e)}")
-            return []
-
     def computer_move(self) -> None:
         """
         Performs a move for the computer player.
 
-        This function first determines the move strategy based on the game's difficulty level.
-        If the game is set to hard level, the computer player calculates the closest enemy locations
-        and selects its move based on reaching the closest enemy. Otherwise, it chooses a random
-        move from its available options.
+        The move is chosen by the computer opponent on the headless board state, according to the game's
+        difficulty level: at level 4 it runs a Monte Carlo tree search on all the CPUs, at level 3 an alpha-beta
+        search with a time budget per move, at level 2 it moves the piece closest to the enemy's home towards it,
+        and otherwise it chooses a random move that goes forward.
 
-        After determining the source and destination coordinates for the move, the function updates
-        the GUI by changing the colors of the buttons representing the current and destination locations.
+        After the move is chosen, the function updates the GUI by changing the colors of the buttons representing
+        the current and destination locations.
 
         Finally, the function updates the game state by moving the computer player's piece and logging the move.
         """
         try:
             comp_player = self.__players[self.current_player_index]
 
-            if self.__hard_level:
-                lst_of_closest_enemy = []
-                # Find the closest enemy locations
-                for coord in self.__players[0].get_player_home_locations():
-                    current_btn = self.get_button_at_location(coord[0], coord[1])
-                    color = self.get_button_color(current_btn)
-                    if color == "white":
-                        lst_of_closest_enemy = [coord]
-                if lst_of_closest_enemy == []:
-                    lst_of_closest_enemy = self.__players[0].get_player_home_locations()
-                lst_of_coords_from_closest = self.closest_and_farthest_enemy_locations(lst_of_closest_enemy,
-                                                                                       self.__players[
-                                                                                           1].get_player_current_locations())
-                current_coord = lst_of_coords_from_closest[0]
-                possible_moves_per_current_coord = self.calculate_possible_moves(current_coord[0], current_coord[1])
-                lst_from_closest_dest = self.closest_and_farthest_enemy_locations(lst_of_closest_enemy,
-                                                                                  possible_moves_per_current_coord)
-                dest_coord = lst_from_closest_dest[0]
-                i = 0
-                # Move towards the closest enemy location
-                while dest_coord[0] > current_coord[0]:
-                    i = i + 1
-                    current_coord = lst_of_coords_from_closest[i]
-                    possible_moves_per_current_coord = self.calculate_possible_moves(current_coord[0], current_coord[1])
-                    lst_from_closest_dest = self.closest_and_farthest_enemy_locations(
-                        self.__players[0].get_player_home_locations(), possible_moves_per_current_coord)
-                    if lst_from_closest_dest != []:
-                        dest_coord = lst_from_closest_dest[0]
-                    if i == len(lst_of_coords_from_closest) - 1:
-                        i = 0
-            else:
-                # Randomly choose a move from available options
-                current_coord = random.choice(comp_player.get_player_current_locations())
-                comp_possible_moves = self.calculate_possible_moves(current_coord[0], current_coord[1])
-                while comp_possible_moves == [] or self.filter_coordinates(comp_possible_moves, current_coord) == []:
-                    current_coord = random.choice(comp_player.get_player_current_locations())
-                    comp_possible_moves = self.calculate_possible_moves(current_coord[0], current_coord[1])
-                dest_coord = random.choice(self.filter_coordinates(comp_possible_moves, current_coord))
-
-            # Update GUI with button color changes
-            current_btn = self.get_button_at_location(current_coord[0], current_coord[1])
-            dest_btn = self.get_button_at_location(dest_coord[0], dest_coord[1])
-            self.set_button_color(current_btn, "white")
-            self.set_button_color(dest_btn, self.__players[self.current_player_index].get_color())
+            move = self.__computer.choose_move(self.__state, self.current_player_index)
+            if move is None:
+                # The computer is stuck and passes its turn
+                return
+            cells = self.__state.get_cells()
+            current_coord, dest_coord = cells[move[0]], cells[move[1]]
+
+            # Update the board state and repaint the buttons involved
+            self.move_piece(current_coord, dest_coord)
 
             # Move the computer player's piece and log the move
             comp_player.move_coord(current_coord, dest_coord)
@@ -609,7 +470,8 @@ class Game:
         turn, it displays the game results accordingly.
         """
         try:
-            if self.get_button_color(self.get_button_at_location(row, col)) in ["blue", "magenta"]:
+            if self.__state.color_at(row, col) == "blue" or (
+                    self.__during_turn and (row, col) in self.current_turn_possible_moves):
                 if not self.__during_turn:
                     self.__current_btn_to_move = self.get_button_at_location(row, col)
                     self.__current_coord_to_move = (row, col)
@@ -617,37 +479,20 @@ class Game:
                     if self.current_turn_possible_moves == []:
                         self.show_custom_message("There's no options to move from here, try another place")
                         return
-                    for coord in self.current_turn_possible_moves:
-                        btn = self.get_button_at_location(coord[0], coord[1])
-                        self.set_button_color(btn, "magenta")
+                    self.highlight_moves(self.current_turn_possible_moves)
                     self.__during_turn = not self.__during_turn
                 else:
-                    dest_btn = self.get_button_at_location(row, col)
-                    if self.get_button_color(dest_btn) == "magenta":
+                    if (row, col) in self.current_turn_possible_moves:
                         # Move the piece to the selected destination if it's a valid move
-                        self.set_button_color(dest_btn, self.colors[self.current_player_index])
-                        for coord in self.current_turn_possible_moves:
-                            btn = self.get_button_at_location(coord[0], coord[1])
-                            if self.get_button_color(btn) == "magenta":
-                                self.set_button_color(btn, "white")
+                        self.move_piece(self.__current_coord_to_move, (row, col))
+                        self.clear_highlights()
                         self.log_move(self.__players[self.current_player_index].get_name(),
                                       self.__players[self.current_player_index].get_color(),
                                       f"Selected piece at ({self.__current_coord_to_move[0]}, {self.__current_coord_to_move[1]})",
                                       (row, col))
-                        self.set_button_color(self.__current_btn_to_move, "white")
                         self.__during_turn = not self.__during_turn
-                        if self.is_winner():
-                            self.win_sound()
-                            # Update players' stats accordingly
-                            self.__players[self.current_player_index].update_stats("win")
-                            for player in self.__players:
-                                if player is not self.__players[self.current_player_index]:
-                                    player.update_stats("loss")
-                            with open("game_log.txt", "a") as log_file:
-                                log_file.write(
-                                    "The winner is: " + self.__players[self.current_player_index].get_name() + "\n")
-                            # Display game results
-                            self.display_game_results()
+                        if self.end_game_if_won():
+                            return
                         # Switch to the next player's turn
                         if self.current_player_index == self.__num_players - 1:
                             self.current_player_index = 0
@@ -655,15 +500,8 @@ class Game:
                             self.current_player_index += 1
                         self.computer_move()
                         # Check if there's a winner after the move
-                        if self.is_winner():
-                            self.win_sound()
-                            # Update players' stats accordingly
-                            self.__players[self.current_player_index].update_stats("win")
-                            for player in self.__players:
-                                if player is not self.__players[self.current_player_index]:
-                                    player.update_stats("loss")
-                            # Display game results
-                            self.display_game_results()
+                        if self.end_game_if_won():
+                            return
                         # Switch to the next player's turn
                         if self.current_player_index == self.__num_players - 1:
                             self.current_player_index = 0
@@ -696,9 +534,12 @@ class Game:
         """
         try:
             timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")  # Get current timestamp
-            with open(self.file_name, "a") as log_file:
-                log_file.write(
-                    f"{timestamp} - Player: {player_name}. Color: {color}. Selected button: {selected_button}. Destination button: {destination_button}\n")
+            self.__logger.write(
+                f"{timestamp} - Player: {player_name}. Color: {color}. Selected button: {selected_button}. Destination button: {destination_button}\n")
+            self.__moves_since_snapshot += 1
+            if self.snapshot_interval and self.__moves_since_snapshot >= self.snapshot_interval:
+                # The move is logged by the current player, the turn goes to the next one
+                self.save_snapshot((self.current_player_index + 1) % self.__num_players)
         except Exception as e:
             messagebox.showerror("Error", f"An error occurred while logging the move: {str(e)}")
         # try:
@@ -708,6 +549,53 @@ class Game:
         # except Exception as e:
         #     messagebox.showerror("Error", f"An error occurred while logging the move: {str(e)}")
 
+    def save_snapshot(self, current_player_index: Optional[int] = None) -> None:
+        """
+        Write a snapshot of the game next to its log, replacing the previous one.
+
+        The log is written out first, so the snapshot records how much of the log it covers and a resumed game
+        only replays the moves logged after it.
+
+        Parameters:
+            current_player_index (Optional[int]): The index of the player whose turn it is, the current player if
+                not given.
+        """
+        if current_player_index is None:
+            current_player_index = self.current_player_index
+        players = [PlayerSnapshot(player.get_name(), player.get_color(), self.__state.get_player_locations(i),
+                                  player.get_wins(), player.get_losses())
+                   for i, player in enumerate(self.__players)]
+        snapshot = GameSnapshot(self.__num_players, bytes(self.__state.owners), current_player_index, players,
+                                self.__computer.level if self.__computer is not None else 0, self.against_comp,
+                                self.__logger.flushed_size())
+        write_snapshot(snapshot_file_name(self.file_name), snapshot)
+        self.__moves_since_snapshot = 0
+
+    def on_close(self) -> None:
+        """
+        Handle the closing of the game window: take a last snapshot of the game, close the log and the window.
+        """
+        try:
+            if self.__state is not None:
+                self.save_snapshot()
+            self.__logger.close()
+        except Exception as e:
+            print(f"An error occurred while saving the game: {e}")
+        self.speech.close()
+        self.sounds.close()
+        self.close_computer()
+        self.__root.destroy()
+
+    def close_computer(self) -> None:
+        """
+        Shut down the worker processes of the computer opponent, if there is one.
+        """
+        try:
+            if self.__computer is not None:
+                self.__computer.close()
+        except Exception as e:
+            print(f"An error occurred while closing the computer player: {e}")
+
     def handle_button_click(self, row: int, col: int) -> None:
         """
         Handle button click event.
@@ -737,7 +625,7 @@ class Game:
                 if not self.__during_turn:  # Check if it's not currently any player's turn
                     # Check if it's the current player's turn
                     self.__current_btn_to_move = self.get_button_at_location(row, col)
-                    if self.get_button_color(self.__current_btn_to_move) != self.colors[self.current_player_index]:
+                    if self.__state.color_at(row, col) != self.colors[self.current_player_index]:
                         # Show a message if it's not the current player's turn
                         self.show_custom_message(
                             "It's not your turn! It's " + self.__players[self.current_player_index].get_name() +
@@ -749,44 +637,28 @@ class Game:
                         if self.current_turn_possible_moves == []:
                             self.show_custom_message("There's no options to move from here, try another place")
                             return
-                        for coord in self.current_turn_possible_moves:
-                            btn = self.get_button_at_location(coord[0], coord[1])
-                            self.set_button_color(btn, "magenta")
+                        self.highlight_moves(self.current_turn_possible_moves)
                         self.__during_turn = not self.__during_turn
                 else:
                     # Handle player's move during their turn
-                    dest_btn = self.get_button_at_location(row, col)
-                    if self.get_button_color(dest_btn) == "magenta":
+                    if (row, col) in self.current_turn_possible_moves:
                         # Move the piece to the selected destination if it's a valid move
-                        self.set_button_color(dest_btn, self.colors[self.current_player_index])
-                        for coord in self.current_turn_possible_moves:
-                            btn = self.get_button_at_location(coord[0], coord[1])
-                            if self.get_button_color(btn) == "magenta":
-                                self.set_button_color(btn, "white")
+                        self.move_piece(self.__current_coord_to_move, (row, col))
+                        self.clear_highlights()
                         self.log_move(self.__players[self.current_player_index].get_name(),
                                       self.__players[self.current_player_index].get_color(),
                                       f"Selected piece at ({self.__current_coord_to_move[0]}, {self.__current_coord_to_move[1]})",
                                       (row, col))
-                        self.set_button_color(self.__current_btn_to_move, "white")
                         self.__during_turn = not self.__during_turn
                         # Switch to the next player's turn
                         if self.current_player_index == self.__num_players - 1:
                             self.current_player_index = 0
                         else:
                             self.current_player_index += 1
-                        # Check if there's a winner after the move
-                        if self.is_winner():
-                            self.win_sound()
-                            # Update players' stats accordingly
-                            self.__players[self.current_player_index].update_stats("win")
-                            for player in self.__players:
-                                if player is not self.__players[self.current_player_index]:
-                                    player.update_stats("loss")
-                            with open("game_log.txt", "a") as log_file:
-                                log_file.write(
-                                    "The winner is: " + self.__players[self.current_player_index].get_name() + "\n")
-                            # Display game results
-                            self.display_game_results()
+                        # Check if there's a winner after the move; it is the player who just moved, not the
+                        # one whose turn it is now
+                        if self.end_game_if_won():
+                            return
                         message = "It's " + self.__players[self.current_player_index].get_name() + ", color: " + \
                                   self.colors[self.current_player_index]
                         self.__root.title(message)
@@ -802,6 +674,25 @@ class Game:
         except Exception as e:
             messagebox.showerror("Error", f"An error occurred while handling button click: {str(e)}")
 
+    def end_game_if_won(self) -> bool:
+        """
+        Check for a winner after a move and, if there is one, credit the win and show the results.
+
+        The results window asks whether to play again, so by the time it returns the board was either destroyed or
+        replaced by a new game, and the caller must not go on with the turn.
+
+        Returns:
+            bool: True if the game ended, False otherwise.
+        """
+        winner_index = self.get_winner()
+        if winner_index is None:
+            return False
+        self.win_sound()
+        self.record_win(winner_index)
+        # Display game results
+        self.display_game_results()
+        return True
+
     def display_game_results(self) -> None:
         """
         Display the results of the game in a graphical window.
@@ -873,15 +764,11 @@ class Game:
         """
         Play a winning sound effect.
 
-        This function plays a sequence of beeps to indicate winning.
+        This function plays a sequence of beeps to indicate winning, without waiting for them to end.
 
         """
         try:
-            winsound.Beep(800, 200)
-            winsound.Beep(900, 200)
-            winsound.Beep(1000, 200)
-            winsound.Beep(800, 500)
-            winsound.Beep(600, 700)
+            self.sounds.play(WIN_EFFECT)
         except Exception as e:
             print(f"An error occurred while playing the winning sound: {e}")
 
@@ -889,14 +776,11 @@ class Game:
         """
         Play a sound effect indicating an incorrect action.
 
-        This function plays a sequence of beeps to indicate an incorrect action.
+        This function plays a sequence of beeps to indicate an incorrect action, without waiting for them to end.
 
         """
         try:
-            winsound.Beep(150, 200)
-            winsound.Beep(200, 200)
-            winsound.Beep(300, 200)
-            winsound.Beep(200, 600)
+            self.sounds.play(WRONG_EFFECT)
         except Exception as e:
             print(f"An error occurred while playing the wrong sound: {e}")
 
@@ -905,14 +789,14 @@ class Game:
         Play a sound effect and announce the next player's turn.
 
         This function utilizes text-to-speech to announce the next player's turn and updates the window title accordingly.
+        The announcement is spoken on a worker thread and replaces an older one that was not spoken yet.
 
         Args:
             current_message (str): The message to be announced.
 
         """
         try:
-            self.engine.say(current_message)
-            self.engine.runAndWait()
+            self.speech.say(current_message)
             self.__root.title(current_message)
         except Exception as e:
             print(f"An error occurred during announcing next turn: {e}")
@@ -921,21 +805,47 @@ class Game:
         """
         Check if there is a winner in the game.
 
-        This function checks if any player has successfully moved all their pieces to their respective home locations.
+        This function checks if any player has moved a piece into the home triangle of another player. The board
+        state keeps count of such pieces on every move, so the check takes constant time.
 
         Returns:
             bool: True if there is a winner, False otherwise.
 
         """
+        try:
+            return self.__state.is_winner()
+        except Exception as e:
+            print(f"Error checking the board for a winner: {e}")
+            return False
+
+    def get_winner(self) -> Optional[int]:
+        """
+        Get the player that won the game.
+
+        Returns:
+            Optional[int]: The index of the player with a piece in the home triangle of another player, or None if
+            there is no winner yet.
+        """
+        try:
+            return self.__state.winner()
+        except Exception as e:
+            print(f"Error checking the board for a winner: {e}")
+            return None
+
+    def record_win(self, winner_index: int) -> None:
+        """
+        Update the players' stats after a win and log the winner.
+
+        Parameters:
+            winner_index (int): The index of the player that won.
+        """
+        winner = self.__players[winner_index]
+        winner.update_stats("win")
         for player in self.__players:
-            for coord in player.get_player_home_locations():
-                try:
-                    btn = self.get_button_at_location(coord[0], coord[1])
-                    if self.get_button_color(btn) != player.get_color() and self.get_button_color(btn) != "white":
-                        return True
-                except Exception as e:
-                    print(f"Error checking button color at location {coord}: {e}")
-        return False
+            if player is not winner:
+                player.update_stats("loss")
+        self.__logger.write(WINNER_LINE_PREFIX + winner.get_name() + "\n")
+        self.__logger.flush()
 
     def bind_button_clicks(self) -> None:
         """
@@ -966,52 +876,22 @@ class Game:
             opening_screen = GameOpeningScreen()
             file_name = opening_screen.get_file()
             play_against_computer = opening_screen.is_player_against_comp()
+            if file_name != "" and opening_screen.is_replay_selected():
+                # Only watch the saved game, there is no game to play and nothing to log
+                watch_replay(file_name)
+                return
             if file_name != "":
-                self.file_name = file_name
-                with open(file_name, 'r') as file:
-                    first_line = file.readline()
-                    # Reading the second line
-                    second_line = file.readline()
-                    self.__num_players = int(second_line[:-1])
-                    self.create_board(self.__num_players)
-                    lines = file.readlines()
-                    players_names_lst = []
-                    # Loop through each line in the lines list
-                    for line in lines:
-                        # Check if the line starts with "Player"
-                        if line.startswith("Player"):
-                            # Extract details from the current line
-                            split_line = line.split(". ")
-                            name = split_line[0].split(": ")[1]
-                            if name not in players_names_lst:
-                                players_names_lst.append(name)
-                            color = split_line[1].split(": ")[1]
-                            current_coord = split_line[2].split(": ")[1]
-                            opening_index = current_coord.find('(')
-                            last_to_specific_char = current_coord[opening_index:]
-                            dest_coord = split_line[3].split(": ")[1][:-1]
-                            opening_index = dest_coord.find('(')
-                            last_to_specific_char_d = dest_coord[opening_index:]
-                            current_coord = tuple(map(int, last_to_specific_char.strip("()").split(", ")))
-                            dest_coord = tuple(map(int, last_to_specific_char_d.strip("()").split(", ")))
-                            print(current_coord[0])
-                            current_btn = self.get_button_at_location(current_coord[0], current_coord[1])
-                            self.set_button_color(current_btn, "white")
-                            dest_btn = self.get_button_at_location(dest_coord[0], dest_coord[1])
-                            self.set_button_color(dest_btn, color)
-                        for i, player_name in enumerate(players_names_lst):
-                            # Create a player object for each player name using the corresponding color
-                            self.__players.append(
-                                Player(self.colors[i], self.__current_colors_coord[self.colors[i]], player_name))
+                self.resume_game(file_name)
+                if self.__root is None:
+                    # The resumed game ended on the computer's first move and the players chose to stop
+                    return
             else:
                 self.__num_players = opening_screen.get_num_players()
-                with open(self.file_name, "a") as log_file:
-                    log_file.write("Chinese checkers by Naama Even Oz - Game Log\n")
-                    log_file.write(str(self.__num_players) + "\n")
+                self.__logger.write(LOG_HEADER + "\n")
+                self.__logger.write(str(self.__num_players) + "\n")
                 self.__num_players = opening_screen.get_num_players()
                 if play_against_computer != 0:
-                    if play_against_computer == 2:
-                        self.__hard_level = True
+                    self.__computer = ComputerPlayer(play_against_computer)
                     self.against_comp = True
                     players_names_screen = PlayerNamesScreen(1)
                     player_name = players_names_screen.get_player_names()
@@ -1031,12 +911,81 @@ class Game:
                             Player(self.colors[i], self.__current_colors_coord[self.colors[i]], player_name))
 
             # Log the start time of the game prep
-            with open(self.file_name, "a") as log_file:
-                log_file.write(f"Game preparation started at: {datetime.now()}\n")
+            self.__logger.write(f"Game preparation started at: {datetime.now()}\n")
 
         except Exception as e:
             print(f"An error occurred during game preparation: {e}")
 
+    def resume_game(self, file_name: str) -> None:
+        """
+        Resume a saved game from a text game log or a replay file.
+
+        A text log with a snapshot is resumed from the snapshot and the moves logged after it, bringing back the
+        whole state of the game: the turn, the players' stats and the computer opponent. Otherwise the saved moves
+        are replayed onto a headless board state, the players get back the current locations of their pieces and
+        the turn goes to the player after the one who moved last. Either way the board is painted once.
+
+        Parameters:
+            file_name (str): The path of the saved game.
+        """
+        if not is_replay_file(file_name) and os.path.isfile(snapshot_file_name(file_name)):
+            try:
+                snapshot, state = restore_game(file_name)
+            except (OSError, ValueError) as e:
+                print(f"Replaying the whole game, the snapshot could not be restored: {e}")
+            else:
+                self.resume_snapshot(file_name, snapshot, state)
+                return
+        game = load_game(file_name)
+        self.__num_players = game.state.get_num_players()
+        if is_replay_file(file_name):
+            # Log the rest of the game as text, starting with the moves so far
+            self.__logger.write(LOG_HEADER + "\n")
+            self.__logger.write(str(self.__num_players) + "\n")
+            cells = game.state.get_cells()
+            for (source, destination), seat in zip(game.moves, game.movers):
+                self.__logger.log_move(game.player_names[seat], self.colors[seat], cells[source], cells[destination])
+        else:
+            # Continue the log of the loaded game
+            self.file_name = file_name
+            self.__logger = GameLogger(file_name)
+        self.create_board(self.__num_players, game.state)
+        for i, player_name in enumerate(game.player_names):
+            # Create a player object for each player name using the corresponding color
+            player = Player(self.colors[i], self.__current_colors_coord[self.colors[i]], player_name)
+            player.set_current_locations(game.state.get_player_locations(i))
+            self.__players.append(player)
+        self.current_player_index = game.next_player
+
+    def resume_snapshot(self, file_name: str, snapshot: GameSnapshot, state: BoardState) -> None:
+        """
+        Resume a game from a restored snapshot, continuing its text log.
+
+        Parameters:
+            file_name (str): The path of the text log of the game.
+            snapshot (GameSnapshot): The snapshot, brought up to the end of the log.
+            state (BoardState): The board state of the snapshot.
+        """
+        self.__num_players = snapshot.num_of_players
+        self.file_name = file_name
+        self.__logger = GameLogger(file_name)
+        if snapshot.computer_level:
+            self.__computer = ComputerPlayer(snapshot.computer_level)
+        self.against_comp = snapshot.against_comp
+        self.create_board(self.__num_players, state)
+        for i, saved_player in enumerate(snapshot.players):
+            player = Player(saved_player.color, self.__current_colors_coord[self.colors[i]], saved_player.name)
+            player.set_current_locations(saved_player.current_locations)
+            player.set_stats(saved_player.wins, saved_player.losses)
+            self.__players.append(player)
+        self.current_player_index = snapshot.current_player_index
+        if self.against_comp and self.current_player_index != 0:
+            # The game was left on the computer's turn; the board only waits for the human player
+            self.computer_move()
+            if self.end_game_if_won():
+                return
+            self.current_player_index = 0
+
     def if_play_again(self) -> None:
         """
         Prompt the user to play again.
@@ -1053,8 +1002,10 @@ class Game:
             if play_again:
                 same_players = messagebox.askyesno("Same players or new game?")
                 if same_players:
-                    # Restart the game with the same players
+                    # Restart the game with the same players; the worker processes of the computer restart lazily
                     self.__root.destroy()
+                    self.close_computer()
+                    self.start_new_log()
                     self.current_player_index = 0
                     self.log = []
                     self.__board_of_buttons = []
@@ -1068,21 +1019,47 @@ class Game:
                     self.__current_btn_to_move = None
                     self.create_board(self.__num_players)
                     current_message = "it's " + self.__players[0].get_name() + " turn. Your color is: " + self.colors[0]
-                    self.engine.say(current_message)
-                    self.engine.runAndWait()
+                    self.speech.say(current_message)
                     if self.against_comp:
                         self.__players[1].reset_current_locations()
                     self.__root.mainloop()
                 else:
                     # Set a flag for starting a new game with new players
                     self.__root.destroy()
+                    self.__root = None
+                    self.__logger.close()
+                    self.speech.close()
+                    self.sounds.close()
+                    self.close_computer()
                     self.__new_game_new_start = True
             else:
                 self.__root.destroy()
+                self.__root = None
+                self.__logger.close()
+                self.speech.close()
+                self.sounds.close()
+                self.close_computer()
                 return
         except Exception as e:
             print(f"An error occurred while prompting to play again: {e}")
 
+    def start_new_log(self) -> None:
+        """
+        Close the log of the finished game and start a new log file for the next game with the same players, so
+        resuming a log only ever replays a single game.
+        """
+        try:
+            self.__logger.close()
+            self.current_datetime = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+            self.file_name = f"game_log_{self.current_datetime}.txt"
+            self.log_file_path = os.path.join(os.path.dirname(__file__), self.file_name)
+            self.__logger = GameLogger(self.file_name)
+            self.__moves_since_snapshot = 0
+            self.__logger.write(LOG_HEADER + "\n")
+            self.__logger.write(str(self.__num_players) + "\n")
+        except Exception as e:
+            print(f"An error occurred while starting a new game log: {e}")
+
     def is_new_game_new_start(self) -> bool:
         """
         Check if the user opted for a new game with new players.
@@ -1105,14 +1082,14 @@ class Game:
 
         """
         self.prep_game()  # Prepare the game, including setting up players and board
+        if self.__root is None:
+            # No board was created, e.g. only a replay was watched, or a resumed game ended right away
+            return
         self.show_rules()
-        with open(self.file_name, "a") as log_file:
-            log_file.write(
-                "Chinese checkers by Naama Even Oz - Game Log\n")
+        self.__logger.write(LOG_HEADER + "\n")
         # Show the rules of the game to the players
         # current_message = "It's " + self.__players[0].get_name() + "'s turn. Your color is: " + self.colors[0]
-        # self.engine.say(current_message)  # Announce the current player's turn using text-to-speech
-        # self.engine.runAndWait()  # Run the text-to-speech engine to announce the current player's turn
+        # self.speech.say(current_message)  # Announce the current player's turn using text-to-speech
         self.__root.mainloop()  # Start the main loop of the game
 
 
@@ -1136,10 +1113,12 @@ if __name__ == "__main__":
                         """
         if sys.argv[1]=="--help":
             print(rules_of_the_game)
-    game = Game()
+    # Draw the board on a single canvas instead of with buttons
+    board_renderer = "canvas" if "--canvas" in sys.argv else "buttons"
+    game = Game(board_renderer)
     game.start()
     if game.is_new_game_new_start():
-        game = Game()
+        game = Game(board_renderer)
         game.start()
 
 
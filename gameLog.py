@@ -0,0 +1,231 @@
+import atexit
+import os
+import re
+import threading
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+Coordinates = Tuple[int, int]
+
+# First line of every game log
+LOG_HEADER = "Chinese checkers by Naama Even Oz - Game Log"
+
+# Start of the line logged when a game ends
+WINNER_LINE_PREFIX = "The winner is: "
+
+# Number of buffered records that makes the background thread write them out right away
+DEFAULT_MAX_BUFFERED = 64
+
+# Seconds a record may wait in the buffer before the background thread writes it out
+DEFAULT_FLUSH_INTERVAL = 1.0
+
+# A move line, with or without the timestamp in front of it, e.g.
+# "2024-05-14 20:54:30 - Player: Naama. Color: blue. Selected button: Selected piece at (3, 13). Destination button: (4, 14)"
+MOVE_LINE = re.compile(r"Player: (?P<name>.*)\. Color: (?P<color>\w+)\. "
+                       r"Selected button: [^(]*\((?P<src_row>\d+), (?P<src_col>\d+)\)\. "
+                       r"Destination button: [^(]*\((?P<dst_row>\d+), (?P<dst_col>\d+)\)")
+
+
+class LoggedMove(NamedTuple):
+    """
+    A move read from a game log.
+    """
+    player_name: str
+    color: str
+    source: Coordinates
+    destination: Coordinates
+
+
+def parse_move_line(line: str) -> Optional[LoggedMove]:
+    """
+    Parse a line of a game log.
+
+    Args:
+        line (str): The line.
+
+    Returns:
+        Optional[LoggedMove]: The move logged on the line, or None if it is not a move line.
+    """
+    match = MOVE_LINE.search(line)
+    if match is None:
+        return None
+    return LoggedMove(match["name"], match["color"],
+                      (int(match["src_row"]), int(match["src_col"])),
+                      (int(match["dst_row"]), int(match["dst_col"])))
+
+
+def format_move_line(player_name: str, color: str, source: Coordinates, destination: Coordinates,
+                     timestamp: str = "") -> str:
+    """
+    Format a move as a line of a game log.
+
+    Args:
+        player_name (str): The name of the player making the move.
+        color (str): The color of the player's pieces.
+        source (Coordinates): The coordinates the piece moved from.
+        destination (Coordinates): The coordinates the piece moved to.
+        timestamp (str): The time of the move, left out if empty.
+
+    Returns:
+        str: The line, ending with a newline.
+    """
+    prefix = f"{timestamp} - " if timestamp else ""
+    return (f"{prefix}Player: {player_name}. Color: {color}. Selected button: Selected piece at "
+            f"({source[0]}, {source[1]}). Destination button: ({destination[0]}, {destination[1]})\n")
+
+
+def split_games(lines: Iterable[str]) -> List[List[LoggedMove]]:
+    """
+    Split the moves of a log into games.
+
+    Rematches used to be logged in the same file as the game before them, so the moves logged after a winner line
+    belong to a new game, which starts from the starting position.
+
+    Args:
+        lines (Iterable[str]): The lines of the log.
+
+    Returns:
+        List[List[LoggedMove]]: The moves of every game, in order; a single empty game if there are no moves.
+    """
+    games: List[List[LoggedMove]] = [[]]
+    game_over = False
+    for line in lines:
+        if line.startswith(WINNER_LINE_PREFIX):
+            game_over = True
+            continue
+        move = parse_move_line(line)
+        if move is None:
+            continue
+        if game_over:
+            games.append([])
+        game_over = False
+        games[-1].append(move)
+    return games
+
+
+def read_game_log(file_name: str) -> Tuple[int, List[LoggedMove]]:
+    """
+    Read the number of players and the moves of the last game of a game log.
+
+    Args:
+        file_name (str): The path of the log.
+
+    Returns:
+        Tuple[int, List[LoggedMove]]: The number of players and the logged moves of the last game, in order.
+    """
+    with open(file_name, 'r') as file:
+        file.readline()
+        num_of_players = int(file.readline())
+        moves = split_games(file)[-1]
+    return num_of_players, moves
+
+
+class GameLogger:
+    """
+    Writes the log of a game through a single file handle, buffering the records in memory.
+
+    A background thread writes the buffer to the file as soon as it holds enough records, and otherwise once every
+    flush interval. The buffer is also written out by flush(), by close() and when the interpreter exits.
+    """
+
+    def __init__(self, file_name: str, max_buffered: int = DEFAULT_MAX_BUFFERED,
+                 flush_interval: float = DEFAULT_FLUSH_INTERVAL) -> None:
+        """
+        Initializes a GameLogger object. The file is only opened, for appending, when the first record is written.
+
+        Args:
+            file_name (str): The path of the log.
+            max_buffered (int): The number of buffered records that triggers a write.
+            flush_interval (float): The seconds a record may wait in the buffer.
+        """
+        self.file_name = file_name
+        self.max_buffered = max_buffered
+        self.flush_interval = flush_interval
+        self.__buffer: List[str] = []
+        self.__lock = threading.Lock()
+        self.__wake_up = threading.Event()
+        self.__file = None
+        self.__thread = None
+        self.__closed = False
+
+    def write(self, text: str) -> None:
+        """
+        Add a record to the log.
+
+        Args:
+            text (str): The record, including its newline.
+        """
+        with self.__lock:
+            if self.__closed:
+                raise ValueError(f"The log {self.file_name} is closed")
+            self.__buffer.append(text)
+            buffered = len(self.__buffer)
+            if self.__thread is None:
+                self.__thread = threading.Thread(target=self.__run, name="GameLogger", daemon=True)
+                self.__thread.start()
+                atexit.register(self.close)
+        if buffered >= self.max_buffered:
+            self.__wake_up.set()
+
+    def log_move(self, player_name: str, color: str, source: Coordinates, destination: Coordinates,
+                 timestamp: str = "") -> None:
+        """
+        Add a move to the log, see format_move_line().
+
+        Args:
+            player_name (str): The name of the player making the move.
+            color (str): The color of the player's pieces.
+            source (Coordinates): The coordinates the piece moved from.
+            destination (Coordinates): The coordinates the piece moved to.
+            timestamp (str): The time of the move, left out if empty.
+        """
+        self.write(format_move_line(player_name, color, source, destination, timestamp))
+
+    def flush(self) -> None:
+        """
+        Write all the buffered records to the file.
+        """
+        with self.__lock:
+            if not self.__buffer:
+                return
+            if self.__file is None:
+                self.__file = open(self.file_name, "a")
+            self.__file.write("".join(self.__buffer))
+            self.__buffer = []
+            self.__file.flush()
+
+    def flushed_size(self) -> int:
+        """
+        Write all the buffered records to the file and get the size of the file.
+
+        Returns:
+            int: The size of the log file in bytes, 0 if it does not exist yet.
+        """
+        self.flush()
+        return os.path.getsize(self.file_name) if os.path.exists(self.file_name) else 0
+
+    def close(self) -> None:
+        """
+        Write out the buffered records, stop the background thread and close the file. Closing twice does nothing.
+        """
+        with self.__lock:
+            if self.__closed:
+                return
+            self.__closed = True
+            thread = self.__thread
+        if thread is not None:
+            self.__wake_up.set()
+            thread.join()
+            atexit.unregister(self.close)
+        self.flush()
+        if self.__file is not None:
+            self.__file.close()
+            self.__file = None
+
+    def __run(self) -> None:
+        """
+        The background thread: write out the buffer whenever it is full or the flush interval has passed.
+        """
+        while not self.__closed:
+            self.__wake_up.wait(self.flush_interval)
+            self.__wake_up.clear()
+            self.flush()
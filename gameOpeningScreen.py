@@ -3,6 +3,8 @@ import tkinter as tk
 from tkinter import filedialog, messagebox
 import re
 
+from replayFormat import is_replay_file
+
 
 class GameOpeningScreen:
     def __init__(self) -> None:
@@ -28,6 +30,11 @@ class GameOpeningScreen:
                                            font=("Arial", 12))
             self.browse_button.pack()
 
+            self.replay_selected = False
+            self.replay_button = tk.Button(self.root, text="Watch Replay", command=self.watch_replay, bg="white",
+                                           fg="blue", font=("Arial", 12), state=tk.DISABLED)
+            self.replay_button.pack(pady=5)
+
             self.num_players_label = tk.Label(self.root, text="Select number of players (2-6):", bg="lightblue", fg="white",
                                               font=("Arial", 14))
             self.num_players_label.pack(pady=10)
@@ -47,6 +54,12 @@ class GameOpeningScreen:
             self.level_2_radio = tk.Radiobutton(self.root, text="Level 2", variable=self.level_var, value="level_2",
                                                 bg="lightblue", fg="white", font=("Arial", 12))
             self.level_2_radio.pack()
+            self.level_3_radio = tk.Radiobutton(self.root, text="Level 3", variable=self.level_var, value="level_3",
+                                                bg="lightblue", fg="white", font=("Arial", 12))
+            self.level_3_radio.pack()
+            self.level_4_radio = tk.Radiobutton(self.root, text="Level 4", variable=self.level_var, value="level_4",
+                                                bg="lightblue", fg="white", font=("Arial", 12))
+            self.level_4_radio.pack()
 
             self.start_button = tk.Button(self.root, text="Start Game", command=self.start_game, bg="white", fg="blue",
                                           font=("Arial", 12), state=tk.DISABLED)
@@ -66,6 +79,8 @@ class GameOpeningScreen:
             self.play_against_computer_yes_radio.bind("<Button-1>", self.handle_choice)
             self.level_1_radio.bind("<Button-1>", self.handle_choice)
             self.level_2_radio.bind("<Button-1>", self.handle_choice)
+            self.level_3_radio.bind("<Button-1>", self.handle_choice)
+            self.level_4_radio.bind("<Button-1>", self.handle_choice)
 
             self.root.mainloop()
         except Exception as e:
@@ -111,6 +126,8 @@ class GameOpeningScreen:
                 return False
 
             name, extension = os.path.splitext(filename)
+            if extension.lower() == '.ccr':
+                return is_replay_file(filename)
             if extension.lower() != '.txt':
                 return False
 
@@ -136,11 +153,19 @@ class GameOpeningScreen:
                 if self.validate_file(self.filename):
                     print(f"Selected file: {self.filename}")
                     self.start_button.config(state=tk.NORMAL)
+                    self.replay_button.config(state=tk.NORMAL)
                 else:
-                    messagebox.showerror("Error", "Please select a valid text file.")
+                    messagebox.showerror("Error", "Please select a valid text file or replay file.")
         except Exception as e:
             messagebox.showerror("Error", f"An error occurred: {str(e)}")
 
+    def watch_replay(self) -> None:
+        """
+        Closes the opening screen to watch the replay of the selected file instead of playing it.
+        """
+        self.replay_selected = True
+        self.root.destroy()
+
     def start_game(self) -> int:
         """
         Starts the game with the selected options.
@@ -178,9 +203,11 @@ class GameOpeningScreen:
         self.play_against_computer_yes_radio.config(state=tk.NORMAL)
         self.num_players_menu.config(state=tk.NORMAL)
         self.start_button.config(state=tk.DISABLED)
+        self.replay_button.config(state=tk.DISABLED)
         self.choice_made = False
         self.level_selected = 0
         self.filename = ""
+        self.replay_selected = False
 
     def get_screen_root(self) -> tk.Tk:
         """
@@ -200,6 +227,15 @@ class GameOpeningScreen:
         """
         return self.filename
 
+    def is_replay_selected(self) -> bool:
+        """
+        Checks if the user chose to watch the replay of the selected file.
+
+        Returns:
+            bool: True if the replay should be shown instead of playing the game.
+        """
+        return self.replay_selected
+
     def get_num_players(self) -> int:
         """
         Gets the number of players selected by the user.
@@ -0,0 +1,199 @@
+"""
+Snapshots of games in progress.
+
+A snapshot holds the full state of a game: the owner of every cell, the player whose turn it is, every player's
+name, color, piece locations, wins and losses, and the computer opponent. It also records the size of the game log
+when it was taken, so a game is resumed from its latest snapshot plus only the moves logged after it. The time to
+resume a game does not depend on how long it is.
+
+A snapshot is a small JSON file next to the game log, replaced atomically so a crash never leaves a torn one.
+"""
+
+import json
+import os
+import tempfile
+from typing import List, NamedTuple, Tuple
+
+from boardState import BoardState
+from gameLog import LoggedMove, split_games
+
+Coordinates = Tuple[int, int]
+
+# Version of the snapshots written by write_snapshot
+SNAPSHOT_VERSION = 1
+
+# Added to the name of the game log to name its snapshot
+SNAPSHOT_SUFFIX = ".snapshot"
+
+# Moves between two snapshots of a game
+DEFAULT_SNAPSHOT_INTERVAL = 10
+
+
+class PlayerSnapshot(NamedTuple):
+    """
+    The state of a player in a snapshot.
+    """
+    name: str
+    color: str
+    current_locations: List[Coordinates]
+    wins: int
+    losses: int
+
+
+class GameSnapshot(NamedTuple):
+    """
+    The full state of a game in progress.
+    """
+    num_of_players: int
+    owners: bytes
+    current_player_index: int
+    players: List[PlayerSnapshot]
+    computer_level: int
+    against_comp: bool
+    log_size: int
+
+
+def snapshot_file_name(log_file_name: str) -> str:
+    """
+    Get the path of the snapshot of a game log.
+
+    Args:
+        log_file_name (str): The path of the game log.
+
+    Returns:
+        str: The path of its snapshot.
+    """
+    return log_file_name + SNAPSHOT_SUFFIX
+
+
+def write_snapshot(file_name: str, snapshot: GameSnapshot) -> None:
+    """
+    Write a snapshot atomically: it is written to a temporary file in the same directory, which then replaces the
+    previous snapshot.
+
+    Args:
+        file_name (str): The path of the snapshot.
+        snapshot (GameSnapshot): The snapshot.
+    """
+    data = {
+        "version": SNAPSHOT_VERSION,
+        "num_of_players": snapshot.num_of_players,
+        "owners": snapshot.owners.hex(),
+        "current_player_index": snapshot.current_player_index,
+        "players": [{"name": player.name, "color": player.color,
+                     "current_locations": [list(coord) for coord in player.current_locations],
+                     "wins": player.wins, "losses": player.losses} for player in snapshot.players],
+        "computer_level": snapshot.computer_level,
+        "against_comp": snapshot.against_comp,
+        "log_size": snapshot.log_size,
+    }
+    handle, temp_name = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(file_name)),
+                                         prefix=os.path.basename(file_name), suffix=".tmp")
+    try:
+        with os.fdopen(handle, "w") as file:
+            json.dump(data, file, separators=(",", ":"))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_name, file_name)
+    except BaseException:
+        os.remove(temp_name)
+        raise
+
+
+def read_snapshot(file_name: str) -> GameSnapshot:
+    """
+    Read a snapshot.
+
+    Args:
+        file_name (str): The path of the snapshot.
+
+    Returns:
+        GameSnapshot: The snapshot.
+
+    Raises:
+        ValueError: If the file is not a snapshot, was written by a newer version, or holds a piece or a turn of a
+            player that is not in the game.
+    """
+    with open(file_name, "r") as file:
+        data = json.load(file)
+    try:
+        if data["version"] > SNAPSHOT_VERSION:
+            raise ValueError(f"Snapshot version {data['version']} of {file_name} is not supported")
+        players = [PlayerSnapshot(player["name"], player["color"],
+                                  [(row, col) for row, col in player["current_locations"]],
+                                  player["wins"], player["losses"]) for player in data["players"]]
+        snapshot = GameSnapshot(data["num_of_players"], bytes.fromhex(data["owners"]), data["current_player_index"],
+                                players, data["computer_level"], data["against_comp"], data["log_size"])
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"{file_name} is not a game snapshot") from e
+    if snapshot.owners and max(snapshot.owners) > snapshot.num_of_players:
+        raise ValueError(f"{file_name} has a piece of player {max(snapshot.owners)} in a game of "
+                         f"{snapshot.num_of_players} players")
+    if not 0 <= snapshot.current_player_index < snapshot.num_of_players:
+        raise ValueError(f"{file_name} has the turn of player {snapshot.current_player_index} in a game of "
+                         f"{snapshot.num_of_players} players")
+    return snapshot
+
+
+def read_log_tail(log_file_name: str, offset: int) -> List[LoggedMove]:
+    """
+    Read the moves logged after some point of a game log, without reading the part before it.
+
+    Args:
+        log_file_name (str): The path of the game log.
+        offset (int): The size of the log, in bytes, at that point.
+
+    Returns:
+        List[LoggedMove]: The moves logged after it, in order.
+
+    Raises:
+        ValueError: If the log is shorter than the offset, e.g. it was replaced by another game, or another game
+            was logged after the snapshot.
+    """
+    with open(log_file_name, "rb") as file:
+        if os.fstat(file.fileno()).st_size < offset:
+            raise ValueError(f"The log {log_file_name} is shorter than its snapshot")
+        file.seek(offset)
+        lines = file.read().decode("utf-8").splitlines()
+    games = split_games(lines)
+    if len(games) > 1:
+        raise ValueError(f"Another game was logged in {log_file_name} after its snapshot")
+    return games[0]
+
+
+def restore_game(log_file_name: str) -> Tuple[GameSnapshot, BoardState]:
+    """
+    Restore a game from the latest snapshot of its log, playing the moves logged after the snapshot.
+
+    Args:
+        log_file_name (str): The path of the game log.
+
+    Returns:
+        Tuple[GameSnapshot, BoardState]: The snapshot brought up to the end of the log, and its board state.
+
+    Raises:
+        ValueError: If the snapshot does not match the log, or a move of the tail does not start from a piece.
+    """
+    snapshot = read_snapshot(snapshot_file_name(log_file_name))
+    state = BoardState(snapshot.num_of_players)
+    if len(snapshot.owners) != len(state.owners):
+        raise ValueError(f"The snapshot of {log_file_name} is not of a board of {snapshot.num_of_players} players")
+    state.load_owners(snapshot.owners)
+    locations = [list(player.current_locations) for player in snapshot.players]
+    current_player_index = snapshot.current_player_index
+    for move in read_log_tail(log_file_name, snapshot.log_size):
+        source, destination = state.cell_id(*move.source), state.cell_id(*move.destination)
+        if source is None or destination is None or not state.owners[source]:
+            raise ValueError(f"The move {move.source} -> {move.destination} of {move.player_name} "
+                             f"does not follow the snapshot of {log_file_name}")
+        mover = state.owners[source] - 1
+        state.move_cells(source, destination)
+        if move.source in locations[mover]:
+            locations[mover].remove(move.source)
+        locations[mover].append(move.destination)
+        current_player_index = (mover + 1) % snapshot.num_of_players
+    players = [player._replace(current_locations=player_locations)
+               for player, player_locations in zip(snapshot.players, locations)]
+    restored = snapshot._replace(owners=bytes(state.owners), current_player_index=current_player_index,
+                                 players=players, log_size=os.path.getsize(log_file_name))
+    return restored, state
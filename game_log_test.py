@@ -0,0 +1,101 @@
+import os
+import tempfile
+import time
+import unittest
+from gameLog import (LOG_HEADER, WINNER_LINE_PREFIX, GameLogger, LoggedMove, format_move_line, parse_move_line,
+                     read_game_log, split_games)
+
+
+class TestGameLog(unittest.TestCase):
+    def test_parse_line_without_timestamp(self):
+        line = "Player: ew. Color: blue. Selected button: Selected piece at (3, 13). Destination button: (4, 14)\n"
+        self.assertEqual(parse_move_line(line), LoggedMove("ew", "blue", (3, 13), (4, 14)))
+
+    def test_parse_line_with_timestamp(self):
+        line = ("2024-05-14 20:54:30 - Player: Naama. Color: yellow. Selected button: Selected piece at (13, 9). "
+                "Destination button: (12, 10)\n")
+        self.assertEqual(parse_move_line(line), LoggedMove("Naama", "yellow", (13, 9), (12, 10)))
+
+    def test_other_lines_are_skipped(self):
+        self.assertIsNone(parse_move_line(LOG_HEADER + "\n"))
+        self.assertIsNone(parse_move_line("Game preparation started at: 2024-05-14 20:54:30.940323\n"))
+
+    def test_format_round_trip(self):
+        line = format_move_line("Dana", "red", (4, 4), (5, 5), "2024-01-01 00:00:00")
+        self.assertEqual(parse_move_line(line), LoggedMove("Dana", "red", (4, 4), (5, 5)))
+
+    def test_read_game_log(self):
+        handle, file_name = tempfile.mkstemp(suffix=".txt")
+        with os.fdopen(handle, "w") as log_file:
+            log_file.write(f"{LOG_HEADER}\n2\n")
+            log_file.write(format_move_line("a", "blue", (3, 13), (4, 14)))
+            log_file.write("Game preparation started at: 2024-05-14 20:54:30.940323\n")
+            log_file.write(format_move_line("b", "yellow", (13, 9), (12, 10)))
+        try:
+            num_of_players, moves = read_game_log(file_name)
+        finally:
+            os.remove(file_name)
+        self.assertEqual(num_of_players, 2)
+        self.assertEqual([move.player_name for move in moves], ["a", "b"])
+
+    def test_rematch_in_the_same_log(self):
+        lines = [format_move_line("a", "blue", (3, 13), (4, 14)), WINNER_LINE_PREFIX + "a\n",
+                 format_move_line("a", "blue", (3, 11), (4, 12)), format_move_line("b", "yellow", (13, 9), (12, 10))]
+        games = split_games(lines)
+        self.assertEqual([[move.source for move in game] for game in games], [[(3, 13)], [(3, 11), (13, 9)]])
+        # A finished game without a rematch is still a single game
+        self.assertEqual(len(split_games(lines[:2])), 1)
+
+
+class TestGameLogger(unittest.TestCase):
+    def setUp(self):
+        handle, self.file_name = tempfile.mkstemp(suffix=".txt")
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.file_name)
+
+    def read(self):
+        with open(self.file_name) as log_file:
+            return log_file.read()
+
+    def test_records_are_buffered_until_flush(self):
+        logger = GameLogger(self.file_name, flush_interval=60)
+        logger.write(f"{LOG_HEADER}\n")
+        logger.log_move("a", "blue", (3, 13), (4, 14))
+        self.assertEqual(self.read(), "")
+        logger.flush()
+        self.assertEqual(self.read(), f"{LOG_HEADER}\n" + format_move_line("a", "blue", (3, 13), (4, 14)))
+        logger.close()
+
+    def test_full_buffer_is_written_in_the_background(self):
+        logger = GameLogger(self.file_name, max_buffered=3, flush_interval=60)
+        for row in range(3):
+            logger.log_move("a", "blue", (row, 0), (row, 2))
+        deadline = time.monotonic() + 5
+        while self.read().count("\n") < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(self.read().count("\n"), 3)
+        logger.close()
+
+    def test_buffer_is_written_after_the_interval(self):
+        logger = GameLogger(self.file_name, flush_interval=0.05)
+        logger.write("The winner is: a\n")
+        deadline = time.monotonic() + 5
+        while not self.read() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(self.read(), "The winner is: a\n")
+        logger.close()
+
+    def test_close_writes_everything(self):
+        logger = GameLogger(self.file_name, flush_interval=60)
+        logger.write("a\n")
+        logger.close()
+        logger.close()
+        self.assertEqual(self.read(), "a\n")
+        with self.assertRaises(ValueError):
+            logger.write("b\n")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+import os
+import random
+import tempfile
+import unittest
+from boardState import BoardState
+from gameLog import LOG_HEADER, format_move_line
+from moveGenerator import generate_moves
+from gameSnapshot import (GameSnapshot, PlayerSnapshot, read_snapshot, restore_game, snapshot_file_name,
+                          write_snapshot)
+from replayFormat import load_text_log
+
+
+class TestGameSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.log_file_name = os.path.join(self.directory.name, "game_log.txt")
+        self.state = BoardState(2)
+        self.random = random.Random(3)
+        self.played = []
+        with open(self.log_file_name, "w") as log_file:
+            log_file.write(f"{LOG_HEADER}\n2\n")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def play(self, moves):
+        cells = self.state.get_cells()
+        with open(self.log_file_name, "a") as log_file:
+            for _ in range(moves):
+                player = len(self.played) % 2
+                source, destination = self.random.choice(list(generate_moves(self.state, player)))
+                self.state.move_cells(source, destination)
+                self.played.append(player)
+                log_file.write(format_move_line(f"p{player}", "blue", cells[source], cells[destination]))
+
+    def take_snapshot(self, wins=(0, 0)):
+        snapshot = GameSnapshot(2, bytes(self.state.owners), len(self.played) % 2,
+                                [PlayerSnapshot(f"p{i}", ["blue", "yellow"][i], self.state.get_player_locations(i),
+                                                wins[i], 1 - wins[i]) for i in range(2)],
+                                3, True, os.path.getsize(self.log_file_name))
+        write_snapshot(snapshot_file_name(self.log_file_name), snapshot)
+        return snapshot
+
+    def test_round_trip(self):
+        self.play(6)
+        snapshot = self.take_snapshot(wins=(1, 0))
+        self.assertEqual(read_snapshot(snapshot_file_name(self.log_file_name)), snapshot)
+        # Only the log and the snapshot, no temporary file is left behind
+        self.assertEqual(len(os.listdir(self.directory.name)), 2)
+
+    def test_restore_plays_the_log_tail(self):
+        self.play(20)
+        self.take_snapshot()
+        self.play(5)
+        snapshot, state = restore_game(self.log_file_name)
+        self.assertEqual(bytes(state.owners), bytes(load_text_log(self.log_file_name).state.owners))
+        self.assertEqual(snapshot.current_player_index, 25 % 2)
+        for i, player in enumerate(snapshot.players):
+            self.assertCountEqual(player.current_locations, state.get_player_locations(i))
+        self.assertEqual((snapshot.computer_level, snapshot.against_comp), (3, True))
+        self.assertEqual(snapshot.log_size, os.path.getsize(self.log_file_name))
+
+    def test_restore_does_not_read_the_log_before_the_snapshot(self):
+        self.play(30)
+        snapshot = self.take_snapshot()
+        self.play(2)
+        with open(self.log_file_name, "r+b") as log_file:
+            log_file.write(b"#" * snapshot.log_size)
+        _, state = restore_game(self.log_file_name)
+        self.assertEqual(bytes(state.owners), bytes(self.state.owners))
+
+    def test_log_shorter_than_snapshot(self):
+        self.play(4)
+        self.take_snapshot()
+        with open(self.log_file_name, "w") as log_file:
+            log_file.write(f"{LOG_HEADER}\n2\n")
+        with self.assertRaises(ValueError):
+            restore_game(self.log_file_name)
+
+    def test_players_outside_the_game_are_rejected(self):
+        self.play(4)
+        snapshot = self.take_snapshot()
+        owners = bytearray(snapshot.owners)
+        owners[owners.index(0)] = 9
+        for bad in (snapshot._replace(owners=bytes(owners)), snapshot._replace(current_player_index=2)):
+            write_snapshot(snapshot_file_name(self.log_file_name), bad)
+            with self.assertRaises(ValueError):
+                read_snapshot(snapshot_file_name(self.log_file_name))
+
+    def test_tail_with_another_game_is_rejected(self):
+        self.play(4)
+        self.take_snapshot()
+        with open(self.log_file_name, "a") as log_file:
+            log_file.write("The winner is: p0\n")
+            log_file.write(format_move_line("p0", "blue", (3, 13), (4, 14)))
+        with self.assertRaises(ValueError):
+            restore_game(self.log_file_name)
+
+    def test_newer_version_is_rejected(self):
+        with open(snapshot_file_name(self.log_file_name), "w") as snapshot_file:
+            snapshot_file.write('{"version": 99}')
+        with self.assertRaises(ValueError):
+            read_snapshot(snapshot_file_name(self.log_file_name))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+"""
+A background thread that handles only the latest item it was given.
+
+Speech and sound effects block until they end, so they are played on a worker thread and the Tk event loop never
+waits for them. When items come in faster than they are handled, a newer item replaces the one still waiting
+instead of queueing up seconds of lag; the item being handled is always finished.
+"""
+
+import threading
+from typing import Any, Callable, Optional
+
+
+class LatestOnlyWorker:
+    """
+    Handles items on a daemon thread, keeping only the latest one that is waiting to be handled.
+    """
+
+    def __init__(self, handler: Callable[[Any], None], name: str) -> None:
+        """
+        Initializes a LatestOnlyWorker object. The thread is only started when the first item is submitted.
+
+        Args:
+            handler (Callable[[Any], None]): Handles an item on the worker thread, returning when it is done.
+            name (str): The name of the thread, also used in error messages.
+        """
+        self.handler = handler
+        self.name = name
+        self.handled = 0
+        self.dropped = 0
+        self.__pending: Optional[Any] = None
+        self.__busy = False
+        self.__condition = threading.Condition()
+        self.__thread = None
+        self.__closed = False
+
+    def submit(self, item: Any) -> None:
+        """
+        Hand an item to the worker, replacing the item still waiting to be handled, if any. Returns immediately.
+
+        Args:
+            item (Any): The item; must not be None.
+        """
+        with self.__condition:
+            if self.__closed:
+                return
+            if self.__pending is not None:
+                self.dropped += 1
+            self.__pending = item
+            if self.__thread is None:
+                self.__thread = threading.Thread(target=self.__run, name=self.name, daemon=True)
+                self.__thread.start()
+            self.__condition.notify()
+
+    def wait_until_idle(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every item was handled or dropped, e.g. in tests.
+
+        Args:
+            timeout (Optional[float]): The most seconds to wait, no limit if None.
+
+        Returns:
+            bool: True if nothing is being handled or waiting, False if the timeout passed first.
+        """
+        with self.__condition:
+            return self.__condition.wait_for(lambda: self.__pending is None and not self.__busy, timeout)
+
+    def close(self, timeout: Optional[float] = 1.0) -> None:
+        """
+        Drop the waiting item and stop the thread once the current one is handled. Closing twice does nothing.
+
+        Args:
+            timeout (Optional[float]): The most seconds to wait for the current item.
+        """
+        with self.__condition:
+            self.__closed = True
+            self.__pending = None
+            self.__condition.notify_all()
+            thread = self.__thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def __run(self) -> None:
+        """
+        The worker thread: handle the latest item whenever there is one.
+        """
+        while True:
+            with self.__condition:
+                self.__condition.wait_for(lambda: self.__pending is not None or self.__closed)
+                if self.__closed:
+                    return
+                item = self.__pending
+                self.__pending = None
+                self.__busy = True
+            try:
+                self.handler(item)
+                self.handled += 1
+            except Exception as e:
+                print(f"An error occurred in the {self.name} worker: {e}")
+            finally:
+                with self.__condition:
+                    self.__busy = False
+                    self.__condition.notify_all()
@@ -0,0 +1,57 @@
+import threading
+import unittest
+from latestOnlyWorker import LatestOnlyWorker
+
+
+class TestLatestOnlyWorker(unittest.TestCase):
+    def setUp(self):
+        self.release = threading.Event()
+        self.started = threading.Event()
+        self.handled = []
+        self.worker = LatestOnlyWorker(self.handle, "TestWorker")
+
+    def tearDown(self):
+        self.release.set()
+        self.worker.close()
+
+    def handle(self, item):
+        self.handled.append(item)
+        self.started.set()
+        # Keep handling the item until the test lets it finish
+        self.release.wait(5)
+
+    def test_submit_does_not_wait_for_the_handler(self):
+        self.worker.submit("a")
+        self.assertFalse(self.worker.wait_until_idle(0.05))
+        self.release.set()
+        self.assertTrue(self.worker.wait_until_idle(5))
+        self.assertEqual(self.handled, ["a"])
+
+    def test_newer_item_replaces_pending_one(self):
+        self.worker.submit("a")
+        self.assertTrue(self.started.wait(5))
+        self.worker.submit("b")
+        self.worker.submit("c")
+        self.release.set()
+        self.assertTrue(self.worker.wait_until_idle(5))
+        self.assertEqual(self.handled, ["a", "c"])
+        self.assertEqual((self.worker.handled, self.worker.dropped), (2, 1))
+
+    def test_handler_errors_do_not_stop_the_worker(self):
+        worker = LatestOnlyWorker(lambda item: 1 / item, "TestWorker")
+        worker.submit(0)
+        self.assertTrue(worker.wait_until_idle(5))
+        worker.submit(1)
+        self.assertTrue(worker.wait_until_idle(5))
+        self.assertEqual(worker.handled, 1)
+        worker.close()
+
+    def test_submit_after_close_is_ignored(self):
+        self.worker.close()
+        self.worker.submit("a")
+        self.assertEqual(self.handled, [])
+        self.assertTrue(self.worker.wait_until_idle(0))
+
+
+if __name__ == '__main__':
+    unittest.main()
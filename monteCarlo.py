@@ -0,0 +1,246 @@
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from boardState import BoardState
+from evaluation import goal_distances, is_winning_move, progress
+from moveGenerator import generate_moves, piece_cells
+
+Move = Tuple[int, int]
+
+# Exploration constant of the UCT formula
+EXPLORATION = 1.4
+
+# Plies after which a playout stops and is scored by the pieces' progress
+ROLLOUT_LIMIT = 40
+
+# Chance that a playout takes the move that gets closest to the goal instead of a random one
+GREEDY_ROLLOUT_CHANCE = 0.8
+
+
+class TreeNode:
+    """
+    A position in the Monte Carlo search tree.
+    """
+
+    def __init__(self, player_to_move: int, player_just_moved: int, untried_moves: List[Move]) -> None:
+        """
+        Initializes a TreeNode object.
+
+        Args:
+            player_to_move (int): The index of the player to move in the position.
+            player_just_moved (int): The index of the player whose move led to the position.
+            untried_moves (List[Move]): The moves that have no child node yet.
+        """
+        self.player_to_move = player_to_move
+        self.player_just_moved = player_just_moved
+        self.untried_moves = untried_moves
+        self.children: Dict[Move, "TreeNode"] = {}
+        self.visits = 0
+        self.wins = 0.0
+        self.terminal = False
+
+    def select_child(self) -> Tuple[Move, "TreeNode"]:
+        """
+        Select the child with the highest UCT score.
+
+        Returns:
+            Tuple[Move, TreeNode]: The move leading to the selected child, and the child.
+        """
+        log_visits = math.log(self.visits)
+        return max(self.children.items(),
+                   key=lambda item: item[1].wins / item[1].visits +
+                   EXPLORATION * math.sqrt(log_visits / item[1].visits))
+
+
+def rollout(state: BoardState, player_index: int, rng: random.Random) -> List[float]:
+    """
+    Play a quick semi random game from a position.
+
+    Args:
+        state (BoardState): The board state; it is changed by the playout.
+        player_index (int): The index of the player to move.
+        rng (random.Random): The random number generator of the playout.
+
+    Returns:
+        List[float]: The reward of every player: 1 for the winner, or for the player closest to winning when the
+        playout is cut off, 0 for the others.
+    """
+    num_players = state.get_num_players()
+    for _ in range(ROLLOUT_LIMIT):
+        pieces = list(piece_cells(state, player_index))
+        rng.shuffle(pieces)
+        distances = goal_distances(num_players, player_index)
+        for source in pieces:
+            destinations = state.destination_cells(source)
+            if destinations:
+                if rng.random() < GREEDY_ROLLOUT_CHANCE:
+                    destination = min(destinations, key=lambda cell: distances[cell])
+                else:
+                    destination = rng.choice(destinations)
+                state.move_cells(source, destination)
+                if is_winning_move(state, destination, player_index):
+                    return [1.0 if player == player_index else 0.0 for player in range(num_players)]
+                break
+        player_index = (player_index + 1) % num_players
+
+    scores = [progress(state, player) for player in range(num_players)]
+    best = min(scores)
+    leaders = scores.count(best)
+    return [1.0 / leaders if score == best else 0.0 for score in scores]
+
+
+def run_tree_search(owners: bytes, num_of_players: int, player_index: int, playouts: int,
+                    time_budget: Optional[float], seed: int) -> Dict[Move, Tuple[int, float]]:
+    """
+    Run a Monte Carlo tree search from a position.
+
+    This is the unit of work of a single worker process, so it only takes picklable arguments.
+
+    Args:
+        owners (bytes): The owner of every cell of the root position, see BoardState.owners.
+        num_of_players (int): The number of players in the game.
+        player_index (int): The index of the player to move at the root.
+        playouts (int): The number of playouts to run.
+        time_budget (Optional[float]): Wall clock seconds after which the search stops early, if given.
+        seed (int): The seed of the random number generator.
+
+    Returns:
+        Dict[Move, Tuple[int, float]]: The visits and wins of every move of the root.
+    """
+    rng = random.Random(seed)
+    root_state = BoardState(num_of_players)
+    root_state.load_owners(owners)
+    previous_player = (player_index - 1) % num_of_players
+    root = TreeNode(player_index, previous_player, list(generate_moves(root_state, player_index)))
+    deadline = time.perf_counter() + time_budget if time_budget is not None else None
+
+    for _ in range(playouts):
+        if deadline is not None and time.perf_counter() > deadline:
+            break
+        state = root_state.copy()
+        node = root
+        path = [node]
+
+        # Selection
+        while not node.untried_moves and node.children and not node.terminal:
+            move, node = node.select_child()
+            state.move_cells(*move)
+            path.append(node)
+
+        # Expansion
+        if node.untried_moves and not node.terminal:
+            move = node.untried_moves.pop(rng.randrange(len(node.untried_moves)))
+            mover = node.player_to_move
+            state.move_cells(*move)
+            next_player = (mover + 1) % num_of_players
+            child = TreeNode(next_player, mover, list(generate_moves(state, next_player)))
+            child.terminal = is_winning_move(state, move[1], mover)
+            node.children[move] = child
+            node = child
+            path.append(node)
+
+        # Simulation
+        if node.terminal:
+            rewards = [1.0 if player == node.player_just_moved else 0.0 for player in range(num_of_players)]
+        else:
+            rewards = rollout(state, node.player_to_move, rng)
+
+        # Backpropagation
+        for visited in path:
+            visited.visits += 1
+            visited.wins += rewards[visited.player_just_moved]
+
+    return {move: (child.visits, child.wins) for move, child in root.children.items()}
+
+
+class MonteCarloSearch:
+    """
+    Monte Carlo tree search player that runs independent trees in a pool of worker processes.
+
+    Every worker searches its own tree from the root position with its own seed (root parallelism), and the
+    visit counts of the root moves are merged before the most visited move is played.
+    """
+
+    def __init__(self, playouts: int = 2000, time_budget: Optional[float] = 1.0,
+                 workers: Optional[int] = None, seed: Optional[int] = None) -> None:
+        """
+        Initializes a MonteCarloSearch object.
+
+        Args:
+            playouts (int): The total number of playouts of a move, split between the workers.
+            time_budget (Optional[float]): Wall clock seconds a move may take, or None to only count playouts.
+            workers (Optional[int]): The number of worker processes, the number of CPUs if not given.
+                With a single worker the search runs in the calling process.
+            seed (Optional[int]): Seed of the searches, for reproducible moves.
+        """
+        self.playouts = playouts
+        self.time_budget = time_budget
+        self.workers = workers or os.cpu_count() or 1
+        self.__rng = random.Random(seed)
+        self.__executor = None
+
+    def choose_move(self, state: BoardState, player_index: int) -> Optional[Move]:
+        """
+        Find the best move of a player.
+
+        Args:
+            state (BoardState): The board state; it is left unchanged.
+            player_index (int): The index of the player to move.
+
+        Returns:
+            Optional[Move]: The (from, to) cell ids of the most visited move, or None if the player cannot move.
+        """
+        # Playouts are not needed to see a move that wins right away
+        for source, destination in generate_moves(state, player_index):
+            if is_winning_move(state, destination, player_index):
+                return source, destination
+
+        statistics = self.search(state, player_index)
+        if not statistics:
+            return next(generate_moves(state, player_index), None)
+        return max(statistics, key=lambda move: statistics[move][0])
+
+    def search(self, state: BoardState, player_index: int) -> Dict[Move, Tuple[int, float]]:
+        """
+        Run the searches of all the workers and merge their root statistics.
+
+        Args:
+            state (BoardState): The board state.
+            player_index (int): The index of the player to move.
+
+        Returns:
+            Dict[Move, Tuple[int, float]]: The merged visits and wins of every move of the root.
+        """
+        owners = bytes(state.owners)
+        num_of_players = state.get_num_players()
+        shares = [self.playouts // self.workers + (1 if worker < self.playouts % self.workers else 0)
+                  for worker in range(self.workers)]
+        arguments = [(owners, num_of_players, player_index, share, self.time_budget, self.__rng.getrandbits(32))
+                     for share in shares if share > 0]
+
+        if len(arguments) == 1:
+            results = [run_tree_search(*arguments[0])]
+        else:
+            if self.__executor is None:
+                self.__executor = ProcessPoolExecutor(max_workers=self.workers)
+            futures = [self.__executor.submit(run_tree_search, *args) for args in arguments]
+            results = [future.result() for future in futures]
+
+        merged: Dict[Move, Tuple[int, float]] = {}
+        for result in results:
+            for move, (visits, wins) in result.items():
+                merged_visits, merged_wins = merged.get(move, (0, 0.0))
+                merged[move] = (merged_visits + visits, merged_wins + wins)
+        return merged
+
+    def close(self) -> None:
+        """
+        Shut down the worker processes, if any were started.
+        """
+        if self.__executor is not None:
+            self.__executor.shutdown()
+            self.__executor = None
@@ -0,0 +1,38 @@
+import unittest
+from boardState import BoardState
+from evaluation import is_winning_move
+from monteCarlo import MonteCarloSearch, run_tree_search
+
+
+class TestMonteCarloSearch(unittest.TestCase):
+    def setUp(self):
+        self.state = BoardState(2)
+
+    def test_tree_search_visits_root_moves(self):
+        statistics = run_tree_search(bytes(self.state.owners), 2, 1, 50, None, seed=3)
+        self.assertEqual(sum(visits for visits, _ in statistics.values()), 50)
+
+    def test_returns_a_legal_move(self):
+        search = MonteCarloSearch(playouts=60, time_budget=None, workers=1, seed=5)
+        source, destination = search.choose_move(self.state, 1)
+        row, col = self.state.get_cells()[source]
+        self.assertIn(self.state.get_cells()[destination], self.state.possible_moves(row, col))
+
+    def test_takes_a_winning_move(self):
+        self.state.move((3, 13), (5, 13))
+        self.state.move((13, 9), (4, 14))
+        search = MonteCarloSearch(playouts=20, time_budget=None, workers=1, seed=5)
+        source, destination = search.choose_move(self.state, 1)
+        self.assertTrue(is_winning_move(self.state, destination, 1))
+
+    def test_workers_statistics_are_merged(self):
+        search = MonteCarloSearch(playouts=40, time_budget=None, workers=2, seed=5)
+        try:
+            statistics = search.search(self.state, 0)
+        finally:
+            search.close()
+        self.assertEqual(sum(visits for visits, _ in statistics.values()), 40)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+from array import array
+from typing import Iterator, Tuple
+
+from boardState import BoardState
+
+Move = Tuple[int, int]
+
+
+def piece_cells(state: BoardState, player_index: int) -> Iterator[int]:
+    """
+    Iterate over the ids of the cells holding the pieces of a player.
+
+    Args:
+        state (BoardState): The board state.
+        player_index (int): The index of the player.
+
+    Yields:
+        int: The id of each cell with a piece of the player on it, lowest first.
+    """
+    owners = state.owners
+    owner = player_index + 1
+    cell = owners.find(owner)
+    while cell != -1:
+        yield cell
+        cell = owners.find(owner, cell + 1)
+
+
+def generate_moves(state: BoardState, player_index: int) -> Iterator[Move]:
+    """
+    Lazily generate all the legal moves of a player.
+
+    The moves of each piece are only calculated when the caller asks for them, so a caller that stops early
+    never pays for the remaining pieces.
+
+    Args:
+        state (BoardState): The board state.
+        player_index (int): The index of the player to move.
+
+    Yields:
+        Move: A (from, to) pair of cell ids for every legal move.
+    """
+    for source in piece_cells(state, player_index):
+        for destination in state.destination_cells(source):
+            yield source, destination
+
+
+def has_legal_move(state: BoardState, player_index: int) -> bool:
+    """
+    Check if a player has at least one legal move.
+
+    Args:
+        state (BoardState): The board state.
+        player_index (int): The index of the player.
+
+    Returns:
+        bool: True if the player can move, False if the player is stuck.
+    """
+    return next(generate_moves(state, player_index), None) is not None
+
+
+def pack_move(source: int, destination: int) -> int:
+    """
+    Pack a move into a single 16 bit number.
+
+    Args:
+        source (int): The id of the cell the piece moves from.
+        destination (int): The id of the cell the piece moves to.
+
+    Returns:
+        int: The packed move.
+    """
+    return source << 8 | destination
+
+
+def unpack_move(packed: int) -> Move:
+    """
+    Unpack a move packed by pack_move.
+
+    Args:
+        packed (int): The packed move.
+
+    Returns:
+        Move: The (from, to) pair of cell ids.
+    """
+    return packed >> 8, packed & 0xFF
+
+
+def generate_packed_moves(state: BoardState, player_index: int) -> array:
+    """
+    Generate all the legal moves of a player into a packed array.
+
+    Args:
+        state (BoardState): The board state.
+        player_index (int): The index of the player to move.
+
+    Returns:
+        array: An array of unsigned 16 bit packed moves, see pack_move.
+    """
+    return array("H", (source << 8 | destination for source, destination in generate_moves(state, player_index)))
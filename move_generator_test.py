@@ -0,0 +1,37 @@
+import unittest
+from boardState import BoardState
+from moveGenerator import generate_moves, generate_packed_moves, has_legal_move, piece_cells, unpack_move
+
+
+class TestMoveGenerator(unittest.TestCase):
+    def setUp(self):
+        self.state = BoardState(2)
+
+    def test_piece_cells(self):
+        cells = self.state.get_cells()
+        self.assertEqual(sorted(cells[cell] for cell in piece_cells(self.state, 1)),
+                         sorted(self.state.get_player_locations(1)))
+
+    def test_moves_match_possible_moves(self):
+        cells = self.state.get_cells()
+        generated = sorted((cells[source], cells[destination])
+                           for source, destination in generate_moves(self.state, 0))
+        expected = sorted((coord, dest) for coord in self.state.get_player_locations(0)
+                          for dest in self.state.possible_moves(coord[0], coord[1]))
+        self.assertEqual(generated, expected)
+
+    def test_packed_moves(self):
+        packed = generate_packed_moves(self.state, 1)
+        self.assertEqual([unpack_move(move) for move in packed], list(generate_moves(self.state, 1)))
+
+    def test_has_legal_move(self):
+        self.assertTrue(has_legal_move(self.state, 0))
+        # Fill the whole center so that no piece can move
+        for cell, owner in enumerate(self.state.owners):
+            if owner == 0:
+                self.state.owners[cell] = 2
+        self.assertFalse(has_legal_move(self.state, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
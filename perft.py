@@ -0,0 +1,207 @@
+"""
+Perft: counting the positions reachable in a fixed number of moves.
+
+Walks the whole game tree of a position to a given depth with the move generator behind calculate_possible_moves
+and counts the leaf nodes. The counts of the reference positions are a correctness check whenever the move
+generator changes, and the nodes searched per second are a stable measure of its speed.
+
+Usage:
+    python perft.py --depth 3
+    python perft.py --verify
+"""
+
+import argparse
+import sys
+import time
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from boardState import BoardState
+from evaluation import is_winning_move
+from moveGenerator import generate_moves
+
+Coordinates = Tuple[int, int]
+Move = Tuple[int, int]
+
+
+class ReferencePosition(NamedTuple):
+    """
+    A position with known perft counts.
+    """
+    name: str
+    num_of_players: int
+    moves: List[Tuple[Coordinates, Coordinates]]
+    player_index: int
+    node_counts: List[int]
+
+
+# Known node counts of depth 1, 2, ... from a few positions, reached by the listed moves from the start
+REFERENCE_POSITIONS = [
+    ReferencePosition("start 2 players", 2, [], 0, [14, 196, 3584, 65536]),
+    ReferencePosition("start 3 players", 3, [], 0, [14, 196, 1372, 25088]),
+    ReferencePosition("start 6 players", 6, [], 0, [14, 196, 1372, 9800]),
+    ReferencePosition("midgame 2 players", 2,
+                      [((3, 11), (4, 12)), ((14, 12), (12, 10)), ((3, 15), (4, 14)), ((13, 13), (12, 14)),
+                       ((4, 12), (5, 13)), ((15, 11), (14, 12)), ((5, 13), (6, 12)), ((13, 9), (11, 11))],
+                      0, [20, 520, 12012]),
+    ReferencePosition("midgame 3 players", 3,
+                      [((3, 13), (4, 12)), ((14, 10), (12, 8)), ((10, 2), (8, 4)), ((2, 10), (4, 8)),
+                       ((13, 9), (11, 7)), ((8, 4), (9, 5)), ((2, 12), (4, 10)), ((13, 11), (12, 10)),
+                       ((11, 1), (10, 2))],
+                      0, [26, 624, 9386]),
+]
+
+
+def perft(state: BoardState, depth: int, player_index: int) -> int:
+    """
+    Count the leaf nodes of the game tree of a position.
+
+    A move that wins the game is a leaf, and a player that cannot move passes the turn.
+
+    Args:
+        state (BoardState): The board state; it is left unchanged.
+        depth (int): The number of moves to look ahead.
+        player_index (int): The index of the player to move.
+
+    Returns:
+        int: The number of move sequences of the given length.
+    """
+    if depth == 0:
+        return 1
+    next_player = (player_index + 1) % state.get_num_players()
+    moves = list(generate_moves(state, player_index))
+    if not moves:
+        return perft(state, depth - 1, next_player)
+    if depth == 1:
+        # The leaves are counted without being played
+        return len(moves)
+    nodes = 0
+    for source, destination in moves:
+        if is_winning_move(state, destination, player_index):
+            nodes += 1
+            continue
+        state.move_cells(source, destination)
+        nodes += perft(state, depth - 1, next_player)
+        state.move_cells(destination, source)
+    return nodes
+
+
+def divide(state: BoardState, depth: int, player_index: int) -> Dict[Move, int]:
+    """
+    Count the leaf nodes under every move of a position, to find where two move generators disagree.
+
+    Args:
+        state (BoardState): The board state; it is left unchanged.
+        depth (int): The number of moves to look ahead, including the divided move.
+        player_index (int): The index of the player to move.
+
+    Returns:
+        Dict[Move, int]: The number of leaf nodes under each (from, to) cell id move.
+    """
+    next_player = (player_index + 1) % state.get_num_players()
+    counts = {}
+    for source, destination in generate_moves(state, player_index):
+        if is_winning_move(state, destination, player_index):
+            counts[(source, destination)] = 1
+            continue
+        state.move_cells(source, destination)
+        counts[(source, destination)] = perft(state, depth - 1, next_player)
+        state.move_cells(destination, source)
+    return counts
+
+
+def reference_state(position: ReferencePosition) -> BoardState:
+    """
+    Build the board state of a reference position.
+
+    Args:
+        position (ReferencePosition): The reference position.
+
+    Returns:
+        BoardState: The board state after the moves of the position.
+    """
+    state = BoardState(position.num_of_players)
+    for current_coord, dest_coord in position.moves:
+        state.move(current_coord, dest_coord)
+    return state
+
+
+def timed_perft(state: BoardState, max_depth: int, player_index: int) -> List[Tuple[int, int, float]]:
+    """
+    Run perft to every depth up to a maximum and time it.
+
+    Args:
+        state (BoardState): The board state; it is left unchanged.
+        max_depth (int): The deepest depth to run.
+        player_index (int): The index of the player to move.
+
+    Returns:
+        List[Tuple[int, int, float]]: The depth, node count and seconds of every run.
+    """
+    results = []
+    for depth in range(1, max_depth + 1):
+        start = time.perf_counter()
+        nodes = perft(state, depth, player_index)
+        results.append((depth, nodes, time.perf_counter() - start))
+    return results
+
+
+def verify(max_depth: Optional[int] = None) -> List[str]:
+    """
+    Check the node counts of the reference positions.
+
+    Args:
+        max_depth (Optional[int]): The deepest depth to check, all the known depths if not given.
+
+    Returns:
+        List[str]: A description of every count that differs from the known one; empty when all are right.
+    """
+    mismatches = []
+    for position in REFERENCE_POSITIONS:
+        state = reference_state(position)
+        for depth, expected in enumerate(position.node_counts[:max_depth], start=1):
+            nodes = perft(state, depth, position.player_index)
+            if nodes != expected:
+                mismatches.append(f"{position.name} depth {depth}: expected {expected}, got {nodes}")
+    return mismatches
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Run perft on the reference positions from the command line.
+
+    Args:
+        argv (Optional[Sequence[str]]): The command line arguments, sys.argv if not given.
+
+    Returns:
+        int: The exit status, 1 if a node count is wrong, otherwise 0.
+    """
+    parser = argparse.ArgumentParser(description="Count and time the game tree of the reference positions.")
+    parser.add_argument("--depth", type=int, default=3, help="the deepest depth to run")
+    parser.add_argument("--position", help="run only the reference position with this name")
+    parser.add_argument("--verify", action="store_true", help="only check the known node counts")
+    args = parser.parse_args(argv)
+
+    if args.verify:
+        mismatches = verify()
+        for mismatch in mismatches:
+            print(mismatch)
+        print("perft counts are correct" if not mismatches else f"{len(mismatches)} perft counts are wrong")
+        return 1 if mismatches else 0
+
+    failed = False
+    for position in REFERENCE_POSITIONS:
+        if args.position and position.name != args.position:
+            continue
+        print(position.name)
+        state = reference_state(position)
+        for depth, nodes, seconds in timed_perft(state, args.depth, position.player_index):
+            expected = position.node_counts[depth - 1] if depth <= len(position.node_counts) else None
+            status = "" if expected is None else " ok" if nodes == expected else f" expected {expected}"
+            failed = failed or (expected is not None and nodes != expected)
+            rate = nodes / seconds if seconds else 0.0
+            print(f"  depth {depth}: {nodes} nodes in {seconds:.3f}s, {rate:.0f} nodes/sec{status}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,35 @@
+import unittest
+from bitboard import BitboardMoveGenerator
+from perft import REFERENCE_POSITIONS, divide, perft, reference_state, verify
+
+
+class TestPerft(unittest.TestCase):
+    def test_reference_counts(self):
+        self.assertEqual(verify(max_depth=3), [])
+
+    def test_divide_adds_up_to_perft(self):
+        position = REFERENCE_POSITIONS[3]
+        state = reference_state(position)
+        self.assertEqual(sum(divide(state, 2, position.player_index).values()),
+                         perft(state, 2, position.player_index))
+
+    def test_state_is_left_unchanged(self):
+        position = REFERENCE_POSITIONS[4]
+        state = reference_state(position)
+        owners, key = bytes(state.owners), state.key
+        perft(state, 3, position.player_index)
+        self.assertEqual(bytes(state.owners), owners)
+        self.assertEqual(state.key, key)
+
+    def test_matches_bitboard_moves(self):
+        # The first level counts against the independent bitboard move generator
+        for position in REFERENCE_POSITIONS:
+            state = reference_state(position)
+            generator = BitboardMoveGenerator(position.num_of_players)
+            generator.load(state)
+            moves = generator.side_moves(position.player_index)
+            self.assertEqual(sum(len(destinations) for destinations in moves.values()), position.node_counts[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
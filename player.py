@@ -38,6 +38,17 @@ class Player:
         elif result == 'loss':
             self.__losses += 1
 
+    def set_stats(self, wins: int, losses: int) -> None:
+        """
+        Replace the player's statistics, e.g. when a saved game is resumed.
+
+        Args:
+            wins (int): The number of wins of the player.
+            losses (int): The number of losses of the player.
+        """
+        self.__wins = wins
+        self.__losses = losses
+
     def move_coord(self, current_coord: Coordinates, new_coord: Coordinates) -> None:
         """
         Update the player's current locations after a move.
@@ -49,6 +60,15 @@ class Player:
         self.__current_locations.remove(current_coord)
         self.__current_locations.append(new_coord)
 
+    def set_current_locations(self, locations: List[Coordinates]) -> None:
+        """
+        Replace the player's current locations, e.g. when a saved game is resumed.
+
+        Args:
+            locations (List[Coordinates]): The coordinates of the player's pieces.
+        """
+        self.__current_locations = list(locations)
+
     def get_player_home_locations(self) -> List[Coordinates]:
         """
         Get a list of all the home locations of the player.
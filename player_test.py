@@ -30,5 +30,15 @@ class TestPlayer(unittest.TestCase):
         self.player.reset_current_locations()
         self.assertEqual(self.player.get_player_current_locations(), [(0, 0), (1, 1)])
 
+    def test_set_current_locations(self):
+        self.player.set_current_locations([(2, 2), (1, 1)])
+        self.assertEqual(self.player.get_player_current_locations(), [(2, 2), (1, 1)])
+        self.assertEqual(self.player.get_player_home_locations(), [(0, 0), (1, 1)])
+
+    def test_set_stats(self):
+        self.player.set_stats(3, 2)
+        self.assertEqual(self.player.get_wins(), 3)
+        self.assertEqual(self.player.get_losses(), 2)
+
 if __name__ == '__main__':
     unittest.main()
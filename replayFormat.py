@@ -0,0 +1,394 @@
+"""
+Compact binary replay format.
+
+A replay file starts with a header: the magic bytes b"CCRP", the format version, the number of players and the
+name of every player in seating order (a 2 byte little endian length followed by UTF-8 bytes). After the header
+every move is a fixed 2 byte record: the cell id the piece moved from and the cell id it moved to, as numbered
+by BoardState. The records can be read in bulk without any parsing.
+
+Usage:
+    python replayFormat.py game_log_2024-04-01_13-29-55.txt game.ccr
+"""
+
+import argparse
+import struct
+from typing import BinaryIO, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from boardState import BoardState
+from gameLog import LoggedMove, read_game_log
+
+Move = Tuple[int, int]
+
+# First bytes of every replay file
+REPLAY_MAGIC = b"CCRP"
+
+# Version of the format written by ReplayWriter
+REPLAY_VERSION = 1
+
+# Bytes of a move record
+RECORD_SIZE = 2
+
+# Bytes read at once by ReplayReader, a whole number of records
+READ_CHUNK = 64 * 1024
+
+
+class ReplayHeader(NamedTuple):
+    """
+    The header of a replay file.
+    """
+    version: int
+    num_of_players: int
+    player_names: List[str]
+
+
+class ReplayWriter:
+    """
+    Writes a replay file move by move.
+    """
+
+    def __init__(self, file_name: str, num_of_players: int, player_names: Sequence[str]) -> None:
+        """
+        Initializes a ReplayWriter object and writes the header of the file.
+
+        Args:
+            file_name (str): The path of the replay file; an existing file is overwritten.
+            num_of_players (int): The number of players in the game.
+            player_names (Sequence[str]): The name of every player, in seating order.
+        """
+        self.moves = 0
+        self.__file: BinaryIO = open(file_name, "wb")
+        header = bytearray(REPLAY_MAGIC)
+        header += struct.pack("<BBB", REPLAY_VERSION, num_of_players, len(player_names))
+        for name in player_names:
+            encoded = name.encode("utf-8")
+            header += struct.pack("<H", len(encoded)) + encoded
+        self.__file.write(header)
+
+    def write_move(self, source: int, destination: int) -> None:
+        """
+        Add a move to the replay.
+
+        Args:
+            source (int): The id of the cell the piece moved from.
+            destination (int): The id of the cell the piece moved to.
+        """
+        self.__file.write(bytes((source, destination)))
+        self.moves += 1
+
+    def close(self) -> None:
+        """
+        Write out the moves and close the file.
+        """
+        self.__file.close()
+
+    def __enter__(self) -> "ReplayWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class ReplayReader:
+    """
+    Reads a replay file, streaming the moves from the file as they are iterated.
+    """
+
+    def __init__(self, file_name: str) -> None:
+        """
+        Initializes a ReplayReader object and reads the header of the file.
+
+        Args:
+            file_name (str): The path of the replay file.
+
+        Raises:
+            ValueError: If the file is not a replay file, its header is truncated, or it was written by a newer
+                version of the format.
+        """
+        self.__file: BinaryIO = open(file_name, "rb")
+        try:
+            self.header = self.__read_header()
+        except Exception:
+            self.__file.close()
+            raise
+
+    def __read_header(self) -> ReplayHeader:
+        """
+        Read the header at the start of the file.
+
+        Returns:
+            ReplayHeader: The header.
+        """
+        if self.__file.read(len(REPLAY_MAGIC)) != REPLAY_MAGIC:
+            raise ValueError(f"{self.__file.name} is not a replay file")
+        fields = self.__file.read(3)
+        if len(fields) != 3:
+            raise ValueError(f"The header of {self.__file.name} is truncated")
+        version, num_of_players, num_of_names = struct.unpack("<BBB", fields)
+        if version > REPLAY_VERSION:
+            raise ValueError(f"Replay format version {version} of {self.__file.name} is not supported")
+        names = []
+        for _ in range(num_of_names):
+            length_field = self.__file.read(2)
+            if len(length_field) != 2:
+                raise ValueError(f"The header of {self.__file.name} is truncated")
+            length, = struct.unpack("<H", length_field)
+            name = self.__file.read(length)
+            if len(name) != length:
+                raise ValueError(f"The header of {self.__file.name} is truncated")
+            names.append(name.decode("utf-8"))
+        return ReplayHeader(version, num_of_players, names)
+
+    def __iter__(self) -> Iterator[Move]:
+        """
+        Iterate over the moves of the replay, reading the file one chunk at a time.
+
+        Returns:
+            Iterator[Move]: The (from, to) cell ids of every move, in order.
+        """
+        while True:
+            chunk = self.__file.read(READ_CHUNK)
+            if not chunk:
+                return
+            if len(chunk) % RECORD_SIZE:
+                # A record split by a short read; a torn record at the very end of the file is dropped
+                chunk += self.__file.read(RECORD_SIZE - len(chunk) % RECORD_SIZE)
+            records = iter(chunk)
+            yield from zip(records, records)
+
+    def close(self) -> None:
+        """
+        Close the file.
+        """
+        self.__file.close()
+
+    def __enter__(self) -> "ReplayReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def read_replay(file_name: str) -> Tuple[ReplayHeader, List[Move]]:
+    """
+    Read a whole replay file at once.
+
+    Args:
+        file_name (str): The path of the replay file.
+
+    Returns:
+        Tuple[ReplayHeader, List[Move]]: The header and the moves of the replay.
+    """
+    with ReplayReader(file_name) as reader:
+        return reader.header, list(reader)
+
+
+class LoadedGame(NamedTuple):
+    """
+    A saved game, replayed onto a board.
+    """
+    state: BoardState
+    player_names: List[str]
+    moves: List[Move]
+    movers: List[int]
+    next_player: int
+
+
+def is_replay_file(file_name: str) -> bool:
+    """
+    Check if a file is a replay file rather than a text game log.
+
+    Args:
+        file_name (str): The path of the file.
+
+    Returns:
+        bool: True if the file starts with the replay magic bytes.
+    """
+    with open(file_name, "rb") as file:
+        return file.read(len(REPLAY_MAGIC)) == REPLAY_MAGIC
+
+
+def apply_moves(state: BoardState, moves: Iterable[Move]) -> Iterator[Tuple[Move, int]]:
+    """
+    Play moves onto a board one at a time, checking each of them first.
+
+    Args:
+        state (BoardState): The board the moves are played on; it is changed before each move is yielded.
+        moves (Iterable[Move]): The (from, to) cell ids of the moves, in order.
+
+    Returns:
+        Iterator[Tuple[Move, int]]: Every move and the index of the player that made it.
+
+    Raises:
+        ValueError: If a move is not on the board or does not start from a piece.
+    """
+    num_cells = len(state.owners)
+    for source, destination in moves:
+        if source >= num_cells or destination >= num_cells:
+            raise ValueError(f"The move {source} -> {destination} is not on a board of "
+                             f"{state.get_num_players()} players")
+        owner = state.owners[source]
+        if not owner:
+            raise ValueError(f"There is no piece to move at {state.get_cells()[source]}")
+        state.move_cells(source, destination)
+        yield (source, destination), owner - 1
+
+
+def replay_moves(num_of_players: int, moves: Iterable[Move]) -> Tuple[BoardState, List[int], List[Move]]:
+    """
+    Play moves onto a new board, finding the player that made each of them.
+
+    Args:
+        num_of_players (int): The number of players in the game.
+        moves (Iterable[Move]): The (from, to) cell ids of the moves, in order.
+
+    Returns:
+        Tuple[BoardState, List[int], List[Move]]: The final board state, the index of the player that made each
+        move, and the moves.
+
+    Raises:
+        ValueError: If a move is not on the board or does not start from a piece.
+    """
+    state = BoardState(num_of_players)
+    movers = []
+    played = []
+    for move, mover in apply_moves(state, moves):
+        movers.append(mover)
+        played.append(move)
+    return state, movers, played
+
+
+def logged_cell_moves(num_of_players: int, logged_moves: Iterable[LoggedMove]) -> Iterator[Move]:
+    """
+    Convert the moves of a text game log to cell ids.
+
+    Args:
+        num_of_players (int): The number of players in the game.
+        logged_moves (Iterable[LoggedMove]): The logged moves.
+
+    Returns:
+        Iterator[Move]: The (from, to) cell ids of every move, in order.
+
+    Raises:
+        ValueError: If a logged move is not on the board of the number of players.
+    """
+    state = BoardState(num_of_players)
+    for move in logged_moves:
+        source, destination = state.cell_id(*move.source), state.cell_id(*move.destination)
+        if source is None or destination is None:
+            raise ValueError(f"The move {move.source} -> {move.destination} of {move.player_name} "
+                             f"is not on a board of {num_of_players} players")
+        yield source, destination
+
+
+def seat_names(num_of_players: int, movers: Sequence[int], logged_moves: Sequence[LoggedMove]) -> List[str]:
+    """
+    Name the players of a text game log after the moves they made.
+
+    Args:
+        num_of_players (int): The number of players in the game.
+        movers (Sequence[int]): The index of the player that made each move.
+        logged_moves (Sequence[LoggedMove]): The logged moves.
+
+    Returns:
+        List[str]: The name of every player, from their first logged move, or "Player <number>" if they never moved.
+    """
+    names: List[Optional[str]] = [None] * num_of_players
+    for mover, move in zip(movers, logged_moves):
+        if names[mover] is None:
+            names[mover] = move.player_name
+    return [name if name is not None else f"Player {seat + 1}" for seat, name in enumerate(names)]
+
+
+def load_text_log(file_name: str) -> LoadedGame:
+    """
+    Replay a text game log, as written by Game.log_move, onto a board.
+
+    Args:
+        file_name (str): The path of the text log.
+
+    Returns:
+        LoadedGame: The replayed game. Players are named after their first logged move, or "Player <number>" if
+        they never moved.
+
+    Raises:
+        ValueError: If a logged move is not on the board of the logged number of players, or does not start from
+            a piece.
+    """
+    num_of_players, logged_moves = read_game_log(file_name)
+    state, movers, moves = replay_moves(num_of_players, logged_cell_moves(num_of_players, logged_moves))
+    return LoadedGame(state, seat_names(num_of_players, movers, logged_moves), moves, movers,
+                      (movers[-1] + 1) % num_of_players if movers else 0)
+
+
+def load_replay(file_name: str) -> LoadedGame:
+    """
+    Replay a replay file onto a board.
+
+    Args:
+        file_name (str): The path of the replay file.
+
+    Returns:
+        LoadedGame: The replayed game. Players missing from the header are named "Player <number>".
+    """
+    with ReplayReader(file_name) as reader:
+        num_of_players = reader.header.num_of_players
+        state, movers, moves = replay_moves(num_of_players, reader)
+        names = reader.header.player_names[:num_of_players]
+    names += [f"Player {seat + 1}" for seat in range(len(names), num_of_players)]
+    return LoadedGame(state, names, moves, movers, (movers[-1] + 1) % num_of_players if movers else 0)
+
+
+def load_game(file_name: str) -> LoadedGame:
+    """
+    Replay a saved game onto a board, from either a text game log or a replay file.
+
+    Args:
+        file_name (str): The path of the saved game.
+
+    Returns:
+        LoadedGame: The replayed game.
+    """
+    if is_replay_file(file_name):
+        return load_replay(file_name)
+    return load_text_log(file_name)
+
+
+def convert_text_log(log_file_name: str, replay_file_name: str) -> int:
+    """
+    Convert a text game log, as written by Game.log_move, to a replay file.
+
+    Args:
+        log_file_name (str): The path of the text log.
+        replay_file_name (str): The path of the replay file to write.
+
+    Returns:
+        int: The number of converted moves.
+
+    Raises:
+        ValueError: If a logged move is not on the board of the logged number of players, or does not start from
+            a piece.
+    """
+    game = load_text_log(log_file_name)
+    with ReplayWriter(replay_file_name, game.state.get_num_players(), game.player_names) as writer:
+        for source, destination in game.moves:
+            writer.write_move(source, destination)
+        return writer.moves
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """
+    Convert a text game log to a replay file from the command line.
+
+    Args:
+        argv (Optional[Sequence[str]]): The command line arguments, sys.argv if not given.
+    """
+    parser = argparse.ArgumentParser(description="Convert a text game log to a compact replay file.")
+    parser.add_argument("log", help="the text game log")
+    parser.add_argument("replay", help="the replay file to write")
+    args = parser.parse_args(argv)
+    moves = convert_text_log(args.log, args.replay)
+    print(f"Converted {moves} moves to {args.replay}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from boardState import BoardState
+from gameLog import read_game_log
+from replayFormat import ReplayReader, apply_moves, is_replay_file, logged_cell_moves, seat_names
+
+Move = Tuple[int, int]
+
+# Moves between two keyframes of a timeline
+DEFAULT_KEYFRAME_INTERVAL = 32
+
+
+class ReplayTimeline:
+    """
+    The positions of a saved game, for jumping to any move of it.
+
+    While the moves are read, a snapshot of the board is kept every keyframe_interval moves, so seeking to a move
+    loads the keyframe before it and plays at most keyframe_interval - 1 moves.
+    """
+
+    def __init__(self, num_of_players: int, moves: Iterable[Move], player_names: Optional[Sequence[str]] = None,
+                 keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL) -> None:
+        """
+        Initializes a ReplayTimeline object, reading all the moves. The timeline starts at the first position.
+
+        Args:
+            num_of_players (int): The number of players in the game.
+            moves (Iterable[Move]): The (from, to) cell ids of the moves, in order; read only once.
+            player_names (Optional[Sequence[str]]): The name of every player, in seating order.
+            keyframe_interval (int): The number of moves between two keyframes.
+
+        Raises:
+            ValueError: If a move is not on the board or does not start from a piece.
+        """
+        if keyframe_interval < 1:
+            raise ValueError(f"The keyframe interval must be positive, got {keyframe_interval}")
+        self.keyframe_interval = keyframe_interval
+        self.player_names = list(player_names) if player_names is not None else \
+            [f"Player {seat + 1}" for seat in range(num_of_players)]
+        self.moves: List[Move] = []
+        self.movers: List[int] = []
+        self.state = BoardState(num_of_players)
+        self.position = 0
+        self.__keyframes = [bytes(self.state.owners)]
+
+        for move, mover in apply_moves(self.state, moves):
+            self.moves.append(move)
+            self.movers.append(mover)
+            if len(self.moves) % keyframe_interval == 0:
+                self.__keyframes.append(bytes(self.state.owners))
+        self.state.load_owners(self.__keyframes[0])
+
+    def __len__(self) -> int:
+        """
+        Get the number of moves of the game.
+
+        Returns:
+            int: The number of moves.
+        """
+        return len(self.moves)
+
+    def seek(self, move_number: int) -> List[int]:
+        """
+        Go to the position after a number of moves.
+
+        Args:
+            move_number (int): The number of moves played; clamped to the length of the game.
+
+        Returns:
+            List[int]: The ids of the cells whose owner changed.
+        """
+        move_number = max(0, min(move_number, len(self.moves)))
+        before = bytes(self.state.owners)
+        if not 0 <= move_number - self.position < self.keyframe_interval:
+            # Jump to the last keyframe at or before the move
+            keyframe = move_number // self.keyframe_interval
+            self.state.load_owners(self.__keyframes[keyframe])
+            self.position = keyframe * self.keyframe_interval
+        for source, destination in self.moves[self.position:move_number]:
+            self.state.move_cells(source, destination)
+        self.position = move_number
+        return [cell for cell, (old, new) in enumerate(zip(before, self.state.owners)) if old != new]
+
+    def step(self, moves: int = 1) -> List[int]:
+        """
+        Go forward, or back for a negative number, by some moves.
+
+        Args:
+            moves (int): The number of moves to go forward.
+
+        Returns:
+            List[int]: The ids of the cells whose owner changed.
+        """
+        return self.seek(self.position + moves)
+
+    def last_mover(self) -> Optional[int]:
+        """
+        Get the player that made the move leading to the current position.
+
+        Returns:
+            Optional[int]: The index of the player, or None at the first position.
+        """
+        return self.movers[self.position - 1] if self.position else None
+
+
+def load_timeline(file_name: str, keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL) -> ReplayTimeline:
+    """
+    Read the timeline of a saved game, from either a text game log or a replay file.
+
+    Args:
+        file_name (str): The path of the saved game.
+        keyframe_interval (int): The number of moves between two keyframes.
+
+    Returns:
+        ReplayTimeline: The timeline of the game.
+    """
+    if is_replay_file(file_name):
+        with ReplayReader(file_name) as reader:
+            num_of_players = reader.header.num_of_players
+            names = reader.header.player_names[:num_of_players]
+            names += [f"Player {seat + 1}" for seat in range(len(names), num_of_players)]
+            return ReplayTimeline(num_of_players, reader, names, keyframe_interval)
+    num_of_players, logged_moves = read_game_log(file_name)
+    timeline = ReplayTimeline(num_of_players, logged_cell_moves(num_of_players, logged_moves),
+                              keyframe_interval=keyframe_interval)
+    timeline.player_names = seat_names(num_of_players, timeline.movers, logged_moves)
+    return timeline
@@ -0,0 +1,240 @@
+"""
+Replay viewer of saved games.
+
+Shows a saved game move by move, with play/pause, single steps, a playback speed and a slider to jump to any move.
+Playback is scheduled with root.after, so the window stays responsive while a game plays, and the changed cells
+are repainted together once per frame, so fast playback and dragging the slider do not flood the event loop.
+
+Usage:
+    python replayViewer.py game_log_2024-04-01_13-29-55.txt
+"""
+
+import argparse
+import tkinter as tk
+from tkinter import messagebox
+from typing import Iterable, Optional, Sequence
+
+from boardLayout import COLORS
+from cellRenderer import CellRenderer
+from replayTimeline import DEFAULT_KEYFRAME_INTERVAL, ReplayTimeline, load_timeline
+
+# Playback speed a replay starts with, in moves per second
+DEFAULT_SPEED = 2.0
+
+# Slowest and fastest playback speeds, in moves per second
+MIN_SPEED = 0.5
+MAX_SPEED = 20.0
+
+
+class ReplayViewer:
+    """
+    A window that plays back the timeline of a saved game.
+    """
+
+    def __init__(self, timeline: ReplayTimeline, speed: float = DEFAULT_SPEED) -> None:
+        """
+        Initializes a ReplayViewer object and creates its window.
+
+        Args:
+            timeline (ReplayTimeline): The timeline of the game to show.
+            speed (float): The playback speed, in moves per second.
+        """
+        self.timeline = timeline
+        self.speed = speed
+        self.playing = False
+        self.__after_id = None
+        buttons = []
+
+        self.root = tk.Tk()
+        self.root.title("Chinese Checkers - Replay")
+        self.root.configure(bg="lightblue")
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
+
+        board_frame = tk.Frame(self.root, bg="lightblue")
+        board_frame.pack(padx=10, pady=10)
+        state = timeline.state
+        for cell, (row, col) in enumerate(state.get_cells()):
+            button = tk.Button(board_frame, text="", width=2, bg=state.color_at(row, col))
+            button.grid(row=row, column=col)
+            buttons.append(button)
+        self.__renderer = CellRenderer(self.root, buttons, state.cell_color,
+                                       [state.cell_color(cell) for cell in range(len(buttons))])
+
+        controls = tk.Frame(self.root, bg="lightblue")
+        controls.pack(pady=5)
+        tk.Button(controls, text="<<", command=lambda: self.seek(0)).pack(side=tk.LEFT)
+        tk.Button(controls, text="<", command=lambda: self.step(-1)).pack(side=tk.LEFT)
+        self.play_button = tk.Button(controls, text="Play", width=6, command=self.toggle)
+        self.play_button.pack(side=tk.LEFT)
+        tk.Button(controls, text=">", command=lambda: self.step(1)).pack(side=tk.LEFT)
+        tk.Button(controls, text=">>", command=lambda: self.seek(len(self.timeline))).pack(side=tk.LEFT)
+
+        self.move_scale = tk.Scale(self.root, from_=0, to=len(timeline), orient=tk.HORIZONTAL, length=400,
+                                   label="Move", command=self.handle_seek, bg="lightblue")
+        self.move_scale.pack()
+        self.speed_scale = tk.Scale(self.root, from_=MIN_SPEED, to=MAX_SPEED, resolution=0.5, orient=tk.HORIZONTAL,
+                                    length=400, label="Moves per second", command=self.handle_speed, bg="lightblue")
+        self.speed_scale.set(speed)
+        self.speed_scale.pack()
+        self.status_label = tk.Label(self.root, text="", bg="lightblue", font=("Arial", 12))
+        self.status_label.pack(pady=5)
+        self.update_status()
+
+    def render(self, cells: Iterable[int]) -> None:
+        """
+        Mark the buttons of some cells to be repainted with the colors of the current position once the event loop
+        is idle.
+
+        Args:
+            cells (Iterable[int]): The ids of the cells to repaint.
+        """
+        self.__renderer.mark(*cells)
+
+    def update_status(self) -> None:
+        """
+        Show the current move number and the player that made it.
+        """
+        mover = self.timeline.last_mover()
+        text = f"Move {self.timeline.position} of {len(self.timeline)}"
+        if mover is not None:
+            text += f" - {self.timeline.player_names[mover]} ({COLORS[mover]})"
+        self.status_label.config(text=text)
+        if int(self.move_scale.get()) != self.timeline.position:
+            self.move_scale.set(self.timeline.position)
+
+    def seek(self, move_number: int) -> None:
+        """
+        Show the position after a number of moves.
+
+        Args:
+            move_number (int): The number of moves played.
+        """
+        self.render(self.timeline.seek(move_number))
+        self.update_status()
+
+    def step(self, moves: int) -> None:
+        """
+        Pause the playback and go forward, or back for a negative number, by some moves.
+
+        Args:
+            moves (int): The number of moves to go forward.
+        """
+        self.pause()
+        self.seek(self.timeline.position + moves)
+
+    def handle_seek(self, value: str) -> None:
+        """
+        Handle a move of the move slider.
+
+        Args:
+            value (str): The move number the slider was moved to.
+        """
+        if int(float(value)) != self.timeline.position:
+            self.seek(int(float(value)))
+
+    def handle_speed(self, value: str) -> None:
+        """
+        Handle a move of the speed slider.
+
+        Args:
+            value (str): The new playback speed, in moves per second.
+        """
+        self.speed = float(value)
+
+    def play(self) -> None:
+        """
+        Start playing the game from the current move, starting over if the game is at its end.
+        """
+        if self.playing:
+            return
+        if self.timeline.position >= len(self.timeline):
+            self.seek(0)
+        self.playing = True
+        self.play_button.config(text="Pause")
+        self.__schedule()
+
+    def pause(self) -> None:
+        """
+        Stop playing the game.
+        """
+        self.playing = False
+        self.play_button.config(text="Play")
+        if self.__after_id is not None:
+            self.root.after_cancel(self.__after_id)
+            self.__after_id = None
+
+    def toggle(self) -> None:
+        """
+        Play the game if it is paused, or pause it if it is playing.
+        """
+        if self.playing:
+            self.pause()
+        else:
+            self.play()
+
+    def __schedule(self) -> None:
+        """
+        Schedule the next move of the playback.
+        """
+        self.__after_id = self.root.after(int(1000 / self.speed), self.__tick)
+
+    def __tick(self) -> None:
+        """
+        Play the next move, and schedule the one after it until the end of the game.
+        """
+        self.__after_id = None
+        if not self.playing:
+            return
+        self.seek(self.timeline.position + 1)
+        if self.timeline.position >= len(self.timeline):
+            self.pause()
+        else:
+            self.__schedule()
+
+    def run(self) -> None:
+        """
+        Show the window until it is closed.
+        """
+        self.root.mainloop()
+
+    def close(self) -> None:
+        """
+        Stop the playback and close the window.
+        """
+        self.pause()
+        self.root.destroy()
+
+
+def watch_replay(file_name: str, keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL) -> None:
+    """
+    Show the replay of a saved game until its window is closed.
+
+    Args:
+        file_name (str): The path of the saved game, a text game log or a replay file.
+        keyframe_interval (int): The number of moves between two keyframes of the timeline.
+    """
+    try:
+        timeline = load_timeline(file_name, keyframe_interval)
+    except (OSError, ValueError) as e:
+        messagebox.showerror("Error", f"An error occurred while loading the replay: {str(e)}")
+        return
+    ReplayViewer(timeline).run()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """
+    Show the replay of a saved game from the command line.
+
+    Args:
+        argv (Optional[Sequence[str]]): The command line arguments, sys.argv if not given.
+    """
+    parser = argparse.ArgumentParser(description="Watch the replay of a saved game.")
+    parser.add_argument("file", help="the text game log or replay file")
+    parser.add_argument("--keyframe-interval", type=int, default=DEFAULT_KEYFRAME_INTERVAL,
+                        help="moves between two keyframes")
+    args = parser.parse_args(argv)
+    watch_replay(args.file, args.keyframe_interval)
+
+
+if __name__ == "__main__":
+    main()
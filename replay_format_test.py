@@ -0,0 +1,113 @@
+import os
+import tempfile
+import unittest
+from boardState import BoardState
+from gameLog import LOG_HEADER, format_move_line
+from replayFormat import REPLAY_VERSION, ReplayReader, ReplayWriter, convert_text_log, load_game, read_replay
+
+
+class TestReplayFormat(unittest.TestCase):
+    def setUp(self):
+        handle, self.file_name = tempfile.mkstemp(suffix=".ccr")
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.file_name)
+
+    def test_round_trip(self):
+        with ReplayWriter(self.file_name, 3, ["Naama", "A. B. Name", "Computer"]) as writer:
+            writer.write_move(0, 120)
+            writer.write_move(17, 40)
+        header, moves = read_replay(self.file_name)
+        self.assertEqual(header.version, REPLAY_VERSION)
+        self.assertEqual(header.num_of_players, 3)
+        self.assertEqual(header.player_names, ["Naama", "A. B. Name", "Computer"])
+        self.assertEqual(moves, [(0, 120), (17, 40)])
+
+    def test_records_are_two_bytes(self):
+        with ReplayWriter(self.file_name, 2, []) as writer:
+            for move in range(1000):
+                writer.write_move(move % 81, (move + 1) % 81)
+        self.assertEqual(os.path.getsize(self.file_name), 4 + 3 + 2 * 1000)
+        with ReplayReader(self.file_name) as reader:
+            self.assertEqual(sum(1 for _ in reader), 1000)
+
+    def test_rejects_other_files(self):
+        with open(self.file_name, "wb") as replay_file:
+            replay_file.write(LOG_HEADER.encode())
+        with self.assertRaises(ValueError):
+            ReplayReader(self.file_name)
+
+    def test_rejects_newer_versions(self):
+        with open(self.file_name, "wb") as replay_file:
+            replay_file.write(b"CCRP" + bytes((REPLAY_VERSION + 1, 2, 0)))
+        with self.assertRaises(ValueError):
+            ReplayReader(self.file_name)
+
+    def test_rejects_truncated_headers(self):
+        header = b"CCRP" + bytes((REPLAY_VERSION, 2, 1)) + b"\x05\x00Naama"
+        for length in (len(header) - 6, len(header) - 5, len(header) - 1):
+            with open(self.file_name, "wb") as replay_file:
+                replay_file.write(header[:length])
+            with self.assertRaisesRegex(ValueError, "truncated"):
+                ReplayReader(self.file_name)
+
+    def test_convert_text_log(self):
+        handle, log_file_name = tempfile.mkstemp(suffix=".txt")
+        with os.fdopen(handle, "w") as log_file:
+            log_file.write(f"{LOG_HEADER}\n2\n")
+            log_file.write(format_move_line("Dr. Who", "blue", (3, 13), (4, 14), "2024-05-14 20:54:30"))
+            log_file.write(format_move_line("Computer", "yellow", (13, 9), (12, 10), "2024-05-14 20:54:31"))
+            log_file.write("The winner is: Dr. Who\n")
+        try:
+            self.assertEqual(convert_text_log(log_file_name, self.file_name), 2)
+        finally:
+            os.remove(log_file_name)
+        header, moves = read_replay(self.file_name)
+        self.assertEqual(header.player_names, ["Dr. Who", "Computer"])
+        state = BoardState(2)
+        self.assertEqual(moves, [(state.cell_id(3, 13), state.cell_id(4, 14)),
+                                 (state.cell_id(13, 9), state.cell_id(12, 10))])
+
+
+class TestLoadGame(unittest.TestCase):
+    def setUp(self):
+        handle, self.log_file_name = tempfile.mkstemp(suffix=".txt")
+        with os.fdopen(handle, "w") as log_file:
+            log_file.write(f"{LOG_HEADER}\n3\n")
+            log_file.write(format_move_line("Naama", "blue", (3, 13), (4, 14)))
+            log_file.write(format_move_line("Dana", "yellow", (13, 9), (12, 10)))
+            log_file.write(format_move_line("Rina", "red", (9, 3), (8, 4)))
+            log_file.write(format_move_line("Naama", "blue", (4, 14), (5, 15)))
+        self.replay_file_name = self.log_file_name[:-len(".txt")] + ".ccr"
+
+    def tearDown(self):
+        os.remove(self.log_file_name)
+        if os.path.exists(self.replay_file_name):
+            os.remove(self.replay_file_name)
+
+    def test_load_text_log(self):
+        game = load_game(self.log_file_name)
+        self.assertEqual(game.player_names, ["Naama", "Dana", "Rina"])
+        self.assertEqual(game.movers, [0, 1, 2, 0])
+        self.assertEqual(game.next_player, 1)
+        self.assertIn((5, 15), game.state.get_player_locations(0))
+        self.assertNotIn((3, 13), game.state.get_player_locations(0))
+
+    def test_load_replay_file(self):
+        convert_text_log(self.log_file_name, self.replay_file_name)
+        from_text = load_game(self.log_file_name)
+        from_replay = load_game(self.replay_file_name)
+        self.assertEqual(bytes(from_replay.state.owners), bytes(from_text.state.owners))
+        self.assertEqual(from_replay.player_names, from_text.player_names)
+        self.assertEqual(from_replay.next_player, from_text.next_player)
+
+    def test_move_without_a_piece(self):
+        with open(self.log_file_name, "a") as log_file:
+            log_file.write(format_move_line("Dana", "yellow", (8, 12), (9, 13)))
+        with self.assertRaises(ValueError):
+            load_game(self.log_file_name)
+
+
+if __name__ == '__main__':
+    unittest.main()
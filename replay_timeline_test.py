@@ -0,0 +1,91 @@
+import os
+import random
+import tempfile
+import unittest
+from boardState import BoardState
+from gameLog import LOG_HEADER, format_move_line
+from moveGenerator import generate_moves
+from replayFormat import convert_text_log
+from replayTimeline import ReplayTimeline, load_timeline
+
+
+def random_game(num_of_players, moves, seed):
+    rng = random.Random(seed)
+    state = BoardState(num_of_players)
+    played = []
+    positions = [bytes(state.owners)]
+    player_index = 0
+    while len(played) < moves:
+        move = rng.choice(list(generate_moves(state, player_index)))
+        state.move_cells(*move)
+        played.append(move)
+        positions.append(bytes(state.owners))
+        player_index = (player_index + 1) % num_of_players
+    return played, positions
+
+
+class TestReplayTimeline(unittest.TestCase):
+    def setUp(self):
+        self.moves, self.positions = random_game(3, 100, seed=6)
+        self.timeline = ReplayTimeline(3, iter(self.moves), keyframe_interval=8)
+
+    def test_starts_at_the_first_position(self):
+        self.assertEqual(len(self.timeline), 100)
+        self.assertEqual(self.timeline.position, 0)
+        self.assertEqual(bytes(self.timeline.state.owners), self.positions[0])
+
+    def test_seek_anywhere(self):
+        for move_number in (57, 3, 100, 0, 64, 63, 65, 8):
+            self.timeline.seek(move_number)
+            self.assertEqual(self.timeline.position, move_number)
+            self.assertEqual(bytes(self.timeline.state.owners), self.positions[move_number])
+            self.assertEqual(self.timeline.state.key,
+                             self.timeline.state.get_zobrist_keys().position_key(self.timeline.state.owners))
+
+    def test_seek_is_clamped(self):
+        self.timeline.seek(500)
+        self.assertEqual(self.timeline.position, 100)
+        self.timeline.seek(-5)
+        self.assertEqual(self.timeline.position, 0)
+
+    def test_step_returns_changed_cells(self):
+        self.timeline.seek(20)
+        changed = self.timeline.step()
+        self.assertEqual(sorted(changed), sorted(self.moves[20]))
+        self.assertEqual(sorted(self.timeline.step(-1)), sorted(self.moves[20]))
+        self.assertEqual(self.timeline.position, 20)
+
+    def test_movers(self):
+        self.assertEqual(self.timeline.movers[:6], [0, 1, 2, 0, 1, 2])
+        self.assertIsNone(self.timeline.last_mover())
+        self.timeline.seek(5)
+        self.assertEqual(self.timeline.last_mover(), 1)
+
+    def test_move_without_a_piece(self):
+        with self.assertRaises(ValueError):
+            ReplayTimeline(2, [(40, 41)])
+
+
+class TestLoadTimeline(unittest.TestCase):
+    def test_load_text_log_and_replay_file(self):
+        handle, log_file_name = tempfile.mkstemp(suffix=".txt")
+        with os.fdopen(handle, "w") as log_file:
+            log_file.write(f"{LOG_HEADER}\n2\n")
+            log_file.write(format_move_line("Naama", "blue", (3, 13), (4, 14)))
+            log_file.write(format_move_line("Dana", "yellow", (13, 9), (12, 10)))
+        replay_file_name = log_file_name[:-len(".txt")] + ".ccr"
+        try:
+            convert_text_log(log_file_name, replay_file_name)
+            for file_name in (log_file_name, replay_file_name):
+                timeline = load_timeline(file_name, keyframe_interval=1)
+                self.assertEqual(timeline.player_names, ["Naama", "Dana"])
+                timeline.seek(2)
+                self.assertEqual(timeline.state.color_at(4, 14), "blue")
+                self.assertEqual(timeline.state.color_at(12, 10), "yellow")
+        finally:
+            os.remove(log_file_name)
+            os.remove(replay_file_name)
+
+
+if __name__ == '__main__':
+    unittest.main()
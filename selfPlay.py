@@ -0,0 +1,229 @@
+"""
+Headless self-play between computer levels.
+
+Runs matches between two or more computer levels across a pool of worker processes, without any window, and
+reports the win rate of every entrant, the game lengths and the number of moves played per second.
+
+Usage:
+    python selfPlay.py --levels 2 3 --games 100 --workers 4 --seed 7
+"""
+
+import argparse
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+from boardState import BoardState
+from computerPlayer import LEVELS, ComputerPlayer
+from evaluation import is_winning_move
+
+# Plies after which an unfinished game is scored as a draw
+DEFAULT_MAX_MOVES = 400
+
+# Wall clock seconds a move of level 3 or 4 may take in self-play, shorter than in the GUI to keep matches quick
+DEFAULT_TIME_BUDGET = 0.05
+
+# Playouts of a level 4 move in self-play
+DEFAULT_PLAYOUTS = 200
+
+
+class GameResult(NamedTuple):
+    """
+    The outcome of a single self-play game.
+    """
+    seed: int
+    seats: List[int]
+    winner: Optional[int]
+    moves: int
+    seconds: float
+
+
+def play_game(seats: Sequence[int], seed: int, max_moves: int = DEFAULT_MAX_MOVES,
+              time_budget: float = DEFAULT_TIME_BUDGET, playouts: int = DEFAULT_PLAYOUTS) -> GameResult:
+    """
+    Play a game between computer players.
+
+    This is the unit of work of a single worker process, so it only takes picklable arguments.
+
+    Args:
+        seats (Sequence[int]): The level of the computer in every seat, in turn order.
+        seed (int): The seed of the game; the same seed and seats always play the same game, apart from the
+            time bounded searches of levels 3 and 4.
+        max_moves (int): The number of plies after which the game is a draw.
+        time_budget (float): Wall clock seconds a move of level 3 or 4 may take.
+        playouts (int): The number of playouts of a level 4 move.
+
+    Returns:
+        GameResult: The outcome of the game; the winner is the index of a seat, or None for a draw.
+    """
+    rng = random.Random(seed)
+    players = [ComputerPlayer(level, seed=rng.getrandbits(32), time_budget=time_budget, workers=1,
+                              playouts=playouts) for level in seats]
+    state = BoardState(len(seats))
+    winner = None
+    moves = 0
+    passes = 0
+    player_index = 0
+    start = time.perf_counter()
+    try:
+        while moves < max_moves and passes < len(seats):
+            move = players[player_index].choose_move(state, player_index)
+            if move is None:
+                # A player that cannot move passes the turn; the game is a draw when nobody can move
+                passes += 1
+            else:
+                passes = 0
+                moves += 1
+                state.move_cells(*move)
+                if is_winning_move(state, move[1], player_index):
+                    winner = player_index
+                    break
+            player_index = (player_index + 1) % len(seats)
+    finally:
+        for player in players:
+            player.close()
+    return GameResult(seed, list(seats), winner, moves, time.perf_counter() - start)
+
+
+def schedule(levels: Sequence[int], games: int, seed: int) -> List[Sequence]:
+    """
+    Get the seats and seed of every game of a match.
+
+    The seats are rotated from one game to the next so every entrant plays from every seat equally often.
+
+    Args:
+        levels (Sequence[int]): The level of every entrant.
+        games (int): The number of games to play.
+        seed (int): The seed of the match.
+
+    Returns:
+        List[Sequence]: The seats of every game, as levels in turn order, and the seed of the game.
+    """
+    schedules = []
+    for game in range(games):
+        shift = game % len(levels)
+        schedules.append((list(levels[shift:]) + list(levels[:shift]), seed + game))
+    return schedules
+
+
+def run_match(levels: Sequence[int], games: int, workers: Optional[int] = None, seed: int = 0,
+              max_moves: int = DEFAULT_MAX_MOVES, time_budget: float = DEFAULT_TIME_BUDGET,
+              playouts: int = DEFAULT_PLAYOUTS) -> Dict:
+    """
+    Play a match between computer levels across a pool of worker processes.
+
+    Args:
+        levels (Sequence[int]): The level of every entrant, two to six of them.
+        games (int): The number of games to play.
+        workers (Optional[int]): The number of worker processes, the number of CPUs if not given.
+            With a single worker the games are played in the calling process.
+        seed (int): The seed of the match; game i is played with seed + i.
+        max_moves (int): The number of plies after which a game is a draw.
+        time_budget (float): Wall clock seconds a move of level 3 or 4 may take.
+        playouts (int): The number of playouts of a level 4 move.
+
+    Returns:
+        Dict: The summary of the match, see summarize().
+    """
+    if not 2 <= len(levels) <= 6:
+        raise ValueError(f"A match needs between 2 and 6 entrants, got {len(levels)}")
+    for level in levels:
+        if level not in LEVELS:
+            raise ValueError(f"Unknown computer level {level}, expected one of {LEVELS}")
+    workers = workers or os.cpu_count() or 1
+    schedules = schedule(levels, games, seed)
+
+    start = time.perf_counter()
+    if workers == 1:
+        results = [play_game(seats, game_seed, max_moves, time_budget, playouts) for seats, game_seed in schedules]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(play_game, seats, game_seed, max_moves, time_budget, playouts)
+                       for seats, game_seed in schedules]
+            results = [future.result() for future in futures]
+    return summarize(levels, results, time.perf_counter() - start)
+
+
+def summarize(levels: Sequence[int], results: Sequence[GameResult], wall_seconds: float) -> Dict:
+    """
+    Summarize the games of a match.
+
+    Args:
+        levels (Sequence[int]): The level of every entrant.
+        results (Sequence[GameResult]): The outcome of every game, in the order of schedule().
+        wall_seconds (float): The wall clock duration of the whole match.
+
+    Returns:
+        Dict: The wins and win rate of every entrant, the number of draws, the game lengths in plies, and the
+        moves per second, both per worker (over the time spent in games) and overall (over the wall clock).
+    """
+    wins = [0] * len(levels)
+    draws = 0
+    for game, result in enumerate(results):
+        if result.winner is None:
+            draws += 1
+        else:
+            # Undo the rotation of the seats to find the entrant in the winning seat
+            wins[(result.winner + game) % len(levels)] += 1
+    lengths = [result.moves for result in results]
+    total_moves = sum(lengths)
+    game_seconds = sum(result.seconds for result in results)
+    return {
+        "games": len(results),
+        "entrants": [{"level": level, "wins": wins[entrant],
+                      "win_rate": wins[entrant] / len(results) if results else 0.0}
+                     for entrant, level in enumerate(levels)],
+        "draws": draws,
+        "game_length": {"mean": total_moves / len(results) if results else 0.0,
+                        "min": min(lengths, default=0), "max": max(lengths, default=0)},
+        "moves_per_second": total_moves / game_seconds if game_seconds else 0.0,
+        "overall_moves_per_second": total_moves / wall_seconds if wall_seconds else 0.0,
+        "wall_seconds": wall_seconds,
+    }
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """
+    Run a self-play match from the command line and print its summary.
+
+    Args:
+        argv (Optional[Sequence[str]]): The command line arguments, sys.argv if not given.
+    """
+    parser = argparse.ArgumentParser(description="Play computer levels against each other without a window.")
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 2], choices=LEVELS,
+                        help="the level of every entrant, two to six of them, in seating order")
+    parser.add_argument("--games", type=int, default=100, help="the number of games to play")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes, the number of CPUs by default")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the match; game i is played with seed + i")
+    parser.add_argument("--max-moves", type=int, default=DEFAULT_MAX_MOVES,
+                        help="plies after which a game is a draw")
+    parser.add_argument("--time-budget", type=float, default=DEFAULT_TIME_BUDGET,
+                        help="seconds a move of level 3 or 4 may take")
+    parser.add_argument("--playouts", type=int, default=DEFAULT_PLAYOUTS, help="playouts of a level 4 move")
+    parser.add_argument("--json", action="store_true", help="print the summary as JSON")
+    args = parser.parse_args(argv)
+
+    try:
+        summary = run_match(args.levels, args.games, args.workers, args.seed, args.max_moves, args.time_budget,
+                            args.playouts)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return
+    print(f"{summary['games']} games in {summary['wall_seconds']:.1f}s")
+    for entrant, result in enumerate(summary["entrants"]):
+        print(f"  entrant {entrant} (level {result['level']}): {result['wins']} wins, "
+              f"win rate {result['win_rate']:.1%}")
+    print(f"  draws: {summary['draws']}")
+    length = summary["game_length"]
+    print(f"  game length: mean {length['mean']:.1f}, min {length['min']}, max {length['max']} plies")
+    print(f"  moves/second: {summary['moves_per_second']:.1f} per worker, "
+          f"{summary['overall_moves_per_second']:.1f} overall")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+import unittest
+from selfPlay import play_game, run_match, schedule
+
+
+class TestSelfPlay(unittest.TestCase):
+    def test_games_are_reproducible(self):
+        self.assertEqual(play_game([1, 2], seed=4)[:4], play_game([1, 2], seed=4)[:4])
+
+    def test_game_has_a_winner(self):
+        result = play_game([2, 1], seed=1)
+        self.assertIn(result.winner, (0, 1))
+        self.assertGreater(result.moves, 0)
+
+    def test_seats_are_rotated(self):
+        self.assertEqual(schedule([1, 2, 3], 4, seed=10),
+                         [([1, 2, 3], 10), ([2, 3, 1], 11), ([3, 1, 2], 12), ([1, 2, 3], 13)])
+
+    def test_match_summary(self):
+        summary = run_match([1, 2], games=4, workers=1, seed=2)
+        self.assertEqual(summary["games"], 4)
+        self.assertEqual(sum(entrant["wins"] for entrant in summary["entrants"]) + summary["draws"], 4)
+        self.assertGreater(summary["moves_per_second"], 0)
+
+    def test_match_in_worker_processes(self):
+        self.assertEqual(run_match([2, 2], games=2, workers=2, seed=2)["games"], 2)
+
+    def test_needs_two_entrants(self):
+        with self.assertRaises(ValueError):
+            run_match([2], games=1)
+
+
+if __name__ == '__main__':
+    unittest.main()
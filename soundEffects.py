@@ -0,0 +1,219 @@
+"""
+Sound effects played on a worker thread.
+
+An effect is a sequence of tones, and a backend plays the tones of an effect until it ends: winsound.Beep on
+Windows, the beep program or the terminal bell on Linux, or nothing at all. Playing an effect blocks the backend,
+so the effects are played by a LatestOnlyWorker and the Tk event loop never waits for them: a burst of wrong
+clicks plays the current effect and then the last one, not every one of them.
+"""
+
+import shutil
+import subprocess
+import sys
+import time
+from typing import List, Optional, Sequence, Tuple
+
+from latestOnlyWorker import LatestOnlyWorker
+
+# A tone is a frequency in hertz and a duration in milliseconds
+Tone = Tuple[int, int]
+Effect = Tuple[Tone, ...]
+
+WIN_EFFECT: Effect = ((800, 200), (900, 200), (1000, 200), (800, 500), (600, 700))
+WRONG_EFFECT: Effect = ((150, 200), (200, 200), (300, 200), (200, 600))
+
+
+class NullBackend:
+    """
+    Plays nothing, for machines without any way to make a sound.
+    """
+
+    def play(self, effect: Sequence[Tone]) -> None:
+        """
+        Play an effect.
+
+        Args:
+            effect (Sequence[Tone]): The tones of the effect.
+        """
+
+
+class RecordingBackend:
+    """
+    Keeps the effects instead of playing them, e.g. in tests.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes a RecordingBackend object.
+        """
+        self.played: List[Effect] = []
+
+    def play(self, effect: Sequence[Tone]) -> None:
+        """
+        Record an effect.
+
+        Args:
+            effect (Sequence[Tone]): The tones of the effect.
+        """
+        self.played.append(tuple(effect))
+
+
+class WinsoundBackend:
+    """
+    Plays the tones through the PC speaker with winsound, on Windows.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes a WinsoundBackend object.
+
+        Raises:
+            ImportError: If winsound is not available, i.e. not on Windows.
+        """
+        import winsound
+        self.__winsound = winsound
+
+    def play(self, effect: Sequence[Tone]) -> None:
+        """
+        Play an effect, returning when it ends.
+
+        Args:
+            effect (Sequence[Tone]): The tones of the effect.
+        """
+        for frequency, duration in effect:
+            self.__winsound.Beep(frequency, duration)
+
+
+class BeepBackend:
+    """
+    Plays the tones through the PC speaker with the beep program, on Linux.
+    """
+
+    def __init__(self, program: str) -> None:
+        """
+        Initializes a BeepBackend object.
+
+        Args:
+            program (str): The path of the beep program.
+        """
+        self.program = program
+
+    def play(self, effect: Sequence[Tone]) -> None:
+        """
+        Play an effect with a single run of the program, returning when it ends.
+
+        Args:
+            effect (Sequence[Tone]): The tones of the effect.
+        """
+        args = [self.program]
+        for index, (frequency, duration) in enumerate(effect):
+            if index:
+                args.append("-n")
+            args += ["-f", str(frequency), "-l", str(duration)]
+        subprocess.run(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+
+
+class BellBackend:
+    """
+    Rings the terminal bell once per tone, for Linux machines without the beep program.
+    """
+
+    def play(self, effect: Sequence[Tone]) -> None:
+        """
+        Play an effect, returning when it ends.
+
+        Args:
+            effect (Sequence[Tone]): The tones of the effect.
+        """
+        for _, duration in effect:
+            sys.stdout.write("\a")
+            sys.stdout.flush()
+            time.sleep(duration / 1000)
+
+
+def create_default_backend():
+    """
+    Create the backend that fits this machine.
+
+    Returns:
+        The winsound backend on Windows, the beep backend if the beep program is installed, the terminal bell if
+        there is a terminal, or the null backend otherwise.
+    """
+    if sys.platform == "win32":
+        try:
+            return WinsoundBackend()
+        except ImportError:
+            return NullBackend()
+    program = shutil.which("beep")
+    if program is not None:
+        return BeepBackend(program)
+    if sys.stdout is not None and sys.stdout.isatty():
+        return BellBackend()
+    return NullBackend()
+
+
+class SoundEffects:
+    """
+    Plays effects on a background thread, keeping only the latest one that is waiting to be played.
+    """
+
+    def __init__(self, backend=None) -> None:
+        """
+        Initializes a SoundEffects object. The thread is only started when an effect is played.
+
+        Args:
+            backend: Anything with play(effect) that returns when the effect ends; if not given, the one
+                create_default_backend picks for this machine.
+        """
+        self.backend = backend if backend is not None else create_default_backend()
+        self.__worker = LatestOnlyWorker(self.backend.play, "SoundEffects")
+
+    @property
+    def played(self) -> int:
+        """
+        Get the number of effects played to the end.
+
+        Returns:
+            int: The number of played effects.
+        """
+        return self.__worker.handled
+
+    @property
+    def dropped(self) -> int:
+        """
+        Get the number of effects replaced by a newer one before they were played.
+
+        Returns:
+            int: The number of dropped effects.
+        """
+        return self.__worker.dropped
+
+    def play(self, effect: Sequence[Tone]) -> None:
+        """
+        Play an effect, replacing the effect still waiting to be played, if any. Returns immediately.
+
+        Args:
+            effect (Sequence[Tone]): The tones of the effect, e.g. WIN_EFFECT.
+        """
+        self.__worker.submit(tuple(effect))
+
+    def wait_until_idle(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every effect was played or dropped, e.g. in tests.
+
+        Args:
+            timeout (Optional[float]): The most seconds to wait, no limit if None.
+
+        Returns:
+            bool: True if nothing is being played or waiting, False if the timeout passed first.
+        """
+        return self.__worker.wait_until_idle(timeout)
+
+    def close(self, timeout: Optional[float] = 1.0) -> None:
+        """
+        Drop the waiting effect and stop the thread once the current one ends. Closing twice does nothing.
+
+        Args:
+            timeout (Optional[float]): The most seconds to wait for the current effect to end.
+        """
+        self.__worker.close(timeout)
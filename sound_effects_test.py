@@ -0,0 +1,33 @@
+import unittest
+from unittest import mock
+import soundEffects
+from soundEffects import (WIN_EFFECT, WRONG_EFFECT, BeepBackend, NullBackend, RecordingBackend, SoundEffects,
+                          create_default_backend)
+
+
+class TestSoundEffects(unittest.TestCase):
+    def test_effects_reach_the_backend(self):
+        backend = RecordingBackend()
+        sounds = SoundEffects(backend)
+        sounds.play(list(WRONG_EFFECT))
+        self.assertTrue(sounds.wait_until_idle(5))
+        sounds.play(WIN_EFFECT)
+        self.assertTrue(sounds.wait_until_idle(5))
+        sounds.close()
+        self.assertEqual(backend.played, [WRONG_EFFECT, WIN_EFFECT])
+        self.assertEqual(sounds.played, 2)
+
+    def test_beep_runs_one_command_per_effect(self):
+        with mock.patch.object(soundEffects.subprocess, "run") as run:
+            BeepBackend("/usr/bin/beep").play(((800, 200), (600, 700)))
+        self.assertEqual(run.call_args[0][0], ["/usr/bin/beep", "-f", "800", "-l", "200", "-n", "-f", "600", "-l", "700"])
+
+    def test_default_backend_without_speaker(self):
+        with mock.patch.object(soundEffects.sys, "platform", "linux"), \
+                mock.patch.object(soundEffects.shutil, "which", return_value=None), \
+                mock.patch.object(soundEffects.sys, "stdout", None):
+            self.assertIsInstance(create_default_backend(), NullBackend)
+
+
+if __name__ == '__main__':
+    unittest.main()
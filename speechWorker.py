@@ -0,0 +1,103 @@
+"""
+Text-to-speech announcements on a worker thread.
+
+pyttsx3 blocks until an utterance ends, so the announcements are spoken by a LatestOnlyWorker: the Tk event loop
+never waits for audio, and when players move faster than the speech a newer "It's X's turn" replaces the stale one.
+
+pyttsx3 is imported on the worker thread, the first time something is said. Without it the announcements are
+dropped and the game plays silently.
+"""
+
+from typing import Any, Callable, Optional
+
+from latestOnlyWorker import LatestOnlyWorker
+
+
+def create_default_engine() -> Optional[Any]:
+    """
+    Create a pyttsx3 engine.
+
+    Returns:
+        Optional[Any]: The engine, or None if pyttsx3 is not installed or has no speech driver.
+    """
+    try:
+        import pyttsx3
+        return pyttsx3.init()
+    except Exception as e:
+        print(f"Text-to-speech is not available, announcements are not spoken: {e}")
+        return None
+
+
+class SpeechWorker:
+    """
+    Speaks announcements on a background thread, keeping only the latest one that is waiting to be spoken.
+    """
+
+    def __init__(self, engine_factory: Callable[[], Optional[Any]] = create_default_engine) -> None:
+        """
+        Initializes a SpeechWorker object. The thread and the engine are only started when something is said.
+
+        Args:
+            engine_factory (Callable[[], Optional[Any]]): Creates the engine on the worker thread; anything with
+                say() and runAndWait(), or None to drop the announcements.
+        """
+        self.engine_factory = engine_factory
+        self.spoken = 0
+        self.__engine = None
+        self.__engine_created = False
+        self.__worker = LatestOnlyWorker(self.__speak, "SpeechWorker")
+
+    @property
+    def dropped(self) -> int:
+        """
+        Get the number of announcements replaced by a newer one before they were spoken.
+
+        Returns:
+            int: The number of dropped announcements.
+        """
+        return self.__worker.dropped
+
+    def say(self, message: str) -> None:
+        """
+        Announce a message, replacing the announcement still waiting to be spoken, if any. Returns immediately.
+
+        Args:
+            message (str): The text to speak.
+        """
+        self.__worker.submit(message)
+
+    def wait_until_idle(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every announcement was spoken or dropped, e.g. in tests.
+
+        Args:
+            timeout (Optional[float]): The most seconds to wait, no limit if None.
+
+        Returns:
+            bool: True if nothing is being spoken or waiting, False if the timeout passed first.
+        """
+        return self.__worker.wait_until_idle(timeout)
+
+    def close(self, timeout: Optional[float] = 1.0) -> None:
+        """
+        Drop the waiting announcement and stop the thread once the current one ends. Closing twice does nothing.
+
+        Args:
+            timeout (Optional[float]): The most seconds to wait for the current announcement to end.
+        """
+        self.__worker.close(timeout)
+
+    def __speak(self, message: str) -> None:
+        """
+        Speak a message on the worker thread, creating the engine the first time.
+
+        Args:
+            message (str): The text to speak.
+        """
+        if not self.__engine_created:
+            self.__engine = self.engine_factory()
+            self.__engine_created = True
+        if self.__engine is not None:
+            self.__engine.say(message)
+            self.__engine.runAndWait()
+            self.spoken += 1
@@ -0,0 +1,40 @@
+import unittest
+from speechWorker import SpeechWorker
+
+
+class FakeEngine:
+    def __init__(self):
+        self.said = []
+        self.spoken = []
+
+    def say(self, message):
+        self.said.append(message)
+
+    def runAndWait(self):
+        self.spoken.extend(self.said)
+        self.said = []
+
+
+class TestSpeechWorker(unittest.TestCase):
+    def test_announcements_are_spoken_by_one_engine(self):
+        engines = []
+        worker = SpeechWorker(lambda: engines.append(FakeEngine()) or engines[-1])
+        worker.say("It's a turn")
+        self.assertTrue(worker.wait_until_idle(5))
+        worker.say("It's b turn")
+        self.assertTrue(worker.wait_until_idle(5))
+        worker.close()
+        self.assertEqual(len(engines), 1)
+        self.assertEqual(engines[0].spoken, ["It's a turn", "It's b turn"])
+        self.assertEqual(worker.spoken, 2)
+
+    def test_without_engine_announcements_are_dropped(self):
+        worker = SpeechWorker(lambda: None)
+        worker.say("It's a turn")
+        self.assertTrue(worker.wait_until_idle(5))
+        self.assertEqual(worker.spoken, 0)
+        worker.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+from typing import NamedTuple, Optional, Tuple
+
+# Kinds of scores stored in the table
+EXACT = 0
+LOWER_BOUND = 1
+UPPER_BOUND = 2
+
+Move = Tuple[int, int]
+
+
+class TableEntry(NamedTuple):
+    """
+    A position stored in the transposition table.
+    """
+    depth: int
+    score: float
+    flag: int
+    best_move: Optional[Move]
+
+
+class TranspositionTable:
+    """
+    Fixed size table of evaluated positions, indexed by the low bits of their Zobrist key.
+
+    When two positions share a slot, the entry searched deeper is kept, unless it was stored during an older search.
+    """
+
+    def __init__(self, size_bits: int = 16) -> None:
+        """
+        Initializes a TranspositionTable object.
+
+        Args:
+            size_bits (int): The table holds 2 ** size_bits entries.
+        """
+        size = 1 << size_bits
+        self.__mask = size - 1
+        self.__keys = [None] * size
+        self.__entries = [None] * size
+        self.__ages = [0] * size
+        self.__age = 0
+
+    def new_search(self) -> None:
+        """
+        Start a new search, so that the entries of the previous searches become replaceable.
+        """
+        self.__age += 1
+
+    def clear(self) -> None:
+        """
+        Remove all the entries from the table.
+        """
+        size = len(self.__keys)
+        self.__keys = [None] * size
+        self.__entries = [None] * size
+        self.__ages = [0] * size
+        self.__age = 0
+
+    def probe(self, key: int) -> Optional[TableEntry]:
+        """
+        Look up a position in the table.
+
+        Args:
+            key (int): The Zobrist key of the position.
+
+        Returns:
+            Optional[TableEntry]: The stored entry, or None if the position is not in the table.
+        """
+        slot = key & self.__mask
+        if self.__keys[slot] == key:
+            return self.__entries[slot]
+        return None
+
+    def store(self, key: int, depth: int, score: float, flag: int, best_move: Optional[Move]) -> None:
+        """
+        Store an evaluated position in the table.
+
+        Args:
+            key (int): The Zobrist key of the position.
+            depth (int): The depth the position was searched to.
+            score (float): The score of the position.
+            flag (int): EXACT, LOWER_BOUND or UPPER_BOUND.
+            best_move (Optional[Move]): The best move found in the position, if any.
+        """
+        slot = key & self.__mask
+        stored = self.__entries[slot]
+        if stored is not None and self.__keys[slot] != key and self.__ages[slot] == self.__age \
+                and stored.depth > depth:
+            return
+        self.__keys[slot] = key
+        self.__entries[slot] = TableEntry(depth, score, flag, best_move)
+        self.__ages[slot] = self.__age
+
+    def __len__(self) -> int:
+        """
+        Get the number of positions stored in the table.
+
+        Returns:
+            int: The number of occupied slots.
+        """
+        return sum(1 for key in self.__keys if key is not None)
@@ -0,0 +1,72 @@
+import random
+from functools import lru_cache
+from typing import List
+
+# Fixed seed, so that the same position always gets the same key across runs and processes
+ZOBRIST_SEED = 20240331
+
+
+class ZobristKeys:
+    """
+    Random 64 bit keys for every (cell, owner) pair of a board layout and for every player to move.
+
+    The key of a position is the XOR of the keys of its occupied cells, so moving a piece only takes two XORs.
+    """
+
+    def __init__(self, num_cells: int, num_of_players: int) -> None:
+        """
+        Initializes a ZobristKeys object.
+
+        Args:
+            num_cells (int): The number of cells of the board layout.
+            num_of_players (int): The number of players in the game.
+        """
+        rng = random.Random(ZOBRIST_SEED)
+        # Owner 0 is an empty cell and never contributes to the key
+        self.cell_keys: List[List[int]] = [[0] + [rng.getrandbits(64) for _ in range(num_of_players)]
+                                           for _ in range(num_cells)]
+        self.turn_keys: List[int] = [rng.getrandbits(64) for _ in range(num_of_players)]
+
+    def position_key(self, owners: bytearray) -> int:
+        """
+        Calculate the key of a position from scratch.
+
+        Args:
+            owners (bytearray): The owner of every cell, see BoardState.owners.
+
+        Returns:
+            int: The 64 bit key of the position.
+        """
+        key = 0
+        for cell, owner in enumerate(owners):
+            key ^= self.cell_keys[cell][owner]
+        return key
+
+    def move_delta(self, source: int, destination: int, owner: int) -> int:
+        """
+        Get the value to XOR into a key when a piece moves.
+
+        Args:
+            source (int): The id of the cell the piece moves from.
+            destination (int): The id of the cell the piece moves to.
+            owner (int): The owner of the moving piece.
+
+        Returns:
+            int: The change of the key.
+        """
+        return self.cell_keys[source][owner] ^ self.cell_keys[destination][owner]
+
+
+@lru_cache(maxsize=None)
+def get_zobrist_keys(num_cells: int, num_of_players: int) -> ZobristKeys:
+    """
+    Get the Zobrist keys of a board layout, generating them only once per layout.
+
+    Args:
+        num_cells (int): The number of cells of the board layout.
+        num_of_players (int): The number of players in the game.
+
+    Returns:
+        ZobristKeys: The keys of the layout.
+    """
+    return ZobristKeys(num_cells, num_of_players)
@@ -0,0 +1,58 @@
+import unittest
+from boardState import BoardState
+from transpositionTable import TranspositionTable, EXACT, LOWER_BOUND
+
+
+class TestZobrist(unittest.TestCase):
+    def setUp(self):
+        self.state = BoardState(2)
+
+    def test_key_is_updated_incrementally(self):
+        self.state.move((3, 13), (4, 14))
+        self.state.move((13, 9), (12, 8))
+        self.assertEqual(self.state.key, self.state.get_zobrist_keys().position_key(self.state.owners))
+
+    def test_transposed_moves_give_the_same_key(self):
+        other = self.state.copy()
+        self.state.move((3, 13), (4, 14))
+        self.state.move((3, 11), (4, 12))
+        other.move((3, 11), (4, 12))
+        other.move((3, 13), (4, 14))
+        self.assertEqual(self.state.key, other.key)
+
+    def test_move_and_back_restores_the_key(self):
+        key = self.state.key
+        self.state.move((3, 13), (4, 14))
+        self.assertNotEqual(self.state.key, key)
+        self.state.move((4, 14), (3, 13))
+        self.assertEqual(self.state.key, key)
+
+
+class TestTranspositionTable(unittest.TestCase):
+    def setUp(self):
+        self.table = TranspositionTable(size_bits=4)
+
+    def test_store_and_probe(self):
+        self.table.store(12345, 3, 1.5, EXACT, (1, 2))
+        entry = self.table.probe(12345)
+        self.assertEqual(entry.depth, 3)
+        self.assertEqual(entry.best_move, (1, 2))
+        self.assertIsNone(self.table.probe(12345 + 16))
+
+    def test_deeper_entry_is_kept_within_a_search(self):
+        self.table.store(1, 5, 1.0, EXACT, None)
+        self.table.store(17, 2, 2.0, LOWER_BOUND, None)
+        self.assertIsNotNone(self.table.probe(1))
+        self.assertIsNone(self.table.probe(17))
+
+    def test_old_entries_are_replaced(self):
+        self.table.store(1, 5, 1.0, EXACT, None)
+        self.table.new_search()
+        self.table.store(17, 2, 2.0, LOWER_BOUND, None)
+        self.assertIsNone(self.table.probe(1))
+        self.assertEqual(self.table.probe(17).score, 2.0)
+        self.assertEqual(len(self.table), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()